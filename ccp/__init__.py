@@ -189,6 +189,7 @@ from .state import State
 from .point import Point
 from .curve import Curve
 from .impeller import Impeller, impeller_example
+from .surface import ImpellerSurface
 from .fo import FlowOrifice
 from .similarity import check_similarity
 from .evaluation import Evaluation
@@ -199,6 +200,7 @@ __all__ = [
     "Point",
     "Curve",
     "Impeller",
+    "ImpellerSurface",
     "FlowOrifice",
     "fluid_list",
     "check_similarity",
@@ -0,0 +1,86 @@
+"""Bounded caches used to avoid repeating expensive calculations."""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Least recently used cache with hit, miss and eviction counters.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of entries. When a new entry exceeds this size the
+        least recently used entries are evicted. Default is 128.
+
+    Examples
+    --------
+    >>> from ccp.cache import LRUCache
+    >>> cache = LRUCache(maxsize=1)
+    >>> cache.put("a", 1)
+    >>> cache.get("a")
+    1
+    >>> cache.put("b", 2)
+    >>> cache.get("a") is None
+    True
+    >>> cache.info()
+    {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 1, 'maxsize': 1}
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Return the value for key, marking it as recently used."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries if needed."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        """Remove key from the cache and return its value."""
+        return self._data.pop(key, default)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self):
+        """Cache statistics.
+
+        Returns
+        -------
+        info : dict
+            Dictionary with hits, misses, evictions, current size and maxsize.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
@@ -932,19 +932,21 @@ class BackToBack(Impeller):
         # calculate rotor specified conditions for sec1
         self.points_rotor_sp_sec1 = []
         ms1f_sp_array = np.zeros(len(self.points_rotor_t_sec1), dtype=object)
-        for i, point, k_end_seal, k_div_wall in zip(
+        # all points are first converted to the guarantee suction state
+        initial_points = Point.convert_many(
+            self.points_rotor_t_sec1,
+            suc=guarantee_point_sec1.suc,
+            speed=self.speed_operational,
+            find="volume_ratio",
+            reynolds_correction=self.reynolds_correction,
+        )
+        for i, point, initial_point, k_end_seal, k_div_wall in zip(
             range(len(ms1f_sp_array)),
             self.points_rotor_t_sec1,
+            initial_points,
             self.k_end_seal,
             self.k_div_wall,
         ):
-            initial_point = Point.convert_from(
-                original_point=point,
-                suc=guarantee_point_sec1.suc,
-                speed=self.speed_operational,
-                find="volume_ratio",
-                reynolds_correction=self.reynolds_correction,
-            )
             # determine rotor specified suction state
             end_seal_state_upstream_sp = State(
                 p=initial_point.disch.p(),
@@ -1029,14 +1031,14 @@ class BackToBack(Impeller):
             T=guarantee_point_sec2.suc.T(),
             fluid=guarantee_point_sec2.suc.fluid,
         )
-        for point_r_t in self.points_rotor_t_sec2:
-            point_r_sp = Point.convert_from(
-                original_point=point_r_t,
-                suc=suc2f_sp,
-                speed=self.speed_operational,
-                find="volume_ratio",
-                reynolds_correction=self.reynolds_correction,
-            )
+        points_r_sp = Point.convert_many(
+            self.points_rotor_t_sec2,
+            suc=suc2f_sp,
+            speed=self.speed_operational,
+            find="volume_ratio",
+            reynolds_correction=self.reynolds_correction,
+        )
+        for point_r_sp in points_r_sp:
             self.points_rotor_sp_sec2.append(point_r_sp)
             mend_sp = flow_m_seal(
                 k_seal=k_end_seal,
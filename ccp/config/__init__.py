@@ -5,3 +5,39 @@ EOS = "REFPROP"
 # The CCP_PARALLEL and CCP_POOL_SIZE environment variables take precedence.
 PARALLEL = True  # set to False to run every ccp calculation serially
 POOL_SIZE = None  # worker processes per pool; None means one per CPU
+
+# Flash cache (see ccp/state.py). When enabled, State.update looks up the
+# inputs (rounded to FLASH_CACHE_RTOL) before calling CoolProp/REFPROP and
+# restores cached states with a direct (rho, T) update.
+FLASH_CACHE = False
+FLASH_CACHE_SIZE = 10000  # maximum number of cached states per process
+FLASH_CACHE_RTOL = 1e-10  # relative tolerance used to round the inputs
+
+# Phase hints (see ccp/state.py). PT flashes of mixtures at least
+# PHASE_HINT_MARGIN (K) above the dew temperature of the phase envelope are
+# done with an imposed gas phase. Envelopes are built once per composition (which
+# is costly, so hints are off by default) and also stored in PHASE_ENVELOPE_DIR
+# when it is set to a directory path.
+PHASE_HINTS = False
+PHASE_HINT_MARGIN = 10.0
+PHASE_ENVELOPE_DIR = None
+
+# Curve cache (see ccp/impeller.py). Each impeller keeps the last
+# CURVE_CACHE_SIZE curves calculated by Impeller.curve, keyed by the speed
+# rounded to CURVE_CACHE_RTOL.
+CURVE_CACHE_SIZE = 32
+CURVE_CACHE_RTOL = 1e-9
+
+# Conversion cache (see ccp/impeller.py). When CONVERSION_CACHE_SIZE > 0,
+# Impeller.convert_from keeps the last CONVERSION_CACHE_SIZE converted
+# impellers, keyed by a fingerprint of the original maps and the new suction
+# (rounded to CONVERSION_CACHE_RTOL), and returns the cached (shared) impeller
+# for repeated conversions. They are also stored in CONVERSION_CACHE_DIR when
+# it is set to a directory path.
+CONVERSION_CACHE_SIZE = 0  # disabled by default
+CONVERSION_CACHE_RTOL = 1e-9
+CONVERSION_CACHE_DIR = None
+
+# Batch APIs (e.g. State.flash_batch) return plain numpy arrays in SI units
+# instead of pint quantities when RAW_SI is True.
+RAW_SI = False
@@ -2,7 +2,7 @@
 
 import inspect
 import warnings
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 
 import pint
@@ -133,6 +133,61 @@ for i, unit in zip(["k", "c"], ["N/m", "N*s/m"]):
             units["".join([i, j, k])] = unit
 
 
+@lru_cache(maxsize=None)
+def _target_unit(arg_name):
+    """Return the default unit for an argument name, or None if not converted.
+
+    The full argument name is checked first, then 'flow_v'/'flow_m' and then
+    each of the names obtained by splitting the argument name on '_'.
+    Arguments with 'units' in their name are never converted.
+    """
+    names = arg_name.split("_")
+    if "units" in names:
+        return None
+
+    # treat flow_v and flow_m separately
+    if "flow_v" in arg_name:
+        names.insert(0, "flow_v")
+    if "flow_m" in arg_name:
+        names.insert(0, "flow_m")
+
+    if arg_name not in names:
+        # check first for arg_name in units
+        names.insert(0, arg_name)
+    for name in names:
+        if name in units:
+            return ureg.Unit(units[name])
+    return None
+
+
+def _convert(value, unit):
+    """Convert value to unit, returning it untouched if already in that unit."""
+    if value is None:
+        return value
+    try:
+        value_units = value.units
+    except AttributeError:
+        if (
+            isinstance(value, (list, tuple))
+            and value
+            and all(hasattr(v, "units") for v in value)
+        ):
+            # sequence of quantities, converted with a single array operation
+            return Q_.from_sequence(value).to(unit)
+        try:
+            return Q_(value, unit)
+        except TypeError:
+            # Handle errors that we get with bool for example
+            return value
+    # For now, we only return the magnitude for the converted Quantity
+    # If pint is fully adopted by ross in the future, and we have all Quantities
+    # using it, we could remove this, which would allows us to use pint in its full
+    # capability
+    if value_units == unit:
+        return value
+    return value.to(unit)
+
+
 def check_units(func):
     """Wrapper to check and convert units to base_units.
     If we use the check_units decorator in a function the arguments are checked,
@@ -143,6 +198,10 @@ def check_units(func):
     will be split into ['inlet', 'pressure'], and since we have the name 'pressure'
     in the dictionary mapped to 'Pa', we will automatically convert the value to
     this default unit.
+    The target unit of each positional argument is computed once, when the function
+    is decorated, and quantities already in the target unit are passed through
+    without conversion. Lists of quantities are converted to a single array
+    quantity.
     For example, 'L' is mapped to 'meter' in the units dictionary:
 
     >>> @check_units
@@ -161,73 +220,19 @@ def check_units(func):
     >>> foo(L=Q_(0.5, 'inches'))
     0.0127 meter
     """
+    args_units = [_target_unit(name) for name in inspect.getfullargspec(func)[0]]
 
     @wraps(func)
     def inner(*args, **kwargs):
-        base_unit_args = []
-        args_names = inspect.getfullargspec(func)[0]
-
-        for arg_name, arg_value in zip(args_names, args):
-            names = arg_name.split("_")
-            if "units" in names:
-                base_unit_args.append(arg_value)
-                continue
-
-            # treat flow_v and flow_m separately
-            if "flow_v" in arg_name:
-                names.insert(0, "flow_v")
-            if "flow_m" in arg_name:
-                names.insert(0, "flow_m")
-
-            if arg_name not in names:
-                # check first for arg_name in units
-                names.insert(0, arg_name)
-            for name in names:
-                if name in units and arg_value is not None:
-                    # For now, we only return the magnitude for the converted Quantity
-                    # If pint is fully adopted by ross in the future, and we have all Quantities
-                    # using it, we could remove this, which would allows us to use pint in its full capability
-                    try:
-                        base_unit_args.append(arg_value.to(units[name]))
-                    except AttributeError:
-                        try:
-                            base_unit_args.append(Q_(arg_value, units[name]))
-                        except TypeError:
-                            # Handle erros that we get with bool for example
-                            base_unit_args.append(arg_value)
-                    break
-            else:
-                base_unit_args.append(arg_value)
+        base_unit_args = [
+            value if unit is None else _convert(value, unit)
+            for unit, value in zip(args_units, args)
+        ]
 
         base_unit_kwargs = {}
         for k, v in kwargs.items():
-            names = k.split("_")
-            if "units" in names:
-                base_unit_kwargs[k] = v
-                continue
-
-            # treat flow_v and flow_m separately
-            if "flow_v" in k:
-                names.insert(0, "flow_v")
-            if "flow_m" in k:
-                names.insert(0, "flow_m")
-
-            if k not in names:
-                # check first for arg_name in units
-                names.insert(0, k)
-            for name in names:
-                if name in units and v is not None:
-                    try:
-                        base_unit_kwargs[k] = v.to(units[name])
-                    except AttributeError:
-                        try:
-                            base_unit_kwargs[k] = Q_(v, units[name])
-                        except TypeError:
-                            # Handle errors that we get with bool for example
-                            base_unit_kwargs[k] = v
-                    break
-            else:
-                base_unit_kwargs[k] = v
+            unit = _target_unit(k)
+            base_unit_kwargs[k] = v if unit is None else _convert(v, unit)
 
         return func(*base_unit_args, **base_unit_kwargs)
 
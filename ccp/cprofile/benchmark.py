@@ -0,0 +1,130 @@
+"""Micro-benchmarks for the overhead of ccp internals.
+
+To use it:
+$ python benchmark.py <benchmark name>
+
+Each benchmark prints the mean time per call in microseconds.
+
+"""
+
+import pickle
+import sys
+import time
+import timeit
+import tracemalloc
+
+from ccp import Q_, Impeller, Point, State
+from ccp.config.units import check_units
+
+
+def report(label, func, number=20000, repeat=5):
+    """Print the best mean time per call (us) of func."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{label:<40}{best * 1e6:10.2f} us")
+    return best
+
+
+def check_units_overhead():
+    """Overhead added by check_units for floats, quantities and arrays."""
+
+    def raw(p, T, flow_v, speed, head, eff):
+        return p
+
+    decorated = check_units(raw)
+
+    floats = dict(p=1e5, T=300.0, flow_v=1.0, speed=1000.0, head=1e5, eff=0.8)
+    si = {
+        k: Q_(v, unit)
+        for (k, v), unit in zip(
+            floats.items(),
+            [
+                "pascal",
+                "degK",
+                "m**3/s",
+                "rad/s",
+                "J/kg",
+                "dimensionless",
+            ],
+        )
+    }
+    other = dict(
+        p=Q_(1, "bar"),
+        T=Q_(27, "degC"),
+        flow_v=Q_(3600, "m**3/h"),
+        speed=Q_(9549, "RPM"),
+        head=Q_(100, "kJ/kg"),
+        eff=Q_(80, "percent"),
+    )
+    arrays = {k: Q_([v.m] * 1000, v.u) for k, v in other.items()}
+
+    base = report("undecorated", lambda: raw(**floats))
+    for label, kwargs in [
+        ("floats", floats),
+        ("quantities in default units", si),
+        ("quantities in other units", other),
+        ("arrays (1000) in other units", arrays),
+    ]:
+        number = 2000 if label.startswith("arrays") else 20000
+        t = report(f"check_units, {label}", lambda: decorated(**kwargs), number)
+        print(f"{'':<40}{(t - base) * 1e6:10.2f} us overhead")
+
+
+def point_memory(number=200):
+    """Construction time, memory and unpickling time per ccp.Point."""
+    fluid = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    disch = State(p=Q_(5.902, "bar"), T=405.7, fluid=fluid)
+
+    def create():
+        return [
+            Point(suc=suc, disch=disch, flow_v=1 + i * 1e-3, speed=1, b=1, D=1)
+            for i in range(number)
+        ]
+
+    create()  # warm up caches
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    points = create()
+    elapsed = time.perf_counter() - t0
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'construction':<40}{elapsed / number * 1e3:10.2f} ms")
+    print(f"{'memory (python objects)':<40}{memory / number / 1024:10.2f} kB")
+
+    data = pickle.dumps(points)
+    t0 = time.perf_counter()
+    pickle.loads(data)
+    elapsed = time.perf_counter() - t0
+    print(f"{'unpickle':<40}{elapsed / number * 1e3:10.2f} ms")
+    print(f"{'pickle size':<40}{len(data) / number / 1024:10.2f} kB")
+
+
+def impeller_construction(number=100):
+    """Construction time and peak memory of a ccp.Impeller."""
+    fluid = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    points = [
+        Point(
+            suc=suc,
+            disch=State(p=Q_(5.902 + i * 0.01, "bar"), T=405.7, fluid=fluid),
+            flow_v=1 + i * 1e-2,
+            speed=800 + 100 * (i % 4),
+            b=1,
+            D=1,
+        )
+        for i in range(number)
+    ]
+
+    Impeller(points)  # warm up caches
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    Impeller(points)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'construction':<40}{elapsed * 1e3:10.2f} ms")
+    print(f"{'peak memory (python objects)':<40}{peak / 1024:10.2f} kB")
+
+
+if __name__ == "__main__":
+    globals()[sys.argv[1]]()
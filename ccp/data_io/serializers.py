@@ -7,6 +7,7 @@ The file format is determined by the file suffix (e.g. ``.toml`` or
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import toml
@@ -29,6 +30,45 @@ def _dispatch(file_name):
         ) from None
 
 
+@lru_cache(maxsize=None)
+def _library_versions():
+    """Versions of ccp, CoolProp and REFPROP."""
+    import CoolProp
+
+    import ccp
+
+    refprop_version = "not available"
+    if ccp.REFPROP_AVAILABLE:
+        try:
+            refprop_version = CoolProp.CoolProp.get_global_param_string(
+                "REFPROP_version"
+            )
+        except ValueError:
+            pass
+    return {
+        "ccp": ccp.__version__,
+        "CoolProp": CoolProp.__version__,
+        "REFPROP": refprop_version,
+    }
+
+
+def versions():
+    """Versions of the libraries used to calculate the values of ccp objects.
+
+    Derived values stored with ``to_dict(full=True)`` are only reused when
+    loading if these versions (and the equation of state in use) match.
+
+    Returns
+    -------
+    versions : dict
+        Dict with the ccp, CoolProp and REFPROP versions and the EOS
+        (ccp.config.EOS).
+    """
+    import ccp
+
+    return {**_library_versions(), "EOS": ccp.config.EOS}
+
+
 def save_dict(data, file_name):
     """Save a dict to a file, with format given by the file suffix.
 
@@ -77,6 +117,9 @@ class Serializable:
     ``save``/``load`` then work for every supported file format.
     """
 
+    # no instance storage, so that subclasses can use __slots__
+    __slots__ = ()
+
     def to_dict(self):
         raise NotImplementedError
 
@@ -84,7 +127,7 @@ class Serializable:
     def from_dict(cls, dict_parameters):
         raise NotImplementedError
 
-    def save(self, file_name):
+    def save(self, file_name, **kwargs):
         """Save object to a file.
 
         The file format is defined by the file_name suffix
@@ -97,13 +140,16 @@ class Serializable:
         ----------
         file_name : str or pathlib.Path
             File name ending in one of the supported suffixes (.toml, .json).
+        **kwargs
+            Keyword arguments passed to ``to_dict`` (e.g. ``full=True`` for
+            ``ccp.Point`` and ``ccp.Impeller``).
         """
         import ccp
 
-        save_dict({"ccp_version": ccp.__version__, **self.to_dict()}, file_name)
+        save_dict({"ccp_version": ccp.__version__, **self.to_dict(**kwargs)}, file_name)
 
     @classmethod
-    def load(cls, file_name):
+    def load(cls, file_name, **kwargs):
         """Load object from a file.
 
         The file format is defined by the file_name suffix
@@ -113,10 +159,13 @@ class Serializable:
         ----------
         file_name : str or pathlib.Path
             File name ending in one of the supported suffixes (.toml, .json).
+        **kwargs
+            Keyword arguments passed to ``from_dict`` (e.g. ``lazy=True`` for
+            ``ccp.Impeller``).
 
         Returns
         -------
         object
             Instance of the class loaded from the file.
         """
-        return cls.from_dict(load_dict(file_name))
+        return cls.from_dict(load_dict(file_name), **kwargs)
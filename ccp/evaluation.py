@@ -2,6 +2,7 @@
 
 import zipfile
 import toml
+import numpy as np
 import pandas as pd
 import pickle
 from .data_io import filter_data
@@ -299,6 +300,21 @@ class Evaluation:
                     / point_expected.disch.p("bar")
                 ).m * 100
 
+        # operating envelope, evaluated for all points of a cluster at once
+        df["surge_margin"] = np.nan
+        df["envelope"] = None
+        computed = df["expected_head"] != -1.0
+        for cluster, df_cluster in df[computed].groupby("cluster"):
+            imp_new = self.impellers_new[int(cluster)]
+            speed = Q_(df_cluster["speed"].to_numpy(), self.data_units["speed"])
+            flow_v = df_cluster["flow_v"].to_numpy()
+            df.loc[df_cluster.index, "surge_margin"] = imp_new.surge_margin(
+                flow_v=flow_v, speed=speed
+            ).m
+            df.loc[df_cluster.index, "envelope"] = imp_new.classify(
+                flow_v=flow_v, speed=speed
+            )
+
         if len(df) > 1 and hasattr(df.index, "dtype"):
             # Use elapsed fraction in [0, 1] for coloring over time.
             total_time = df.index[-1] - df.index[0]
@@ -541,18 +557,20 @@ class Evaluation:
         df["v_s"] = 0.0
         df["speed_sound"] = 0.0
 
-        for i, row in df.iterrows():
-            # rows marked invalid can carry NaN inputs that CoolProp rejects
-            if "valid" in df.columns and not row.valid:
-                continue
+        if not calculate_flow:
+            self._calculate_suction_properties(df)
+        else:
+            for i, row in df.iterrows():
+                # rows marked invalid can carry NaN inputs that CoolProp rejects
+                if "valid" in df.columns and not row.valid:
+                    continue
 
-            if self.operation_fluid is not None:
-                fluid = self.operation_fluid
-            else:
-                fluid = self._get_fluid_composition(row)
+                if self.operation_fluid is not None:
+                    fluid = self.operation_fluid
+                else:
+                    fluid = self._get_fluid_composition(row)
 
-            try:
-                if calculate_flow:
+                try:
                     if "p_downstream" in df.columns:
                         state_upstream = False
                         state = State(
@@ -583,22 +601,16 @@ class Evaluation:
                     )
                     df.loc[i, "flow_m"] = fo.qm.m
                     df.loc[i, "flow_v"] = (fo.qm * state.v()).m
-                else:
-                    state = State(
-                        p=Q_(row.ps, self.data_units["ps"]),
-                        T=Q_(row.Ts, self.data_units["Ts"]),
-                        fluid=fluid,
-                    )
-            except ValueError:
-                # NaN or out-of-range inputs (e.g. sensor dropouts): mark the row
-                # invalid when invalid rows are being kept, otherwise fail loudly
-                if "valid" in df.columns:
-                    df.loc[i, "valid"] = False
-                    continue
-                raise
+                except ValueError:
+                    # NaN or out-of-range inputs (e.g. sensor dropouts): mark the row
+                    # invalid when invalid rows are being kept, otherwise fail loudly
+                    if "valid" in df.columns:
+                        df.loc[i, "valid"] = False
+                        continue
+                    raise
 
-            df.loc[i, "v_s"] = state.v().m
-            df.loc[i, "speed_sound"] = state.speed_sound().m
+                df.loc[i, "v_s"] = state.v().m
+                df.loc[i, "speed_sound"] = state.speed_sound().m
 
         # check if flow_v or flow_m is in the DataFrame
         if (not calculate_flow) and (
@@ -621,6 +633,63 @@ class Evaluation:
 
         return df
 
+    def _calculate_suction_properties(self, df):
+        """Fill v_s and speed_sound with one batch flash per fluid composition."""
+        size = len(df)
+        if "valid" in df.columns:
+            valid = df["valid"].to_numpy(dtype=bool)
+        else:
+            valid = np.ones(size, dtype=bool)
+        if self.operation_fluid is not None:
+            groups = np.zeros(size, dtype=int)
+        else:
+            groups = (
+                df[self.fluid_columns]
+                .groupby(self.fluid_columns, sort=False, dropna=False)
+                .ngroup()
+                .to_numpy()
+            )
+
+        ps = df["ps"].to_numpy(dtype=float)
+        Ts = df["Ts"].to_numpy(dtype=float)
+        v_s = np.zeros(size)
+        speed_sound = np.zeros(size)
+        failed = np.zeros(size, dtype=bool)
+        for group in np.unique(groups[valid]):
+            rows = np.flatnonzero(valid & (groups == group))
+            if self.operation_fluid is not None:
+                fluid = self.operation_fluid
+            else:
+                fluid = self._get_fluid_composition(df.iloc[rows[0]])
+            try:
+                results = State.flash_batch(
+                    p=Q_(ps[rows], self.data_units["ps"]),
+                    T=Q_(Ts[rows], self.data_units["Ts"]),
+                    fluid=fluid,
+                    properties=["rho", "speed_sound"],
+                )
+            except ValueError:
+                failed[rows] = True
+                continue
+            v_s[rows] = 1 / results["rho"].m
+            speed_sound[rows] = results["speed_sound"].m
+            failed[rows] = np.isnan(results["T"].m)
+
+        if failed.any():
+            # NaN or out-of-range inputs (e.g. sensor dropouts): mark the rows
+            # invalid when invalid rows are being kept, otherwise fail loudly
+            if "valid" not in df.columns:
+                raise ValueError(
+                    "Could not define suction state for rows "
+                    f"{list(df.index[failed])}."
+                )
+            df.loc[df.index[failed], "valid"] = False
+            v_s[failed] = 0.0
+            speed_sound[failed] = 0.0
+
+        df["v_s"] = v_s
+        df["speed_sound"] = speed_sound
+
     def calculate_points(self, data=None, drop_invalid_values=True, parallel=None):
         """Calculate the performance points for the given data.
 
@@ -645,7 +714,10 @@ class Evaluation:
         Returns
         -------
         df : pandas.DataFrame
-            DataFrame with the calculated points.
+            DataFrame with the calculated points. The surge_margin and
+            envelope columns have the surge margin and the classification of
+            each point in the map (see Impeller.surge_margin and
+            Impeller.classify).
         """
         if parallel is None:
             parallel = self.parallel
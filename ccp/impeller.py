@@ -1,23 +1,30 @@
 """Module to define impeller class."""
 
 import csv
+import hashlib
 import warnings
 
-from copy import deepcopy
+from copy import copy
 from itertools import groupby
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from openpyxl import Workbook
 from scipy.interpolate import interp1d, UnivariateSpline, PchipInterpolator
-from scipy.optimize import fsolve
+from tqdm.auto import tqdm
 
+import ccp.config
 from ccp import Q_, State, Point, Curve
+from ccp.cache import LRUCache
+from ccp.point import disch_from_suc_head_eff
+from ccp.surface import ImpellerSurface
 from ccp.config.units import check_units
 from ccp.config.utilities import r_getattr, r_setattr
 from ccp.data_io.read_csv import read_data_from_engauge_csv
-from ccp.data_io.serializers import Serializable
+from ccp.data_io.serializers import Serializable, versions
 from ccp.parallel import create_pool
 from ccp.plotly_theme import tableau_colors
 from ccp.surrogate import convert_from_gp_surrogate
@@ -344,11 +351,36 @@ class Impeller(Serializable):
     Returns
     -------
     impeller : ccp.Impeller
+
+    Notes
+    -----
+    Curves calculated by ``Impeller.curve`` are kept in ``Impeller.curve_cache``,
+    an LRU cache with the last ``ccp.config.CURVE_CACHE_SIZE`` curves keyed by
+    the speed rounded to ``ccp.config.CURVE_CACHE_RTOL``. Repeated queries at
+    the same speed return the same ``ccp.Curve`` object. Use
+    ``Impeller.curve_cache.info()`` for the hit/miss/eviction counters and
+    ``Impeller.clear_cache()`` after changing the points or curves of an
+    impeller.
+
+    The points are not copied: the impeller holds the same ``ccp.Point``
+    objects (and states) that were passed to it, and these should be treated
+    as immutable. Points that the impeller has to change (e.g. to add
+    mechanical losses) are replaced by new points with copied states. To
+    modify the original points after creating the impeller, pass
+    ``copy.deepcopy(points)`` instead.
+
+    Impellers created by ``Impeller.convert_from`` are kept in
+    ``Impeller.conversion_cache`` (see :meth:`convert_from`).
     """
 
+    conversion_cache = LRUCache(maxsize=ccp.config.CONVERSION_CACHE_SIZE)
+
     @check_units
     def __init__(self, points):
-        points_init = deepcopy(points)
+        self.curve_cache = LRUCache(maxsize=ccp.config.CURVE_CACHE_SIZE)
+        self._surface = None
+        # points are shared with the caller (see Notes)
+        points_init = list(points)
 
         losses_dict = {p.power_losses: p.speed for p in points_init}
         max_losses = max(losses_dict.keys())
@@ -365,9 +397,10 @@ class Impeller(Serializable):
                 for p in grouped_points:
                     if p.power_losses.m == 0:
                         losses = max_losses * (p.speed / max_losses_speed) ** 2.5
+                        # copy on write: the caller's point and states are kept
                         p_new = Point(
-                            suc=p.suc,
-                            disch=p.disch,
+                            suc=copy(p.suc),
+                            disch=copy(p.disch),
                             flow_v=p.flow_v,
                             speed=p.speed,
                             power_losses=losses,
@@ -376,7 +409,7 @@ class Impeller(Serializable):
                             extrapolated=p._extrapolated,
                         )
                     else:
-                        p_new = deepcopy(p)
+                        p_new = p
                     points.append(p_new)
                     points_update.append(p_new)
             else:
@@ -427,6 +460,100 @@ class Impeller(Serializable):
     def __getitem__(self, item):
         return self.points.__getitem__(item)
 
+    def __getstate__(self):
+        # cached curves and arrays are recalculated when needed
+        state = self.__dict__.copy()
+        state.pop("_arrays", None)
+        state.pop("_envelope_arrays", None)
+        state["curve_cache"] = LRUCache(maxsize=self.curve_cache.maxsize)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "curve_cache" not in state:
+            self.curve_cache = LRUCache(maxsize=ccp.config.CURVE_CACHE_SIZE)
+
+    def __getattr__(self, name):
+        # a lazily loaded impeller (see Impeller.from_dict) creates its points
+        # and curves when an attribute that depends on them is first accessed
+        if name.startswith("__") or "_lazy" not in self.__dict__:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        self._materialize()
+        return getattr(self, name)
+
+    def _materialize(self):
+        """Create the points and curves of a lazily loaded impeller."""
+        lazy = self.__dict__.pop("_lazy")
+        curve_cache = self.curve_cache
+        self.__init__([Point.from_dict(kwargs) for kwargs in lazy["points"]])
+        self.curve_cache = curve_cache
+
+    def _reference(self):
+        """Suction state, b and D of the reference point (Impeller.points[0]).
+
+        For a lazily loaded impeller these are created from the stored values,
+        without creating the points.
+        """
+        lazy = self.__dict__.get("_lazy")
+        if lazy is None:
+            p0 = self.points[0]
+            return p0.suc, p0.b, p0.D
+        if "reference" not in lazy:
+            kwargs = lazy["points"][lazy["reference_index"]]
+            phase = kwargs.get("phase")
+            if phase in ("None", ""):
+                phase = None
+            suc = State(
+                p=Q_(kwargs["p"]), T=Q_(kwargs["T"]), fluid=kwargs["fluid"], phase=phase
+            )
+            lazy["reference"] = (suc, Q_(kwargs["b"]), Q_(kwargs["D"]))
+        return lazy["reference"]
+
+    @property
+    def surface(self):
+        """ccp.ImpellerSurface used to evaluate the map, or None.
+
+        When a surface is set, Impeller.point, Impeller.point_batch and
+        Impeller.curve evaluate head, efficiency and similarity ratios from the
+        surface instead of interpolating between the speed lines.
+        """
+        return self.__dict__.get("_surface")
+
+    @surface.setter
+    def surface(self, surface):
+        self._surface = surface
+        self.clear_cache()
+
+    def fit_surface(self, number_of_points=64):
+        """Fit a smooth surface to the map and use it to evaluate the impeller.
+
+        Parameters
+        ----------
+        number_of_points : int, optional
+            Number of grid points along the flow and speed directions.
+            Default is 64.
+
+        Returns
+        -------
+        surface : ccp.ImpellerSurface
+            The fitted surface, also available as Impeller.surface. Set
+            Impeller.surface = None to go back to curve interpolation.
+        """
+        self.surface = ImpellerSurface(self, number_of_points=number_of_points)
+        return self.surface
+
+    def clear_cache(self):
+        """Clear the cached curves, curve arrays and envelope of the impeller.
+
+        Needed only if the points or curves of the impeller are modified after
+        its creation.
+        """
+        self.curve_cache.clear()
+        self.__dict__.pop("_arrays", None)
+        self.__dict__.pop("_envelope_arrays", None)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             points_other = sorted(other.points, key=lambda x: x.flow_v)
@@ -468,133 +595,47 @@ class Impeller(Serializable):
         if flow_v is None and flow_m is None:
             raise ValueError("Either flow_v or flow_m must be defined.")
 
-        current_curve = self.curve(speed)
+        line = self._speed_line(speed)
+        suc, b, D = self._reference()
         if flow_m:
-            flow_v = current_curve.points[0].suc.v() * flow_m
-
-        func_head = interp1d(
-            current_curve.flow_v.m, current_curve.head.m, fill_value="extrapolate"
-        )
-        func_eff = interp1d(
-            current_curve.flow_v.m, current_curve.eff.m, fill_value="extrapolate"
-        )
-
-        # interpolate similarity parameters for converted points
-        if not np.all(
-            np.concatenate(
-                (
-                    [p.phi_ratio.m for p in current_curve.points],
-                    [p.psi_ratio.m for p in current_curve.points],
-                    [p.reynolds_ratio.m for p in current_curve.points],
-                    [p.volume_ratio_ratio.m for p in current_curve.points],
-                )
-            )
-            == 1
-        ) or not np.all(np.array([p.mach_diff.m for p in current_curve.points]) == 0):
-            converted_curve = True
-            func_phi_ratio = interp1d(
-                current_curve.flow_v.m,
-                [p.phi_ratio.m for p in current_curve.points],
-                fill_value="extrapolate",
-            )
-            func_psi_ratio = interp1d(
-                current_curve.flow_v.m,
-                [p.psi_ratio.m for p in current_curve.points],
-                fill_value="extrapolate",
-            )
-            func_reynolds_ratio = interp1d(
-                current_curve.flow_v.m,
-                [p.reynolds_ratio.m for p in current_curve.points],
-                fill_value="extrapolate",
-            )
-            func_mach_diff = interp1d(
-                current_curve.flow_v.m,
-                [p.mach_diff.m for p in current_curve.points],
-                fill_value="extrapolate",
-            )
-            func_volume_ratio_ratio = interp1d(
-                current_curve.flow_v.m,
-                [p.volume_ratio_ratio.m for p in current_curve.points],
-                fill_value="extrapolate",
-            )
-        else:
-            converted_curve = False
+            flow_v = suc.v() * flow_m
 
-        min_flow_v = min(current_curve.flow_v)
-        max_flow_v = max(current_curve.flow_v)
-        if flow_v < min_flow_v or max_flow_v < flow_v:
+        values = _speed_line_values(line, np.atleast_1d(flow_v.m))
+        min_flow_v = Q_(line["flow_v"][0], "m³/s")
+        max_flow_v = Q_(line["flow_v"][-1], "m³/s")
+        if values["outside"][0]:
             warnings.warn(
                 f"Expected point is being extrapolated.\n"
                 f"Interpolation limits: {min_flow_v:.3f~P} ~ {max_flow_v:.3f~P}\n"
                 f"Expected point flow: {flow_v:.3f~P}"
             )
-            extrapolated = True
-        elif current_curve._extrapolated:
-            extrapolated = True
-        else:
-            extrapolated = False
-
-        flow_at_min_head = (
-            np.log(current_curve[-1].head.m + np.exp(4 * max_flow_v.m))
-        ) / 4
-        flow_at_min_eff = (
-            np.log(current_curve[-1].eff.m + np.exp(4 * max_flow_v.m))
-        ) / 4
-
-        # Extrapolation code for choke region
-        if flow_v <= max_flow_v:
-            head = float(func_head(flow_v))
-        elif flow_v.m < flow_at_min_head:
-            head = round(
-                current_curve[-1].head.m
-                + np.exp(4 * current_curve[-1].flow_v.m)
-                - np.exp(4 * flow_v.m),
-                2,
-            )
-        else:
-            head = 0.001
-
-        if flow_v <= max_flow_v:
-            eff = float(func_eff(flow_v))
-        elif flow_v.m < flow_at_min_eff:
-            eff = round(
-                current_curve[-1].eff.m
-                + np.exp(4 * current_curve[-1].flow_v.m)
-                - np.exp(4 * flow_v.m),
-                2,
-            )
-        else:
-            eff = round(
-                current_curve[-1].eff.m
-                + np.exp(4 * flow_at_min_eff)
-                - np.exp(4 * flow_at_min_eff),
-                2,
-            )
+        extrapolated = bool(values["extrapolated"][0])
+        head = float(values["head"][0])
+        eff = float(values["eff"][0])
 
         # interpolate similarity parameters for converted curves
-        if flow_v >= min_flow_v and flow_v <= max_flow_v and converted_curve:
-            phi_ratio = float(func_phi_ratio(flow_v))
-            psi_ratio = float(func_psi_ratio(flow_v))
-            reynolds_ratio = float(func_reynolds_ratio(flow_v))
-            mach_diff = float(func_mach_diff(flow_v))
-            volume_ratio_ratio = float(func_volume_ratio_ratio(flow_v))
+        if values["converted"] and not values["outside"][0]:
+            phi_ratio = float(values["phi_ratio"][0])
+            psi_ratio = float(values["psi_ratio"][0])
+            reynolds_ratio = float(values["reynolds_ratio"][0])
+            mach_diff = float(values["mach_diff"][0])
+            volume_ratio_ratio = float(values["volume_ratio_ratio"][0])
         else:
             phi_ratio = None
             psi_ratio = None
             reynolds_ratio = None
             mach_diff = None
             volume_ratio_ratio = None
-        p0 = self.points[0]
-        power_losses = current_curve.power_losses
+        power_losses = line["power_losses"]
 
         point = Point(
-            suc=p0.suc,
+            suc=suc,
             head=head,
             eff=eff,
             flow_v=flow_v,
-            speed=current_curve.speed,
-            b=p0.b,
-            D=p0.D,
+            speed=line["speed"],
+            b=b,
+            D=D,
             power_losses=power_losses,
             phi_ratio=phi_ratio,
             psi_ratio=psi_ratio,
@@ -606,6 +647,522 @@ class Impeller(Serializable):
 
         return point
 
+    @check_units
+    def point_batch(self, flow_v=None, flow_m=None, speed=None):
+        """Calculate several points in the performance map.
+
+        Batch counterpart of Impeller.point. Queries are grouped by speed, so the
+        speed line is interpolated once for each distinct speed, and no
+        ccp.Point is created: only the discharge state of each point is flashed.
+        Instead of one warning per point, a single warning reports the number
+        of extrapolated points.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, array
+            Volumetric flows (m³/s).
+        flow_m : pint.Quantity, array
+            Mass flows (kg/s).
+        speed : pint.Quantity, array
+            Speeds (rad/s). A single speed is used for all flows.
+
+        Returns
+        -------
+        points : pd.DataFrame
+            Table with one row per query and the columns flow_v (m³/s),
+            flow_m (kg/s), speed (rad/s), head (J/kg), eff, power (W),
+            power_shaft (W), disch_p (Pa), disch_T (K) and extrapolated.
+            Rows whose discharge state cannot be calculated (ValueError from
+            ccp.point.disch_from_suc_head_eff, e.g. for head or eff far
+            extrapolated in the choke region) have NaN disch_p and disch_T and
+            keep the other values, while Impeller.point raises for that query.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> imp = ccp.impeller_example()
+        >>> df = imp.point_batch(flow_v=[5.0, 5.5], speed=[900, 900])
+        >>> df[["head", "eff"]].round(3)
+                 head    eff
+        0  123678.385  0.811
+        1  110059.358  0.774
+        """
+        if speed is None:
+            raise ValueError("Speed must be defined.")
+        if flow_v is None and flow_m is None:
+            raise ValueError("Either flow_v or flow_m must be defined.")
+
+        suc = self._reference()[0]
+        v_suc = suc._v_si()
+        if flow_v is None:
+            flow_m, speed = np.broadcast_arrays(
+                np.atleast_1d(flow_m.m).astype(float), speed.m
+            )
+            flow_v = flow_m * v_suc
+        else:
+            flow_v, speed = np.broadcast_arrays(
+                np.atleast_1d(flow_v.m).astype(float), speed.m
+            )
+            flow_m = flow_v / v_suc
+
+        head = np.full_like(flow_v, np.nan)
+        eff = np.full_like(flow_v, np.nan)
+        power_losses = np.zeros_like(flow_v)
+        extrapolated = np.zeros(flow_v.shape, dtype=bool)
+        outside = 0
+        unique_speeds, inverse = np.unique(speed, return_inverse=True)
+        for i, speed_value in enumerate(unique_speeds):
+            rows = inverse.ravel() == i
+            line = self._speed_line(Q_(speed_value, "rad/s"))
+            values = _speed_line_values(line, flow_v[rows])
+            head[rows] = values["head"]
+            eff[rows] = values["eff"]
+            extrapolated[rows] = values["extrapolated"]
+            power_losses[rows] = line["power_losses"].to("W").m
+            outside += np.count_nonzero(values["outside"])
+
+        if outside:
+            warnings.warn(
+                f"{outside} of {flow_v.size} expected points are being extrapolated."
+            )
+
+        disch_p = np.full_like(flow_v, np.nan)
+        disch_T = np.full_like(flow_v, np.nan)
+        for i in range(flow_v.size):
+            try:
+                disch = disch_from_suc_head_eff(suc, head[i], eff[i])
+            except ValueError:
+                continue
+            disch_p[i] = disch._p_si()
+            disch_T[i] = disch._T_si()
+
+        power = flow_m * head / eff
+        return pd.DataFrame(
+            {
+                "flow_v": flow_v,
+                "flow_m": flow_m,
+                "speed": speed,
+                "head": head,
+                "eff": eff,
+                "power": power,
+                "power_shaft": power + power_losses,
+                "disch_p": disch_p,
+                "disch_T": disch_T,
+                "extrapolated": extrapolated,
+            }
+        )
+
+    @check_units
+    def operating_points(
+        self,
+        speed=None,
+        system_flow_v=None,
+        system_head=None,
+        system_p_disch=None,
+        tol=1e-6,
+        maxiter=50,
+    ):
+        """Calculate the operating points on system resistance curves.
+
+        The operating point is the intersection of the speed line with a system
+        curve given as head or discharge pressure versus volumetric flow. The
+        system curves are linearly interpolated (and extrapolated) between
+        their points. The speed line is interpolated once for each distinct
+        speed, and the intersections of all system curves at that speed are
+        bracketed between the points of the speed line and refined together
+        with the Illinois (regula falsi) method, without creating points. The
+        result is calculated with Impeller.point_batch.
+
+        Only intersections between the surge and stonewall flows are searched.
+        If a system curve crosses the speed line more than once, the
+        intersection with the highest flow is returned.
+
+        Parameters
+        ----------
+        speed : pint.Quantity, float, array
+            Speeds (rad/s). Each speed is paired with a system curve, and a
+            single speed (or a single system curve) is used for all of them.
+        system_flow_v : pint.Quantity, array
+            Volumetric flows of the system curves (m³/s), with shape
+            (number of points,) if all curves share the flows or
+            (number of curves, number of points).
+        system_head : pint.Quantity, array, optional
+            Head of the system curves (J/kg), with shape (number of points,)
+            for a single curve or (number of curves, number of points).
+        system_p_disch : pint.Quantity, array, optional
+            Discharge pressure of the system curves (Pa), with the same shapes
+            as system_head. The discharge pressure along the speed line is
+            linearly interpolated between the flashed speed line points.
+        tol : float, optional
+            Tolerance of the intersection residual relative to the largest
+            head (or discharge pressure) of the speed line. Default is 1e-6.
+        maxiter : int, optional
+            Maximum number of iterations. Default is 50.
+
+        Returns
+        -------
+        points : pd.DataFrame
+            Table with the columns of Impeller.point_batch for each pair of
+            system curve and speed, plus the system_curve index and the found
+            flag. Rows without an intersection have found=False and NaN
+            values.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> import numpy as np
+        >>> imp = ccp.impeller_example()
+        >>> flow_v = np.linspace(0, 8, 81)
+        >>> system_head = [50000 + 2500 * flow_v**2, 30000 + 2500 * flow_v**2]
+        >>> df = imp.operating_points(
+        ...     speed=900, system_flow_v=flow_v, system_head=system_head
+        ... )
+        >>> df[["system_curve", "flow_v", "head", "found"]].round(3)
+           system_curve  flow_v        head  found
+        0             0   5.237  118579.397   True
+        1             1   5.549  106988.448   True
+        """
+        if speed is None:
+            raise ValueError("Speed must be defined.")
+        if system_flow_v is None or (system_head is None) == (system_p_disch is None):
+            raise ValueError(
+                "system_flow_v and either system_head or system_p_disch "
+                "must be defined."
+            )
+
+        if system_head is not None:
+            system = np.atleast_2d(system_head.m).astype(float)
+        else:
+            system = np.atleast_2d(system_p_disch.m).astype(float)
+        system_flow_v = np.broadcast_to(
+            np.atleast_2d(system_flow_v.m).astype(float), system.shape
+        )
+        order = np.argsort(system_flow_v, axis=1, kind="stable")
+        system_flow_v = np.take_along_axis(system_flow_v, order, axis=1)
+        system = np.take_along_axis(system, order, axis=1)
+        system_curve, speed = np.broadcast_arrays(
+            np.arange(len(system)), np.atleast_1d(speed.m).astype(float)
+        )
+
+        suc = self._reference()[0]
+        flow_v = np.full(speed.shape, np.nan)
+        unique_speeds, inverse = np.unique(speed, return_inverse=True)
+        for i, speed_value in enumerate(unique_speeds):
+            rows = np.flatnonzero(inverse.ravel() == i)
+            line = self._speed_line(Q_(speed_value, "rad/s"))
+            flow_v_line = line["flow_v"]
+            if system_head is not None:
+                map_line = _speed_line_values(line, flow_v_line)["head"]
+
+                def map_value(x, line=line):
+                    return _speed_line_values(line, x)["head"]
+
+            else:
+                map_line = np.array(
+                    [
+                        disch_from_suc_head_eff(suc, head, eff)._p_si()
+                        for head, eff in zip(line["head"], line["eff"])
+                    ]
+                )
+
+                def map_value(x, flow_v_line=flow_v_line, map_line=map_line):
+                    return np.interp(x, flow_v_line, map_line)
+
+            xp = system_flow_v[system_curve[rows]]
+            fp = system[system_curve[rows]]
+            residual = map_line - _interp_rows(
+                np.broadcast_to(flow_v_line, (len(rows), len(flow_v_line))), xp, fp
+            )
+
+            # bracket the intersection with the highest flow
+            change = np.sign(residual[:, :-1]) != np.sign(residual[:, 1:])
+            found = change.any(axis=1)
+            rows, residual, change = rows[found], residual[found], change[found]
+            xp, fp = xp[found], fp[found]
+            j = change.shape[1] - 1 - np.argmax(change[:, ::-1], axis=1)
+            k = np.arange(len(rows))
+            x_low, x_high = flow_v_line[j], flow_v_line[j + 1]
+            r_low, r_high = residual[k, j], residual[k, j + 1]
+
+            x = x_high
+            scale = tol * np.abs(map_line).max()
+            for _ in range(maxiter):
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    x = np.where(
+                        r_high == r_low,
+                        x_high,
+                        x_high - r_high * (x_high - x_low) / (r_high - r_low),
+                    )
+                r = map_value(x) - _interp_rows(x[:, None], xp, fp)[:, 0]
+                if np.all(np.abs(r) <= scale):
+                    break
+                opposite = np.sign(r) != np.sign(r_high)
+                x_low = np.where(opposite, x_high, x_low)
+                r_low = np.where(opposite, r_high, r_low / 2)
+                x_high, r_high = x, r
+            flow_v[rows] = x
+
+        found = ~np.isnan(flow_v)
+        df = self.point_batch(flow_v=flow_v[found], speed=speed[found])
+        df.index = np.flatnonzero(found)
+        df = df.reindex(range(len(speed)))
+        df["speed"] = speed
+        df.insert(0, "system_curve", system_curve)
+        df["found"] = found
+        return df
+
+    def _envelope(self):
+        """Surge and stonewall flows of each curve sorted by speed (SI units).
+
+        Calculated on first use and used to evaluate the operating envelope
+        without creating points (see Impeller._envelope_flows).
+        """
+        envelope = self.__dict__.get("_envelope_arrays")
+        if envelope is None:
+            arrays = self._curve_arrays()
+            envelope = {
+                "speed": np.array([a["speed"] for a in arrays]),
+                "surge": np.array([a["flow_v"].min() for a in arrays]),
+                "stonewall": np.array([a["flow_v"].max() for a in arrays]),
+            }
+            self._envelope_arrays = envelope
+        return envelope
+
+    def _envelope_flows(self, speed):
+        """Surge and stonewall flows (m³/s) at speeds (rad/s) as float arrays.
+
+        Between two curves the limits are interpolated linearly with speed, as
+        the curves are in Impeller.curve. Outside the map they are extrapolated
+        with the fan law (flow proportional to speed) from the closest curve.
+        If the impeller has a surface, its surge and stonewall lines are used.
+        """
+        speed = np.asarray(speed, dtype=float)
+        if self.surface is not None:
+            edges = self.surface._evaluate(0.0, speed)
+            return edges["surge_flow_v"], edges["stonewall_flow_v"]
+
+        envelope = self._envelope()
+        speed_map = np.clip(speed, envelope["speed"][0], envelope["speed"][-1])
+        ratio = speed / speed_map
+        surge = np.interp(speed_map, envelope["speed"], envelope["surge"]) * ratio
+        stonewall = (
+            np.interp(speed_map, envelope["speed"], envelope["stonewall"]) * ratio
+        )
+        return surge, stonewall
+
+    def _envelope_query(self, flow_v, flow_m, speed):
+        """Flows, surge flows and stonewall flows (m³/s) for envelope queries."""
+        if speed is None:
+            raise ValueError("Speed must be defined.")
+        if flow_v is None and flow_m is None:
+            raise ValueError("Either flow_v or flow_m must be defined.")
+
+        if flow_v is None:
+            flow_v = flow_m.m * self._reference()[0]._v_si()
+        else:
+            flow_v = flow_v.m
+        flow_v, speed = np.broadcast_arrays(
+            np.asarray(flow_v, dtype=float), np.asarray(speed.m, dtype=float)
+        )
+        surge, stonewall = self._envelope_flows(speed)
+        return flow_v, surge, stonewall
+
+    @check_units
+    def surge_flow(self, speed=None):
+        """Volumetric flow at the surge line for given speeds.
+
+        Parameters
+        ----------
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+
+        Returns
+        -------
+        flow_v : pint.Quantity
+            Volumetric flow (m³/s).
+        """
+        return Q_(self._envelope_flows(speed.m)[0], "m³/s")
+
+    @check_units
+    def stonewall_flow(self, speed=None):
+        """Volumetric flow at the stonewall line for given speeds.
+
+        Parameters
+        ----------
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+
+        Returns
+        -------
+        flow_v : pint.Quantity
+            Volumetric flow (m³/s).
+        """
+        return Q_(self._envelope_flows(speed.m)[1], "m³/s")
+
+    @check_units
+    def surge_margin(self, flow_v=None, flow_m=None, speed=None):
+        """Surge margin of operating points.
+
+        The surge margin is (flow_v - surge_flow_v) / flow_v, where
+        surge_flow_v is the flow at the surge line for the speed of the point.
+        Negative values are points beyond the surge line. No ccp.Point is
+        created, so this can be used with many points at once.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, float, array
+            Volumetric flow (m³/s).
+        flow_m : pint.Quantity, float, array
+            Mass flow (kg/s), converted with the suction state of the impeller.
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+
+        Returns
+        -------
+        surge_margin : pint.Quantity
+            Surge margin (dimensionless).
+
+        Examples
+        --------
+        >>> import ccp
+        >>> imp = ccp.impeller_example()
+        >>> imp.surge_margin(flow_v=[4.5, 5.5], speed=900).round(3)
+        <Quantity([0.098 0.262], 'dimensionless')>
+        """
+        flow_v, surge, _ = self._envelope_query(flow_v, flow_m, speed)
+        return Q_((flow_v - surge) / flow_v, "dimensionless")
+
+    @check_units
+    def classify(self, flow_v=None, flow_m=None, speed=None, surge_margin=0.1):
+        """Classify operating points against the surge and stonewall lines.
+
+        No ccp.Point is created, so this can be used with many points at once.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, float, array
+            Volumetric flow (m³/s).
+        flow_m : pint.Quantity, float, array
+            Mass flow (kg/s), converted with the suction state of the impeller.
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+        surge_margin : float, optional
+            Minimum surge margin (see Impeller.surge_margin) of points that are
+            not classified as "surge_margin". Default is 0.1.
+
+        Returns
+        -------
+        envelope : np.ndarray
+            Array with "surge" for points beyond the surge line, "surge_margin"
+            for points with a surge margin lower than surge_margin, "choke" for
+            points beyond the stonewall line and "inside" for the other points.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> imp = ccp.impeller_example()
+        >>> imp.classify(flow_v=[3.5, 4.5, 5.5, 7.0], speed=900)
+        array(['surge', 'surge_margin', 'inside', 'choke'], dtype='<U12')
+        """
+        flow_v, surge, stonewall = self._envelope_query(flow_v, flow_m, speed)
+        margin = (flow_v - surge) / flow_v
+        return np.select(
+            [flow_v < surge, margin < surge_margin, flow_v > stonewall],
+            ["surge", "surge_margin", "choke"],
+            default="inside",
+        )
+
+    def _curve_arrays(self):
+        """Values of the points of each curve as arrays (SI units).
+
+        Calculated on first use and used to interpolate the map without
+        creating points (see Impeller._speed_line). Each curve also has its
+        speed, power_losses and extrapolated flag.
+        """
+        arrays = self.__dict__.get("_arrays")
+        if arrays is None:
+            lazy = self.__dict__.get("_lazy")
+            if lazy is not None:
+                arrays = lazy["arrays"]
+            else:
+                arrays = [
+                    {
+                        **{
+                            key: np.array([getattr(p, key).m for p in curve.points])
+                            for key in _SPEED_LINE_KEYS
+                        },
+                        "speed": curve.speed.m,
+                        "power_losses": curve.power_losses.to("W").m,
+                        "extrapolated": bool(
+                            np.all([p._extrapolated for p in curve.points])
+                        ),
+                    }
+                    for curve in self.curves
+                ]
+            self._arrays = arrays
+        return arrays
+
+    def _speed_line(self, speed):
+        """Values of the curve at a given speed, as arrays sorted by flow.
+
+        Speeds between two curves of the map are interpolated directly from the
+        curve arrays, with the same procedure as interpolate_between_curves but
+        without creating (and flashing) the curve points. Other speeds, which
+        are extrapolated with the fan law, use the curve from Impeller.curve.
+
+        Parameters
+        ----------
+        speed : pint.Quantity
+            Speed (rad/s).
+
+        Returns
+        -------
+        line : dict
+            Dictionary with arrays of flow_v (m³/s), head (J/kg), eff and the
+            similarity ratios, and the speed, power_losses and extrapolated flag
+            of the curve.
+        """
+        if np.ndim(speed.magnitude) > 0:
+            speed = Q_(float(np.squeeze(speed.magnitude)), speed.units)
+        if self.surface is not None:
+            return self.surface.speed_line(speed)
+
+        arrays = self._curve_arrays()
+        speeds = np.array([a["speed"] for a in arrays])
+        idxs = find_closest_speeds(speeds, speed.magnitude)
+        arrays = [arrays[idxs[0]], arrays[idxs[1]]]
+
+        if len(speeds) == 1 or not (
+            arrays[0]["speed"] <= speed.m <= arrays[1]["speed"]
+        ):
+            current_curve = self.curve(speed)
+            line = {
+                key: np.array([getattr(p, key).m for p in current_curve.points])
+                for key in _SPEED_LINE_KEYS
+            }
+            line["speed"] = current_curve.speed
+            line["power_losses"] = current_curve.power_losses
+            line["extrapolated"] = current_curve._extrapolated
+            return line
+
+        extrapolated = arrays[0]["extrapolated"] or arrays[1]["extrapolated"]
+        line = _interpolate_speed_lines(
+            arrays, speed.m, number_of_points=len(arrays[0]["flow_v"])
+        )
+        order = np.argsort(line["flow_v"], kind="stable")
+        line = {key: value[order] for key, value in line.items()}
+
+        line["speed"] = speed
+        reference = self._curve_arrays()[0]
+        line["power_losses"] = calculate_power_losses(
+            power_losses_ref=Q_(reference["power_losses"], "W"),
+            speed_ref=Q_(reference["speed"], "rad/s"),
+            speed=speed,
+        )
+        # if curve was interpolated from an extrapolated curve extrapolated is true
+        line["extrapolated"] = extrapolated
+        return line
+
     @check_units
     def curve(self, speed=None):
         """Calculate specific point in the performance map.
@@ -628,6 +1185,16 @@ class Impeller(Serializable):
         if np.ndim(speed.magnitude) > 0:
             speed = Q_(float(np.squeeze(speed.magnitude)), speed.units)
 
+        digits = max(int(round(-np.log10(ccp.config.CURVE_CACHE_RTOL))), 1)
+        key = float(f"{speed.magnitude:.{digits}e}")
+        current_curve = self.curve_cache.get(key)
+        if current_curve is not None:
+            return current_curve
+        if self.surface is not None:
+            current_curve = self._surface_curve(speed)
+            self.curve_cache.put(key, current_curve)
+            return current_curve
+
         speeds = np.array([curve.speed.magnitude for curve in self.curves])
 
         # calculate power losses
@@ -693,9 +1260,35 @@ class Impeller(Serializable):
                 )
 
         current_curve = Curve(current_curve, extrapolated)
+        self.curve_cache.put(key, current_curve)
 
         return current_curve
 
+    def _surface_curve(self, speed):
+        """Curve at a given speed with the points evaluated on the surface."""
+        line = self.surface.speed_line(speed, number_of_points=len(self.curves[0]))
+        p0 = self.points[0]
+        points = [
+            Point(
+                suc=p0.suc,
+                head=line["head"][i],
+                eff=line["eff"][i],
+                flow_v=line["flow_v"][i],
+                speed=line["speed"],
+                power_losses=line["power_losses"],
+                b=p0.b,
+                D=p0.D,
+                phi_ratio=line["phi_ratio"][i],
+                psi_ratio=line["psi_ratio"][i],
+                volume_ratio_ratio=line["volume_ratio_ratio"][i],
+                reynolds_ratio=line["reynolds_ratio"][i],
+                mach_diff=line["mach_diff"][i],
+                extrapolated=line["extrapolated"],
+            )
+            for i in range(len(line["flow_v"]))
+        ]
+        return Curve(points, line["extrapolated"])
+
     @classmethod
     def convert_from(
         cls, original_impeller, suc=None, find="speed", speed=None, method="similarity"
@@ -747,6 +1340,19 @@ class Impeller(Serializable):
             The new impeller with the converted performance map for the required
             suction condition.
 
+        Notes
+        -----
+        Conversions can be cached (disabled by default). With
+        ``ccp.config.CONVERSION_CACHE_SIZE > 0`` converted impellers are kept in
+        ``Impeller.conversion_cache``, an LRU cache keyed by a fingerprint of
+        the original points, the new suction (backend, phase, composition, p
+        and T rounded to ``ccp.config.CONVERSION_CACHE_RTOL``), find, speed,
+        method and the library versions. Repeated conversions then return the
+        same ``ccp.Impeller`` object, which should be treated as immutable. If
+        ``ccp.config.CONVERSION_CACHE_DIR`` is set, converted impellers are also
+        saved to toml files (with ``full=True``) in that directory and loaded
+        lazily by later calls and sessions.
+
         Examples
         --------
         >>> import ccp
@@ -762,6 +1368,43 @@ class Impeller(Serializable):
         ...     method="gp_surrogate",
         ... )
         """
+        use_cache = suc is not None and (
+            ccp.config.CONVERSION_CACHE_SIZE > 0
+            or ccp.config.CONVERSION_CACHE_DIR is not None
+        )
+        if not use_cache:
+            return cls._convert_from(
+                original_impeller, suc=suc, find=find, speed=speed, method=method
+            )
+
+        key = _conversion_key(cls, original_impeller, suc, find, speed, method)
+        cache = cls.conversion_cache
+        cache.maxsize = ccp.config.CONVERSION_CACHE_SIZE
+        converted_impeller = cache.get(key)
+        if converted_impeller is not None:
+            return converted_impeller
+
+        file = None
+        if ccp.config.CONVERSION_CACHE_DIR is not None:
+            name = hashlib.sha1(repr(key).encode()).hexdigest()
+            file = Path(ccp.config.CONVERSION_CACHE_DIR) / f"conversion_{name}.toml"
+            if file.exists():
+                converted_impeller = cls.load(file, lazy=True)
+                cache.put(key, converted_impeller)
+                return converted_impeller
+
+        converted_impeller = cls._convert_from(
+            original_impeller, suc=suc, find=find, speed=speed, method=method
+        )
+        cache.put(key, converted_impeller)
+        if file is not None:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            converted_impeller.save(file, full=True)
+        return converted_impeller
+
+    @classmethod
+    def _convert_from(cls, original_impeller, suc, find, speed, method):
+        """Convert performance map without the conversion cache."""
         if method == "gp_surrogate":
             return convert_from_gp_surrogate(
                 cls, original_impeller, suc=suc, speed=speed
@@ -771,7 +1414,6 @@ class Impeller(Serializable):
                 f"unknown method {method!r}; expected 'similarity' or 'gp_surrogate'"
             )
 
-        all_converted_points = []
         if isinstance(original_impeller, list):
             speed_sound_diff = []
             for impeller in original_impeller:
@@ -780,41 +1422,42 @@ class Impeller(Serializable):
                 )
             original_impeller = original_impeller[np.argmin(np.abs(speed_sound_diff))]
 
-        # Collect all converter arguments from all curves
-        all_converter_args = []
-        curve_lengths = []
-        for curve in original_impeller.curves:
-            converter_args = [(p, suc, find) for p in curve]
-            all_converter_args.extend(converter_args)
-            curve_lengths.append(len(converter_args))
-
-        # Convert all points in parallel using a single pool
+        # Each task converts a curve with Point.convert_many. The workers
+        # receive and return the values of the points as floats (see
+        # converter), and both conversion stages run in a single pool.
+        curves_values = [
+            [_point_values(p, _CONVERT_UNITS) for p in curve]
+            for curve in original_impeller.curves
+        ]
         with create_pool() as pool:
-            all_converted = pool.map(converter, all_converter_args)
-
-        # Split results back into curves and apply speed correction
-        start_idx = 0
-        for curve_len in curve_lengths:
-            converted_points = all_converted[start_idx : start_idx + curve_len]
+            converted_curves = pool.map(
+                converter, [(values, suc, find, None) for values in curves_values]
+            )
 
-            if speed is None or speed == "same":
-                speed_mean = np.mean([p.speed.magnitude for p in converted_points])
-            else:
-                speed_mean = speed
-
-            converted_points = [
-                Point.convert_from(
-                    p,
-                    suc=p.suc,
-                    find="volume_ratio",
-                    speed=speed_mean,
+            # convert each curve to a single speed
+            second_stage_args = []
+            for converted_curve in converted_curves:
+                if speed is None or speed == "same":
+                    speed_mean = np.mean(
+                        [values["speed"] for values, _ in converted_curve]
+                    )
+                else:
+                    speed_mean = speed
+                second_stage_args.append(
+                    (
+                        [values for values, _ in converted_curve],
+                        suc,
+                        "volume_ratio",
+                        speed_mean,
+                    )
                 )
-                for p in converted_points
-            ]
-
-            all_converted_points += converted_points
-            start_idx += curve_len
+            converted_curves = pool.map(converter, second_stage_args)
 
+        all_converted_points = [
+            _point_from_values(values, suc, disch)
+            for converted_curve in converted_curves
+            for values, disch in converted_curve
+        ]
         converted_impeller = cls(all_converted_points)
         if speed == "same":
             all_converted_points = []
@@ -908,12 +1551,15 @@ class Impeller(Serializable):
         power_shaft_units="W",
         power_losses_units="W",
         speed_units="RPM",
+        pool=None,
+        progress=False,
     ):
         """Create points from dict object.
 
-        Points are created in a multiprocessing pool. Set
-        ccp.config.PARALLEL = False (or CCP_PARALLEL=0) to run serially and
-        ccp.config.POOL_SIZE (or CCP_POOL_SIZE) to limit worker processes.
+        The points of all speed lines are created in a single multiprocessing
+        pool. Set ccp.config.PARALLEL = False (or CCP_PARALLEL=0) to run
+        serially and ccp.config.POOL_SIZE (or CCP_POOL_SIZE) to limit worker
+        processes.
 
         In this case the dict is in the following format:
 
@@ -981,6 +1627,13 @@ class Impeller(Serializable):
             Discharge temperature units used in the dict.
         speed_units : str
             Speed units used in the dict.
+        pool : multiprocessing.pool.Pool, optional
+            Pool used to create the points, e.g. from ccp.parallel.create_pool,
+            so that several maps can be loaded without starting a pool for
+            each one. By default a pool is created for this call.
+        progress : bool, optional
+            If True, shows a progress bar with the points created.
+            Default is False.
         """
         # define if we have volume or mass flow
         args = locals().copy()
@@ -989,8 +1642,6 @@ class Impeller(Serializable):
         if list(Q_(1, flow_units).dimensionality.keys())[0] == "[mass]":
             flow_type = "mass"
 
-        points = []
-
         curves = {}
         for k, v in args.items():
             if "curves" in k and v is not None:
@@ -1030,6 +1681,8 @@ class Impeller(Serializable):
         # dict to hold interpolated values for specific x values
         points_interpolated = {}
 
+        # arguments of the points of all speed lines, created in a single pool
+        args_list = []
         for speed in speeds:
             min_x = 0
             max_x = 1e20
@@ -1090,8 +1743,6 @@ class Impeller(Serializable):
                     points_x
                 )
 
-            args_list = []
-
             for flow, param0, param1 in zip(
                 points_x,
                 points_interpolated[parameters[0]][speed],
@@ -1112,8 +1763,11 @@ class Impeller(Serializable):
                     arg_dict["flow_m"] = Q_(flow, flow_units)
                 args_list.append(arg_dict)
 
+        if pool is None:
             with create_pool() as pool:
-                points += pool.map(create_points_parallel, args_list)
+                points = _create_points(pool, args_list, progress)
+        else:
+            points = _create_points(pool, args_list, progress)
 
         return cls(points)
 
@@ -1129,6 +1783,8 @@ class Impeller(Serializable):
         flow_units="m**3/s",
         head_units="J/kg",
         speed_units="RPM",
+        pool=None,
+        progress=False,
     ):
         """Create points from dict object available in the ISIS platform.
 
@@ -1171,6 +1827,11 @@ class Impeller(Serializable):
             If the curve head units are in meter you can use: head_units="m*g0".
         speed_units : str
             Speed units used in the dict.
+        pool : multiprocessing.pool.Pool, optional
+            Pool used to create the points (see Impeller.load_from_dict).
+        progress : bool, optional
+            If True, shows a progress bar with the points created.
+            Default is False.
 
         Examples
         --------
@@ -1263,6 +1924,8 @@ class Impeller(Serializable):
             flow_units=flow_units,
             head_units=head_units,
             speed_units=speed_units,
+            pool=pool,
+            progress=progress,
         )
 
     @classmethod
@@ -1291,6 +1954,8 @@ class Impeller(Serializable):
         disch_p_units="Pa",
         disch_T_units="degK",
         speed_units="RPM",
+        pool=None,
+        progress=False,
         **kwargs,
     ):
         """Convert points from csv generated by engauge to csv with 6 points at same flow for use on hysys.
@@ -1360,6 +2025,11 @@ class Impeller(Serializable):
             Discharge temperature units used when extracting data with engauge.
         speed_units : str
             Speed units used when extracting data with engauge.
+        pool : multiprocessing.pool.Pool, optional
+            Pool used to create the points (see Impeller.load_from_dict).
+        progress : bool, optional
+            If True, shows a progress bar with the points created.
+            Default is False.
         """
         curves_path_dict = {}
 
@@ -1407,37 +2077,69 @@ class Impeller(Serializable):
             pressure_ratio_units=pressure_ratio_units,
             disch_p_units=disch_p_units,
             disch_T_units=disch_T_units,
+            pool=pool,
+            progress=progress,
             **curves_path_dict,
         )
 
-    def to_dict(self):
+    def to_dict(self, full=False):
         """Return a dict representation of the impeller.
 
+        Parameters
+        ----------
+        full : bool, optional
+            If True, the derived values of each point are also stored (see
+            :meth:`ccp.Point.to_dict`), with the library versions in a single
+            "versions" key, so that :meth:`from_dict` recreates the points
+            without solving them if the versions match.
+            Default is False.
+
         Returns
         -------
         dict
             Dict with a "points" key mapping to the dict representation
             (:meth:`ccp.Point.to_dict`) of each point in the impeller.
         """
-        return {
-            "points": {
-                f"point{i}": point.to_dict() for i, point in enumerate(self.points)
-            }
+        points = {
+            f"point{i}": point.to_dict(full=full) for i, point in enumerate(self.points)
         }
+        if not full:
+            return {"points": points}
+
+        for point_dict in points.values():
+            point_versions = point_dict.pop("versions")
+        return {"versions": point_versions, "points": points}
 
     @classmethod
-    def from_dict(cls, dict_parameters):
+    def from_dict(cls, dict_parameters, lazy=False):
         """Create an impeller from a dict created with :meth:`to_dict`.
 
         Parameters
         ----------
         dict_parameters : dict
             Dict as generated by :meth:`to_dict`.
+        lazy : bool, optional
+            If True, the points are not created when loading. The impeller
+            keeps the numeric values of the points and Impeller.point,
+            Impeller.point_batch, Impeller.operating_points and the envelope
+            methods interpolate the map directly from them. The points and
+            curves (and their flashes) are created when an attribute that
+            depends on them (e.g. Impeller.points or Impeller.curves) is first
+            accessed, or when a speed outside the map is requested.
+            Default is False.
 
         Returns
         -------
         impeller : ccp.Impeller
             Impeller object.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> imp = ccp.impeller_example()
+        >>> imp_lazy = ccp.Impeller.from_dict(imp.to_dict(), lazy=True)
+        >>> imp_lazy.point(flow_v=5.5, speed=900).head.round(3)
+        <Quantity(110059.358, 'joule / kilogram')>
         """
         points_dict = dict_parameters.get("points")
         if points_dict is None:
@@ -1445,6 +2147,16 @@ class Impeller(Serializable):
             points_dict = {
                 k: v for k, v in dict_parameters.items() if k != "ccp_version"
             }
+        if "versions" in dict_parameters:
+            points_dict = {
+                k: {**v, "versions": dict_parameters["versions"]}
+                for k, v in points_dict.items()
+            }
+        if lazy:
+            impeller = cls.__new__(cls)
+            impeller.curve_cache = LRUCache(maxsize=ccp.config.CURVE_CACHE_SIZE)
+            impeller._lazy = _lazy_values(points_dict.values())
+            return impeller
         return cls([Point.from_dict(kwargs) for kwargs in points_dict.values()])
 
     def save_isis_txt(self, file, parameter):
@@ -1518,6 +2230,215 @@ class Impeller(Serializable):
                     writer.writerow({"Speed (RPM)": speed, "Volume Flow (m3/h)": flow})
 
 
+# point attributes interpolated along a speed line (see Impeller._speed_line)
+_SPEED_LINE_KEYS = (
+    "flow_v",
+    "head",
+    "eff",
+    "phi_ratio",
+    "psi_ratio",
+    "reynolds_ratio",
+    "mach_diff",
+    "volume_ratio_ratio",
+)
+
+
+def _lazy_values(points_dicts):
+    """Values of serialized points used by a lazily loaded impeller.
+
+    The numeric values of the points (dicts as generated by Point.to_dict) are
+    grouped in curves with the same procedure as Impeller.__init__, including
+    the power losses assigned to points without losses.
+
+    Parameters
+    ----------
+    points_dicts : iterable
+        Dicts as generated by Point.to_dict.
+
+    Returns
+    -------
+    lazy : dict
+        Dictionary with the point dicts, the arrays of each curve as in
+        Impeller._curve_arrays and the index of the reference point.
+    """
+    points_dicts = list(points_dicts)
+    defaults = {
+        "power_losses": "0 W",
+        "phi_ratio": "1",
+        "psi_ratio": "1",
+        "reynolds_ratio": "1",
+        "mach_diff": "0",
+        "volume_ratio_ratio": "1",
+    }
+    units = {
+        "speed": "rad/s",
+        "power_losses": "W",
+        "flow_v": "m³/s",
+        "head": "J/kg",
+        "eff": "dimensionless",
+        "phi_ratio": "dimensionless",
+        "psi_ratio": "dimensionless",
+        "reynolds_ratio": "dimensionless",
+        "mach_diff": "dimensionless",
+        "volume_ratio_ratio": "dimensionless",
+    }
+    values = {
+        key: np.array(
+            [
+                Q_(kwargs.get(key, defaults.get(key))).to(unit).m
+                for kwargs in points_dicts
+            ]
+        )
+        for key, unit in units.items()
+    }
+    extrapolated = np.array(
+        [
+            str(kwargs.get("extrapolated", False)).lower() == "true"
+            for kwargs in points_dicts
+        ]
+    )
+
+    # same power losses and point order as Impeller.__init__
+    speed = values["speed"]
+    losses = values["power_losses"]
+    losses_dict = dict(zip(losses, speed))
+    max_losses = max(losses_dict)
+    order = np.argsort(speed, kind="stable")
+    if max_losses > 0:
+        losses = np.where(
+            losses == 0, max_losses * (speed / losses_dict[max_losses]) ** 2.5, losses
+        )
+        reference_index = int(order[0])
+    else:
+        reference_index = 0
+
+    arrays = []
+    for speed_value in np.unique(speed):
+        idx = order[speed[order] == speed_value]
+        idx = idx[np.argsort(values["flow_v"][idx], kind="stable")]
+        arrays.append(
+            {
+                **{key: values[key][idx] for key in _SPEED_LINE_KEYS},
+                "speed": speed_value,
+                "power_losses": losses[idx[0]],
+                "extrapolated": bool(np.all(extrapolated[idx])),
+            }
+        )
+
+    return {
+        "points": points_dicts,
+        "arrays": arrays,
+        "reference_index": reference_index,
+    }
+
+
+def _speed_line_values(line, flow_v):
+    """Expected values at the flows flow_v (m³/s) on a speed line.
+
+    Head and efficiency are linearly interpolated (and extrapolated below the
+    first point). Above the last point the choke region is extrapolated with
+    an exponential decay. The similarity ratios are interpolated for converted
+    curves only.
+
+    Parameters
+    ----------
+    line : dict
+        Speed line from Impeller._speed_line.
+    flow_v : np.ndarray
+        Volumetric flows (m³/s).
+
+    Returns
+    -------
+    values : dict
+        Arrays of head (J/kg), eff, the similarity ratios, outside (flow outside
+        the curve limits) and extrapolated, and the converted flag.
+    """
+    flow_v_curve = line["flow_v"]
+    min_flow_v = flow_v_curve[0]
+    max_flow_v = flow_v_curve[-1]
+    head_last = line["head"][-1]
+    eff_last = line["eff"][-1]
+
+    values = {}
+    inside = flow_v <= max_flow_v
+    flow_at_min_head = (np.log(head_last + np.exp(4 * max_flow_v))) / 4
+    flow_at_min_eff = (np.log(eff_last + np.exp(4 * max_flow_v))) / 4
+    # Extrapolation code for choke region
+    with np.errstate(over="ignore"):
+        choke = np.exp(4 * max_flow_v) - np.exp(4 * flow_v)
+    values["head"] = np.where(
+        inside,
+        interp1d(flow_v_curve, line["head"], fill_value="extrapolate")(flow_v),
+        np.where(flow_v < flow_at_min_head, np.round(head_last + choke, 2), 0.001),
+    )
+    values["eff"] = np.where(
+        inside,
+        interp1d(flow_v_curve, line["eff"], fill_value="extrapolate")(flow_v),
+        np.where(
+            flow_v < flow_at_min_eff,
+            np.round(eff_last + choke, 2),
+            np.round(eff_last, 2),
+        ),
+    )
+
+    values["converted"] = bool(
+        not np.all(
+            np.concatenate(
+                [line[key] for key in _SPEED_LINE_KEYS[3:] if key != "mach_diff"]
+            )
+            == 1
+        )
+        or not np.all(line["mach_diff"] == 0)
+    )
+    # interpolate similarity parameters for converted points
+    if values["converted"]:
+        for key in _SPEED_LINE_KEYS[3:]:
+            values[key] = interp1d(flow_v_curve, line[key], fill_value="extrapolate")(
+                flow_v
+            )
+
+    values["outside"] = (flow_v < min_flow_v) | (max_flow_v < flow_v)
+    values["extrapolated"] = values["outside"] | line["extrapolated"]
+
+    surface = line.get("surface")
+    if surface is not None:
+        # evaluate the points inside the map directly on the surface
+        inside = ~values["outside"]
+        surface_values = surface._evaluate(flow_v[inside], line["speed"].m)
+        keys = ["head", "eff"]
+        if values["converted"]:
+            keys += list(_SPEED_LINE_KEYS[3:])
+        for key in keys:
+            values[key][inside] = surface_values[key]
+    return values
+
+
+def _interp_rows(x, xp, fp):
+    """Linear interpolation (and extrapolation) of each row of fp.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Points to evaluate with shape (n, m).
+    xp : np.ndarray
+        Sorted x coordinates of the data points with shape (n, k), k >= 2.
+    fp : np.ndarray
+        y coordinates of the data points with shape (n, k).
+
+    Returns
+    -------
+    y : np.ndarray
+        Interpolated values with shape (n, m).
+    """
+    idx = (xp[:, None, :] <= x[:, :, None]).sum(axis=2)
+    idx = np.clip(idx, 1, xp.shape[1] - 1)
+    x0 = np.take_along_axis(xp, idx - 1, axis=1)
+    x1 = np.take_along_axis(xp, idx, axis=1)
+    y0 = np.take_along_axis(fp, idx - 1, axis=1)
+    y1 = np.take_along_axis(fp, idx, axis=1)
+    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
 def find_closest_speeds(array, value):
     diff = array - value
     idx = np.abs(diff).argmin()
@@ -1539,30 +2460,86 @@ def find_closest_speeds(array, value):
 
 
 def get_interpolated_values(fac_0, fac_1, flow_0, val_0, flow_1, val_1):
-    x0 = [flow_0, val_0]
-    if fac_0 > 0.5:
-        x0 = [flow_1, val_1]
+    """Interpolate a point between the points of two curves.
 
-    result = fsolve(
-        system_to_interpolate, x0, args=(fac_0, fac_1, flow_0, val_0, flow_1, val_1)
-    )
+    The interpolated point is on the segment between (flow_0, val_0) and
+    (flow_1, val_1), at the fraction fac_0 of the distance from the first point
+    (fac_0 + fac_1 = 1). Arrays can be used to interpolate all points of two
+    curves at once.
 
-    flow_x = result[0]
-    val_x = result[1]
+    Parameters
+    ----------
+    fac_0, fac_1 : float
+        Interpolation factors for the lower and upper curves.
+    flow_0, val_0 : float, np.ndarray
+        Flow and value (e.g. head or eff) of the points on the lower curve.
+    flow_1, val_1 : float, np.ndarray
+        Flow and value of the points on the upper curve.
+
+    Returns
+    -------
+    flow_x, val_x : float, np.ndarray
+        Flow and value of the interpolated points.
+    """
+    flow_x = fac_1 * np.asarray(flow_0) + fac_0 * np.asarray(flow_1)
+    val_x = fac_1 * np.asarray(val_0) + fac_0 * np.asarray(val_1)
 
     return flow_x, val_x
 
 
-def system_to_interpolate(x, *args):
-    fac_0, fac_1, flow_0, val_0, flow_1, val_1 = args
-    if val_1 > val_0:
-        eq_1 = -x[1] + val_0 + (x[0] - flow_0) * (val_1 - val_0) / (flow_1 - flow_0)
-        eq_2 = -fac_0 * (flow_1 - flow_0) + x[0] - flow_0
-    else:
-        eq_1 = -x[1] + val_1 + (flow_1 - x[0]) * (val_0 - val_1) / (flow_1 - flow_0)
-        eq_2 = -fac_1 * (flow_1 - flow_0) + flow_1 - x[0]
+def _interpolate_speed_lines(lines, speed, number_of_points):
+    """Interpolate a speed line between two curves of the map.
+
+    The first number_of_points points of the curves are interpolated with
+    get_interpolated_values (flow, head and eff), and the similarity ratios
+    linearly with the same factors.
+
+    Parameters
+    ----------
+    lines : list
+        Lower and upper curves as dicts with the speed (rad/s) and arrays (SI
+        units) for the keys in _SPEED_LINE_KEYS.
+    speed : float
+        Speed (rad/s) of the interpolated line.
+    number_of_points : int
+        The number of points to be interpolated.
+
+    Returns
+    -------
+    line : dict
+        Arrays for the keys in _SPEED_LINE_KEYS, in the order of the curve
+        points.
+    """
+    speed_range = lines[1]["speed"] - lines[0]["speed"]
+    factor_0 = (speed - lines[0]["speed"]) / speed_range
+    factor_1 = (lines[1]["speed"] - speed) / speed_range
+
+    values = [
+        {key: np.asarray(line[key])[:number_of_points] for key in _SPEED_LINE_KEYS}
+        for line in lines
+    ]
+    flow_v, eff = get_interpolated_values(
+        factor_0,
+        factor_1,
+        values[0]["flow_v"],
+        values[0]["eff"],
+        values[1]["flow_v"],
+        values[1]["eff"],
+    )
+    _, head = get_interpolated_values(
+        factor_0,
+        factor_1,
+        values[0]["flow_v"],
+        values[0]["head"],
+        values[1]["flow_v"],
+        values[1]["head"],
+    )
 
-    return [eq_1, eq_2]
+    line = dict(flow_v=flow_v, head=head, eff=eff)
+    for key in _SPEED_LINE_KEYS[3:]:
+        line[key] = factor_1 * values[0][key] + factor_0 * values[1][key]
+
+    return line
 
 
 def calculate_power_losses(power_losses_ref, speed_ref, speed):
@@ -1603,19 +2580,134 @@ def impeller_example():
     return imp
 
 
+# values of the original point used by Point.convert_from
+_CONVERT_UNITS = {
+    "speed": "rad/s",
+    "power_losses": "W",
+    "eff": "dimensionless",
+    "phi": "dimensionless",
+    "psi": "dimensionless",
+    "volume_ratio": "dimensionless",
+    "b": "m",
+    "D": "m",
+    "phi_ratio": "dimensionless",
+    "psi_ratio": "dimensionless",
+    "reynolds_ratio": "dimensionless",
+    "mach_diff": "dimensionless",
+    "volume_ratio_ratio": "dimensionless",
+    "reynolds": "dimensionless",
+    "mach": "dimensionless",
+}
+# values of the converted point, which define it without solving it again
+_CONVERTED_UNITS = {
+    **_CONVERT_UNITS,
+    "flow_v": "m³/s",
+    "flow_m": "kg/s",
+    "head": "J/kg",
+    "power": "W",
+    "power_shaft": "W",
+    "torque": "N*m",
+}
+
+
+def _conversion_key(cls, original_impeller, suc, find, speed, method):
+    """Key for Impeller.conversion_cache.
+
+    The original maps are identified by the values of their points that are
+    used in the conversion (see _CONVERT_UNITS) and their suction states.
+    """
+    digits = max(int(round(-np.log10(ccp.config.CONVERSION_CACHE_RTOL))), 1)
+
+    def rounded(values):
+        return tuple(float(f"{value:.{digits}e}") for value in values)
+
+    def state_key(state):
+        return (
+            state.backend_name(),
+            state.phase,
+            tuple(state.fluid),
+            rounded(state.fluid.values()),
+            rounded([state._p_si(), state._T_si()]),
+        )
+
+    impellers = original_impeller
+    if not isinstance(impellers, list):
+        impellers = [impellers]
+    maps = tuple(
+        tuple(
+            (state_key(p.suc), rounded(_point_values(p, _CONVERT_UNITS).values()))
+            for p in impeller.points
+        )
+        for impeller in impellers
+    )
+    if isinstance(speed, Q_):
+        speed = speed.to("rad/s").m
+    if speed is not None and not isinstance(speed, str):
+        speed = rounded([speed])[0]
+    return (
+        cls.__qualname__,
+        maps,
+        state_key(suc),
+        find,
+        speed,
+        method,
+        ccp.config.POLYTROPIC_METHOD,
+        tuple(versions().items()),
+    )
+
+
+def _point_values(point, units):
+    """Magnitudes of the point attributes in units."""
+    return {key: getattr(point, key).to(unit).m for key, unit in units.items()}
+
+
+def _point_from_values(values, suc, disch):
+    """Point defined by the values returned by converter and its states.
+
+    All the variables of the point are given, so the point solver has nothing
+    to calculate and no flash is needed.
+    """
+    values = {key: Q_(value, _CONVERTED_UNITS[key]) for key, value in values.items()}
+    reynolds = values.pop("reynolds")
+    mach = values.pop("mach")
+    point = Point(suc=suc, disch=disch, **values)
+    point.reynolds = reynolds
+    point.mach = mach
+    return point
+
+
 def converter(x):
-    """Helper function used to parallelize conversion of points."""
+    """Helper function used to parallelize conversion of curves.
+
+    The task x is a tuple (curve_values, suc, find, speed), where curve_values
+    is a list with the magnitudes of the original points of a curve (see
+    _CONVERT_UNITS, or _CONVERTED_UNITS in the second conversion stage). The
+    points are converted with Point.convert_many and each converted point is
+    returned as the magnitudes of its values (see _CONVERTED_UNITS) and its
+    discharge state, so that only floats and states are sent between the
+    processes.
+    """
     import traceback
 
-    point, suc, find = x
+    curve_values, suc, find, speed = x
     try:
-        return Point.convert_from(point, suc=suc, find=find)
+        original_points = [
+            SimpleNamespace(
+                **{
+                    key: Q_(value, _CONVERTED_UNITS[key])
+                    for key, value in values.items()
+                }
+            )
+            for values in curve_values
+        ]
+        points = Point.convert_many(original_points, suc=suc, find=find, speed=speed)
+        return [(_point_values(p, _CONVERTED_UNITS), p.disch) for p in points]
     except Exception as e:
         # Print full traceback before re-raising
         print(f"\n{'=' * 60}")
         print(f"ERROR in converter function (multiprocessing worker):")
         print(f"{'=' * 60}")
-        print(f"Point: {point}")
+        print(f"Points: {curve_values}")
         print(f"Suc: {suc}")
         print(f"Find: {find}")
         print(f"\nFull traceback:")
@@ -1624,6 +2716,17 @@ def converter(x):
         raise
 
 
+def _create_points(pool, args_list, progress=False):
+    """Create points from a list of Point arguments with a pool."""
+    return list(
+        tqdm(
+            pool.imap(create_points_parallel, args_list),
+            total=len(args_list),
+            disable=not progress,
+        )
+    )
+
+
 def create_points_parallel(x):
     """Helper function used to parallelize creation of points."""
     return Point(**x)
@@ -1666,67 +2769,37 @@ def interpolate_between_curves(
         current_curve : list
             List with the interpolated points.
     """
-    # calculate factor
-    speed_range = curves[1].speed.m - curves[0].speed.m
-    factor_0 = (speed.m - curves[0].speed.m) / speed_range
-    factor_1 = (curves[1].speed.m - speed.m) / speed_range
-
-    current_curve = []
-
-    for i in range(number_of_points):
-        flow_eff, eff = get_interpolated_values(
-            factor_0,
-            factor_1,
-            curves[0][i].flow_v.magnitude,
-            curves[0][i].eff.m,
-            curves[1][i].flow_v.magnitude,
-            curves[1][i].eff.m,
-        )
-        flow_head, head = get_interpolated_values(
-            factor_0,
-            factor_1,
-            curves[0][i].flow_v.magnitude,
-            curves[0][i].head.m,
-            curves[1][i].flow_v.magnitude,
-            curves[1][i].head.m,
-        )
-
-        phi_ratio = (
-            factor_1 * curves[0][i].phi_ratio + factor_0 * curves[1][i].phi_ratio
-        )
-        psi_ratio = (
-            factor_1 * curves[0][i].psi_ratio + factor_0 * curves[1][i].psi_ratio
-        )
-        volume_ratio_ratio = (
-            factor_1 * curves[0][i].volume_ratio_ratio
-            + factor_0 * curves[1][i].volume_ratio_ratio
-        )
-        reynolds_ratio = (
-            factor_1 * curves[0][i].reynolds_ratio
-            + factor_0 * curves[1][i].reynolds_ratio
-        )
-        mach_diff = (
-            factor_1 * curves[0][i].mach_diff + factor_0 * curves[1][i].mach_diff
-        )
+    lines = [
+        {
+            "speed": curve.speed.m,
+            **{
+                key: np.array([getattr(p, key).m for p in curve.points])
+                for key in _SPEED_LINE_KEYS
+            },
+        }
+        for curve in curves
+    ]
+    line = _interpolate_speed_lines(lines, speed.m, number_of_points)
 
-        p = Point(
+    current_curve = [
+        Point(
             suc=p0.suc,
-            head=head,
-            eff=eff,
-            flow_v=(flow_eff + flow_head) / 2,
+            head=line["head"][i],
+            eff=line["eff"][i],
+            flow_v=line["flow_v"][i],
             speed=speed,
             power_losses=power_losses,
             b=p0.b,
             D=p0.D,
-            phi_ratio=phi_ratio,
-            psi_ratio=psi_ratio,
-            volume_ratio_ratio=volume_ratio_ratio,
-            reynolds_ratio=reynolds_ratio,
-            mach_diff=mach_diff,
+            phi_ratio=line["phi_ratio"][i],
+            psi_ratio=line["psi_ratio"][i],
+            volume_ratio_ratio=line["volume_ratio_ratio"][i],
+            reynolds_ratio=line["reynolds_ratio"][i],
+            mach_diff=line["mach_diff"][i],
             extrapolated=extrapolated,
         )
-
-        current_curve.append(p)
+        for i in range(number_of_points)
+    ]
 
     return current_curve
 
@@ -1755,46 +2828,31 @@ def extrapolated_curve(curve, speed, number_of_points, p0, power_losses, extrapo
         current_curve : list
             List with the extrapolated points.
     """
-    current_curve = []
-
-    for i in range(number_of_points):
-        flow_v = (speed.m / curve.speed.m) * curve[i].flow_v.m
-        head = ((speed.m / curve.speed.m) ** 2) * curve[i].head.m
-        eff = curve[i].eff.m
-
-        p_i = Point(
-            suc=p0.suc,
-            head=head,
-            eff=eff,
-            flow_v=flow_v,
-            speed=speed,
-            power_losses=power_losses,
-            b=p0.b,
-            D=p0.D,
-        )
-
-        phi_ratio = p_i.phi / curve[i].phi
-        psi_ratio = p_i.psi / curve[i].psi
-        reynolds_ratio = p_i.reynolds / curve[i].reynolds
-        mach_diff = p_i.mach - curve[i].mach
-        volume_ratio_ratio = p_i.volume_ratio / curve[i].volume_ratio
+    points = curve.points[:number_of_points]
+    speed_ratio = speed.m / curve.speed.m
+    flow_v = speed_ratio * np.array([p.flow_v.m for p in points])
+    head = speed_ratio**2 * np.array([p.head.m for p in points])
+    eff = np.array([p.eff.m for p in points])
 
+    current_curve = []
+    for i, point in enumerate(points):
         p = Point(
             suc=p0.suc,
-            head=head,
-            eff=eff,
-            flow_v=flow_v,
+            head=head[i],
+            eff=eff[i],
+            flow_v=flow_v[i],
             speed=speed,
             power_losses=power_losses,
             b=p0.b,
             D=p0.D,
-            phi_ratio=phi_ratio,
-            psi_ratio=psi_ratio,
-            volume_ratio_ratio=volume_ratio_ratio,
-            reynolds_ratio=reynolds_ratio,
-            mach_diff=mach_diff,
             extrapolated=extrapolated,
         )
+        # similarity ratios relative to the point on the original curve
+        p.phi_ratio = p.phi / point.phi
+        p.psi_ratio = p.psi / point.psi
+        p.reynolds_ratio = p.reynolds / point.reynolds
+        p.mach_diff = p.mach - point.mach
+        p.volume_ratio_ratio = p.volume_ratio / point.volume_ratio
 
         current_curve.append(p)
 
@@ -1,4 +1,5 @@
 from copy import copy
+from types import SimpleNamespace
 
 import numpy as np
 import pandas as pd
@@ -9,7 +10,7 @@ from scipy.optimize import brentq, newton
 import ccp.config
 from ccp.config.units import Q_, check_units
 from ccp.config.utilities import r_getattr
-from ccp.data_io.serializers import Serializable
+from ccp.data_io.serializers import Serializable, versions
 
 from .state import State
 
@@ -227,8 +228,10 @@ class Point(Serializable):
         self.convection_constant = convection_constant
         self.casing_heat_loss = None
 
-        # dummy state used to avoid copying states
-        self._dummy_state = copy(self.suc)
+        # lazily evaluated attributes (see the properties below)
+        self._disch_s = None
+        self._reynolds = None
+        self._mach = None
 
         kwargs_dict = {}
         reasonable_ranges = {
@@ -300,8 +303,6 @@ class Point(Serializable):
                 f"{out_of_range_dict}."
             )
 
-        self.reynolds = reynolds(self.suc, self.speed, self.b, self.D)
-        self.mach = mach(self.suc, self.speed, self.D)
         if phi_ratio is None:
             self.phi_ratio = Q_(1.0, "dimensionless")
         else:
@@ -328,14 +329,63 @@ class Point(Serializable):
         self._add_point_plot()
 
     def _add_point_plot(self):
-        """Add plot to point after point is fully defined."""
+        """Add plot to point after point is fully defined.
+
+        The plot functions are created on access: point.head_plot is resolved by
+        Point.__getattr__ and point.disch.T_plot by State.__getattr__, through a
+        reference to the point stored in the state. As with the plot functions
+        previously attached here, a state shared by several points plots the last
+        point created with it.
+        """
         for state in ["suc", "disch"]:
-            for attr in ["p", "T", "h", "s", "rho"]:
-                plot = plot_func(self, ".".join([state, attr]))
-                setattr(getattr(self, state), attr + "_plot", plot)
-        for attr in ["head", "eff", "power", "power_shaft", "torque"]:
-            plot = plot_func(self, attr)
-            setattr(self, attr + "_plot", plot)
+            getattr(self, state)._plot_owner = (self, state)
+
+    def __getattr__(self, name):
+        attr, _, suffix = name.rpartition("_")
+        if suffix == "plot" and attr in [
+            "head",
+            "eff",
+            "power",
+            "power_shaft",
+            "torque",
+        ]:
+            return plot_func(self, attr)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    @property
+    def _dummy_state(self):
+        """State used to avoid copying states, created on first use."""
+        if self._disch_s is None:
+            self._disch_s = copy(self.suc)
+        return self._disch_s
+
+    @_dummy_state.setter
+    def _dummy_state(self, value):
+        self._disch_s = value
+
+    @property
+    def reynolds(self):
+        """Reynolds number (dimensionless), calculated on first access."""
+        if self._reynolds is None:
+            self._reynolds = reynolds(self.suc, self.speed, self.b, self.D)
+        return self._reynolds
+
+    @reynolds.setter
+    def reynolds(self, value):
+        self._reynolds = value
+
+    @property
+    def mach(self):
+        """Mach number (dimensionless), calculated on first access."""
+        if self._mach is None:
+            self._mach = mach(self.suc, self.speed, self.D)
+        return self._mach
+
+    @mach.setter
+    def mach(self, value):
+        self._mach = value
 
     def __str__(self):
         return (
@@ -508,28 +558,221 @@ class Point(Serializable):
 
         return converted_point
 
+    @classmethod
+    @check_units
+    def convert_many(
+        cls,
+        original_points,
+        suc=None,
+        find="speed",
+        speed=None,
+        reynolds_correction=False,
+        **kwargs,
+    ):
+        """Convert several points to the same suction state.
+
+        Equivalent to calling :meth:`convert_from` for each point, with the work
+        that depends only on the suction state done once:
+
+        - the suction density, viscosity and speed of sound are evaluated once
+          and the Reynolds and Mach numbers of all points are calculated as
+          arrays;
+        - the ASME PTC 10 2022 Reynolds corrections are calculated as arrays;
+        - the discharge state of each point is solved starting from the
+          discharge of the previous point with the same original speed
+          (neighbouring point on the same speed line).
+
+        Parameters
+        ----------
+        original_points : list
+            List with the ccp.Point objects to be converted, preferably sorted
+            by flow along each speed line.
+        suc : ccp.State
+            New suction state.
+        find : str, optional
+            Parameter to be calculated (see :meth:`convert_from`).
+            Options are "speed" or "volume_ratio", default is "speed".
+        speed : float, pint.Quantity, array, optional
+            Desired speed, a single value or one value per point. If
+            find="speed", this should be None.
+        reynolds_correction : bool, str, optional
+            Reynolds correction applied during the conversion
+            (see :meth:`convert_from`).
+
+        Returns
+        -------
+        converted_points : list
+            List with the converted ccp.Point objects.
+        """
+        original_points = list(original_points)
+        if not original_points:
+            return []
+
+        def array(attr, units):
+            return Q_([getattr(p, attr).to(units).m for p in original_points], units)
+
+        original_speed = array("speed", "rad/s")
+        if speed is None:
+            speed = original_speed
+        else:
+            speed = Q_(
+                np.broadcast_to(speed.to("rad/s").m, len(original_points)), "rad/s"
+            )
+        b = array("b", "m")
+        D = array("D", "m")
+        eff = array("eff", "dimensionless")
+        psi = array("psi", "dimensionless")
+        phi = array("phi", "dimensionless")
+        volume_ratio = array("volume_ratio", "dimensionless")
+        power_losses = (
+            array("power_losses", "W") * (speed / original_speed) ** 2.5
+        ).to("W")
+
+        eff_converted = eff
+        psi_converted = psi
+        phi_converted = phi
+        if reynolds_correction == "ptc1997":
+            corrections = np.array(
+                [
+                    [
+                        _si(c, "dimensionless")
+                        for c in correct_reynolds_1997(suc, speed_i, p)
+                    ]
+                    for speed_i, p in zip(speed, original_points)
+                ]
+            ).T
+        elif reynolds_correction == "ptc2022" or reynolds_correction is True:
+            corrections = correct_reynolds_2022(
+                suc,
+                speed,
+                SimpleNamespace(
+                    surface_roughness=array("surface_roughness", "m"),
+                    b=b,
+                    D=D,
+                    reynolds=array("reynolds", "dimensionless"),
+                    eff=eff,
+                ),
+            )
+        else:
+            corrections = None
+        if corrections is not None:
+            rem_corr_eff, rem_corr_psi, rem_corr_phi = corrections
+            eff_converted = rem_corr_eff * eff
+            psi_converted = rem_corr_psi * psi
+            phi_converted = rem_corr_phi * phi
+
+        polytropic_method = kwargs.get("polytropic_method")
+        if polytropic_method is None:
+            polytropic_method = ccp.config.POLYTROPIC_METHOD
+        eff_calc_func = globals()[f"eff_pol_{polytropic_method}"]
+        disch_rho = suc.rho() * volume_ratio
+        u = u_calc(D, speed)
+
+        converted_points = []
+        # discharge of the last converted point of each speed line
+        line_disch = {}
+        for i in range(len(original_points)):
+            options = dict(
+                suc=suc,
+                eff=eff_converted[i],
+                power_losses=power_losses[i],
+                phi=phi_converted[i],
+                psi=psi_converted[i],
+                b=b[i],
+                D=D[i],
+                **kwargs,
+            )
+            line = original_speed[i].m
+            previous_disch = line_disch.get(line)
+            if find == "speed":
+                options["volume_ratio"] = volume_ratio[i]
+                if previous_disch is not None:
+                    options["disch"] = disch_from_suc_rho_eff(
+                        suc,
+                        disch_rho[i],
+                        eff_converted[i],
+                        eff_calc_func,
+                        T0=previous_disch._T_si(),
+                    )
+            else:
+                options["speed"] = speed[i]
+                if previous_disch is not None:
+                    options["head"] = (psi_converted[i] * u[i] ** 2 / 2).to("J/kg")
+                    options["disch"] = disch_from_suc_head_eff(
+                        suc,
+                        options["head"],
+                        eff_converted[i],
+                        polytropic_method=polytropic_method,
+                        p0=previous_disch._p_si(),
+                    )
+            converted_point = cls(**options)
+            line_disch[line] = converted_point.disch
+            converted_points.append(converted_point)
+
+        converted_speed = Q_([p.speed.to("rad/s").m for p in converted_points], "rad/s")
+        converted_reynolds = reynolds(suc, converted_speed, b, D)
+        converted_mach = mach(suc, converted_speed, D)
+        for i, (converted_point, original_point) in enumerate(
+            zip(converted_points, original_points)
+        ):
+            converted_point.reynolds = converted_reynolds[i]
+            converted_point.mach = converted_mach[i]
+            # ratios as in convert_from
+            converted_point.phi_ratio = (
+                converted_point.phi / original_point.phi
+            ) * original_point.phi_ratio
+            converted_point.psi_ratio = (
+                converted_point.psi / original_point.psi
+            ) * original_point.psi_ratio
+            converted_point.volume_ratio_ratio = (
+                converted_point.volume_ratio / original_point.volume_ratio
+            ) * original_point.volume_ratio_ratio
+            converted_point.reynolds_ratio = (
+                converted_point.reynolds / original_point.reynolds
+            ) * original_point.reynolds_ratio
+            converted_point.mach_diff = (
+                converted_point.mach - original_point.mach
+            ) + original_point.mach_diff
+
+        return converted_points
+
     def __getstate__(self):
-        attributes = self.__dict__.copy()
+        attributes = {k: v for k, v in self.__dict__.items() if k != "_disch_s"}
         final_attributes = {k: v for k, v in attributes.items() if "plot" not in k}
 
         return final_attributes
 
     def __setstate__(self, state):
-        self.__dict__ = state
+        self._disch_s = None
+        self._reynolds = None
+        self._mach = None
+        # older pickles store reynolds, mach and _dummy_state in the instance dict
+        for k, v in state.items():
+            setattr(self, k, v)
         self._add_point_plot()
 
-    def to_dict(self):
+    def to_dict(self, full=False):
         """Return a dict representation of the point.
 
         Quantities are converted to strings (e.g. "100000.0 pascal") so that
         the dict can be serialized to formats such as toml or json.
 
+        Parameters
+        ----------
+        full : bool, optional
+            If True, the values derived when the point was calculated (discharge
+            state, power, similarity numbers etc.) are also stored in a
+            "derived" key, with the library versions (ccp.data_io.serializers.
+            versions) in a "versions" key. :meth:`from_dict` then recreates the
+            point without solving it if the versions match.
+            Default is False.
+
         Returns
         -------
         dict
             Dict with the parameters that define the point.
         """
-        return dict(
+        point_dict = dict(
             p=str(self.suc.p()),
             T=str(self.suc.T()),
             fluid=self.suc.fluid,
@@ -549,6 +792,14 @@ class Point(Serializable):
             volume_ratio_ratio=str(self.volume_ratio_ratio),
             extrapolated=str(self._extrapolated),
         )
+        if full:
+            point_dict["derived"] = {
+                "disch_p": str(self.disch.p()),
+                "disch_T": str(self.disch.T()),
+                **{attr: str(getattr(self, attr)) for attr in _DERIVED_ATTRIBUTES},
+            }
+            point_dict["versions"] = versions()
+        return point_dict
 
     @classmethod
     def from_dict(cls, dict_parameters):
@@ -566,6 +817,10 @@ class Point(Serializable):
         """
         dict_parameters = dict(dict_parameters)
         dict_parameters.pop("ccp_version", None)
+        derived = dict_parameters.pop("derived", None)
+        if dict_parameters.pop("versions", None) != versions():
+            # derived values from other library versions are recalculated
+            derived = None
         phase = dict_parameters.pop("phase", None)
         # backwards compatibility: older files store no phase, newer ones may
         # store the string "None" when no phase was forced.
@@ -582,12 +837,36 @@ class Point(Serializable):
         if isinstance(extrapolated, str):
             extrapolated = extrapolated.lower() == "true"
         polytropic_method = dict_parameters.pop("polytropic_method", None)
+        kwargs = {k: Q_(v) for k, v in dict_parameters.items()}
+
+        if derived is not None:
+            # with every value given the point solver has nothing to calculate
+            derived = {k: Q_(v) for k, v in derived.items()}
+            disch = State(
+                p=derived.pop("disch_p"),
+                T=derived.pop("disch_T"),
+                fluid=suc.fluid,
+                phase=phase,
+            )
+            reynolds = derived.pop("reynolds")
+            mach = derived.pop("mach")
+            point = cls(
+                suc=suc,
+                disch=disch,
+                extrapolated=extrapolated,
+                polytropic_method=polytropic_method,
+                **kwargs,
+                **derived,
+            )
+            point.reynolds = reynolds
+            point.mach = mach
+            return point
 
         return cls(
             suc=suc,
             extrapolated=extrapolated,
             polytropic_method=polytropic_method,
-            **{k: Q_(v) for k, v in dict_parameters.items()},
+            **kwargs,
         )
 
     def mach_limits(self, mmsp=None):
@@ -2156,6 +2435,285 @@ def eff_pol_huntington(suc, disch, disch_s=None):
     return eff
 
 
+def _si(value, units):
+    """Magnitude of value in the given units (floats are taken as SI)."""
+    if isinstance(value, Q_):
+        return value.to(units).magnitude
+    return value
+
+
+# Unitless kernels of the polytropic head functions. They use the float
+# accessors of ccp.State and are used by the discharge solvers, where the
+# head is evaluated at every iteration.
+
+
+def _n_exp_si(suc, disch):
+    return np.log(disch._p_si() / suc._p_si()) / np.log(disch._rho_si() / suc._rho_si())
+
+
+def _head_pol_si(suc, disch):
+    n = _n_exp_si(suc, disch)
+    return (n / (n - 1)) * (
+        disch._p_si() / disch._rho_si() - suc._p_si() / suc._rho_si()
+    )
+
+
+def _head_pol_schultz_si(suc, disch, disch_s=None):
+    if disch_s is None:
+        disch_s = copy(disch)
+    disch_s.update(p=disch._p_si(), s=suc._s_si())
+    f = (disch_s._h_si() - suc._h_si()) / _head_pol_si(suc, disch_s)
+    return f * _head_pol_si(suc, disch)
+
+
+def _head_pol_mallen_saville_si(suc, disch, disch_s=None):
+    Ts = suc._T_si()
+    Td = disch._T_si()
+    return (disch._h_si() - suc._h_si()) - (disch._s_si() - suc._s_si()) * (
+        Td - Ts
+    ) / np.log(Td / Ts)
+
+
+def _head_pol_sandberg_colby_si(suc, disch, disch_s=None):
+    Tm = (suc._T_si() + disch._T_si()) / 2
+    return (disch._h_si() - suc._h_si()) - Tm * (disch._s_si() - suc._s_si())
+
+
+def _head_pol_sandberg_colby_f_si(suc, disch, disch_s=None):
+    Tm = (suc._T_si() + disch._T_si()) / 2
+    f = ((disch._h_si() - suc._h_si()) - Tm * (disch._s_si() - suc._s_si())) / (
+        _head_pol_si(suc, disch)
+    )
+    return f * _head_pol_si(suc, disch)
+
+
+_HEAD_KERNELS = {
+    "schultz": _head_pol_schultz_si,
+    "mallen_saville": _head_pol_mallen_saville_si,
+    "sandberg_colby": _head_pol_sandberg_colby_si,
+    "sandberg_colby_f": _head_pol_sandberg_colby_f_si,
+}
+
+
+def _head_kernel(polytropic_method):
+    """Float version of head_pol_<polytropic_method> (J/kg).
+
+    Methods without a dedicated kernel wrap the pint function.
+    """
+    try:
+        return _HEAD_KERNELS[polytropic_method]
+    except KeyError:
+        head_calc_func = globals()[f"head_pol_{polytropic_method}"]
+
+        def kernel(suc, disch, disch_s=None):
+            return head_calc_func(suc, disch).to("joule/kilogram").magnitude
+
+        return kernel
+
+
+def _eff_kernel(polytropic_method):
+    """Float version of eff_pol_<polytropic_method> (dimensionless)."""
+    head_kernel = _head_kernel(polytropic_method)
+
+    def kernel(suc, disch, disch_s=None):
+        return head_kernel(suc, disch, disch_s) / (disch._h_si() - suc._h_si())
+
+    return kernel
+
+
+# values stored by Point.to_dict(full=True), besides the discharge state
+_DERIVED_ATTRIBUTES = (
+    "flow_m",
+    "volume_ratio",
+    "power",
+    "power_shaft",
+    "torque",
+    "phi",
+    "psi",
+    "reynolds",
+    "mach",
+)
+
+
+_ARRAY_UNITS = {
+    "p": "pascal",
+    "T": "kelvin",
+    "h": "joule/kilogram",
+    "s": "joule/(kelvin kilogram)",
+    "rho": "kilogram/m**3",
+    "z": "dimensionless",
+}
+
+
+def performance_arrays(
+    suc,
+    disch,
+    fluid=None,
+    flow_m=None,
+    polytropic_method=None,
+    EOS=None,
+    phase=None,
+):
+    """Polytropic head, efficiency and power for arrays of states.
+
+    Array version of the head/efficiency functions of this module, intended to
+    reduce operating data time series without creating ccp.State or ccp.Point
+    objects. The suction and discharge properties are given as columns, such as
+    the dictionaries returned by ccp.State.flash_batch.
+
+    Parameters
+    ----------
+    suc, disch : dict
+        Dictionaries with arrays (pint.Quantity or floats in SI units) for
+        "p", "T", "h", "s" and "rho". The huntington method also needs "z".
+    fluid : dict, optional
+        Dictionary with constituent and composition. Needed for the methods that
+        require additional flash calculations (schultz and huntington) and to
+        calculate the isentropic head.
+    flow_m : array_like, pint.Quantity, optional
+        Mass flow (kg/s). If given, the power is also returned.
+    polytropic_method : str, optional
+        One of "schultz", "mallen_saville", "sandberg_colby", "sandberg_colby_f"
+        or "huntington". Default is set in ccp.config.POLYTROPIC_METHOD.
+    EOS : str, optional
+        Equation of state used for the additional flash calculations.
+    phase : str, optional
+        Phase imposed to the additional flash calculations.
+
+    Returns
+    -------
+    results : dict
+        Dictionary with arrays (pint.Quantity) for "n_exp", "head", "eff" and,
+        if fluid is given, "head_isentropic" and "eff_isentropic". "power" is
+        included if flow_m is given. If ccp.config.RAW_SI is True the arrays are
+        plain numpy arrays in SI units.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> from ccp.point import performance_arrays
+    >>> fluid = {"co2": 0.8, "n2": 0.2}
+    >>> suc = ccp.State.flash_batch(p=[1e5, 1e5], T=300, fluid=fluid)
+    >>> disch = ccp.State.flash_batch(p=[3e5, 4e5], T=[400, 440], fluid=fluid)
+    >>> results = performance_arrays(suc, disch, fluid=fluid, flow_m=1.0)
+    >>> results["eff"].m.round(3)
+    array([0.853, 0.795])
+    """
+    if polytropic_method is None:
+        polytropic_method = ccp.config.POLYTROPIC_METHOD
+
+    suc = {
+        k: np.asarray(_si(v, _ARRAY_UNITS[k]))
+        for k, v in suc.items()
+        if k in _ARRAY_UNITS
+    }
+    disch = {
+        k: np.asarray(_si(v, _ARRAY_UNITS[k]))
+        for k, v in disch.items()
+        if k in _ARRAY_UNITS
+    }
+    p1, T1, h1, s1, rho1 = (suc[k] for k in ("p", "T", "h", "s", "rho"))
+    p2, T2, h2, s2, rho2 = (disch[k] for k in ("p", "T", "h", "s", "rho"))
+    dh = h2 - h1
+
+    def head_pol_arrays(p2, rho2):
+        n = np.log(p2 / p1) / np.log(rho2 / rho1)
+        return n, (n / (n - 1)) * (p2 / rho2 - p1 / rho1)
+
+    n, head_pol_ = head_pol_arrays(p2, rho2)
+    results = {"n_exp": n}
+
+    if fluid is not None:
+        disch_s = State.flash_batch(
+            p=p2, s=s1, fluid=fluid, EOS=EOS, phase=phase, properties=["h", "rho"]
+        )
+        h2s = _si(disch_s["h"], "joule/kilogram")
+        _, head_s = head_pol_arrays(p2, _si(disch_s["rho"], "kilogram/m**3"))
+
+    if polytropic_method == "schultz":
+        if fluid is None:
+            raise ValueError("fluid is needed for the schultz method.")
+        head = (h2s - h1) / head_s * head_pol_
+    elif polytropic_method == "mallen_saville":
+        head = dh - (s2 - s1) * (T2 - T1) / np.log(T2 / T1)
+    elif polytropic_method in ("sandberg_colby", "sandberg_colby_f"):
+        # f_sandberg_colby * head_pol reduces to the sandberg_colby head
+        head = dh - (T1 + T2) / 2 * (s2 - s1)
+    elif polytropic_method == "huntington":
+        if fluid is None:
+            raise ValueError("fluid is needed for the huntington method.")
+        head = dh * _eff_pol_huntington_arrays(suc, disch, fluid, EOS, phase)
+    else:
+        raise ValueError(
+            f"Polytropic method {polytropic_method} not available for arrays."
+        )
+    results["head"] = head
+    results["eff"] = head / dh
+
+    if fluid is not None:
+        results["head_isentropic"] = head_s
+        results["eff_isentropic"] = head_s / dh
+
+    if flow_m is not None:
+        results["power"] = np.asarray(_si(flow_m, "kilogram/second")) * dh
+
+    if ccp.config.RAW_SI:
+        return results
+
+    array_units = {
+        "n_exp": "dimensionless",
+        "head": "joule/kilogram",
+        "eff": "dimensionless",
+        "head_isentropic": "joule/kilogram",
+        "eff_isentropic": "dimensionless",
+        "power": "watt",
+    }
+    return {k: Q_(v, array_units[k]) for k, v in results.items()}
+
+
+def _eff_pol_huntington_arrays(suc, disch, fluid, EOS=None, phase=None):
+    """Array version of eff_pol_huntington (floats in SI units)."""
+    p1, T1, s1, z1 = (suc[k] for k in ("p", "T", "s", "z"))
+    p2, T2, s2, z2 = (disch[k] for k in ("p", "T", "s", "z"))
+    p3 = np.sqrt(p1 * p2)
+    pr = p2 / p1
+    log_pr = np.log(pr)
+
+    T3 = np.sqrt(T1 * T2)
+    for _ in range(100):
+        state3 = State.flash_batch(
+            p=p3,
+            T=T3,
+            fluid=fluid,
+            EOS=EOS,
+            phase=phase,
+            properties=["s", "z", "cp"],
+        )
+        s3 = _si(state3["s"], "joule/(kelvin kilogram)")
+        z3 = _si(state3["z"], "dimensionless")
+        cp3 = _si(state3["cp"], "joule/(kelvin kilogram)")
+        b = (z1 + z2 - 2 * z3) / (np.sqrt(pr) - 1) ** 2
+        a = z1 - b
+        c = (z2 - a - b * pr) / log_pr
+        s3_ = s1 + (s2 - s1) * (
+            ((a / 2) * log_pr + b * (np.sqrt(pr) - 1) + (c / 8) * log_pr**2)
+            / (a * log_pr + b * (pr - 1) + (c / 2) * log_pr**2)
+        )
+        T3_new = T3 * np.exp((s3_ - s3) / cp3)
+        error = np.nanmax(np.abs(T3_new - T3), initial=0)
+        T3 = T3_new
+        if error <= 1e-10:
+            break
+    else:
+        raise RecursionError("Maximum number of iterations exceeded.")
+
+    # R / M from the compressibility factor definition z = p M / (rho R T)
+    R = p1 / (suc["rho"] * z1 * T1)
+    inv_e = 1 + ((s2 - s1) / R) / (a * log_pr + b * (pr - 1) + (c / 2) * log_pr**2)
+
+    return 1 / inv_e
+
+
 @check_units
 def power_calc(flow_m, head, eff):
     """Calculate power.
@@ -2425,7 +2983,7 @@ def isentropic_disch_from_rho(suc, disch_rho):
     return disch
 
 
-def disch_from_suc_rho_eff(suc, disch_rho, eff, eff_calc_func):
+def disch_from_suc_rho_eff(suc, disch_rho, eff, eff_calc_func, T0=None):
     """Discharge at a fixed density matching a polytropic efficiency.
 
     Robust alternative to the secant iteration used in the volume-ratio conversion.
@@ -2446,19 +3004,43 @@ def disch_from_suc_rho_eff(suc, disch_rho, eff, eff_calc_func):
         Target polytropic efficiency.
     eff_calc_func : callable
         ``eff_calc_func(suc, disch)`` returning the polytropic efficiency.
+    T0 : pint.Quantity, float, optional
+        Initial guess for the discharge temperature (K), e.g. the discharge of a
+        neighbouring point. If given, a secant iteration started at T0 is tried
+        first and the bracketed solve is only used if it does not converge.
 
     Returns
     -------
     disch : ccp.State
         Discharge state.
     """
-    disch = isentropic_disch_from_rho(suc, disch_rho)
-    T_lo = disch.T().to("kelvin").magnitude
 
     def eff_err(T):
         disch.update(rho=disch_rho, T=Q_(T, "kelvin"))
         return (eff_calc_func(suc, disch) - eff).magnitude
 
+    if T0 is not None:
+        T0 = _si(T0, "kelvin")
+        disch = State(
+            rho=disch_rho, T=Q_(T0, "kelvin"), fluid=suc.fluid, phase=suc.phase
+        )
+
+        def eff_err_secant(T):
+            disch.update(rho=disch_rho, T=Q_(T, "kelvin"))
+            new_eff = eff_calc_func(suc, disch)
+            if not 0.0 < new_eff < 1.5:
+                raise ValueError("Efficiency did not converge")
+            return (new_eff - eff).magnitude
+
+        try:
+            newton(eff_err_secant, T0, tol=1e-1)
+            return disch
+        except (ValueError, RuntimeError):
+            pass
+
+    disch = isentropic_disch_from_rho(suc, disch_rho)
+    T_lo = disch.T().to("kelvin").magnitude
+
     f_lo = eff_err(T_lo)
     T_hi = T_lo * 1.02
     for _ in range(80):
@@ -2473,7 +3055,7 @@ def disch_from_suc_rho_eff(suc, disch_rho, eff, eff_calc_func):
     return disch
 
 
-def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
+def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None, p0=None):
     """Calculate discharge state from suction, head and efficiency.
 
     Parameters
@@ -2484,6 +3066,9 @@ def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
         Polytropic head (J/kg).
     eff : pint.Quantity, float
         Polytropic efficiency (dimensionless).
+    p0 : pint.Quantity, float, optional
+        Initial guess for the discharge pressure (Pa), e.g. the discharge of a
+        neighbouring point. Default is the pressure of the isentropic discharge.
 
     Returns
     -------
@@ -2493,27 +3078,32 @@ def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
-    head_calc_func = globals()[f"head_pol_{polytropic_method}"]
-    h_disch = head / eff + suc.h()
+    head_kernel = _head_kernel(polytropic_method)
+    head = _si(head, "joule/kilogram")
+    eff = _si(eff, "dimensionless")
+    h_disch = head / eff + suc._h_si()
 
-    #  consider first an isentropic compression
-    disch = State(h=h_disch, s=suc.s(), fluid=suc.fluid, phase=suc.phase)
+    if p0 is None:
+        #  consider first an isentropic compression
+        disch = State(h=h_disch, s=suc._s_si(), fluid=suc.fluid, phase=suc.phase)
+    else:
+        disch = State(h=h_disch, p=_si(p0, "pascal"), fluid=suc.fluid, phase=suc.phase)
+    disch_s = copy(disch)
 
     def update_state(x, update_type):
         if update_type == "pressure":
             disch.update(h=h_disch, p=x)
         elif update_type == "temperature":
             disch.update(h=h_disch, T=x)
-        new_head = head_calc_func(suc, disch)
-        return (new_head - head).magnitude
+        return head_kernel(suc, disch, disch_s) - head
 
     try:
-        newton(update_state, disch.p().magnitude, args=("pressure",), tol=1e-1)
+        newton(update_state, disch._p_si(), args=("pressure",), tol=1e-1)
     except (RuntimeError, ValueError):
-        disch = State(h=h_disch, s=suc.s(), fluid=suc.fluid, phase=suc.phase)
+        disch = State(h=h_disch, s=suc._s_si(), fluid=suc.fluid, phase=suc.phase)
         newton(
             update_state,
-            disch.T().magnitude,
+            disch._T_si(),
             args=("temperature",),
             tol=1e-1,
         )
@@ -2542,16 +3132,17 @@ def disch_from_suc_disch_p_eff(suc, disch_p, eff, polytropic_method=None):
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
-    disch = ccp.State(p=disch_p, s=suc.s(), fluid=suc.fluid, phase=suc.phase)
-    eff_calc_func = globals()[f"eff_pol_{polytropic_method}"]
+    disch_p = _si(disch_p, "pascal")
+    eff = _si(eff, "dimensionless")
+    disch = ccp.State(p=disch_p, s=suc._s_si(), fluid=suc.fluid, phase=suc.phase)
+    disch_s = copy(disch)
+    eff_kernel = _eff_kernel(polytropic_method)
 
     def update_state(x):
         disch.update(p=disch_p, T=x)
-        new_eff = eff_calc_func(suc, disch)
+        return eff_kernel(suc, disch, disch_s) - eff
 
-        return (new_eff - eff).magnitude
-
-    newton(update_state, disch.T().magnitude)
+    newton(update_state, disch._T_si())
 
     return disch
 
@@ -2577,16 +3168,17 @@ def disch_from_suc_disch_T_head(suc, disch_T, head, polytropic_method=None):
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
 
-    disch = ccp.State(T=disch_T, s=suc.s(), fluid=suc.fluid, phase=suc.phase)
-    head_calc_func = globals()[f"head_pol_{polytropic_method}"]
+    disch_T = _si(disch_T, "kelvin")
+    head = _si(head, "joule/kilogram")
+    disch = ccp.State(T=disch_T, s=suc._s_si(), fluid=suc.fluid, phase=suc.phase)
+    disch_s = copy(disch)
+    head_kernel = _head_kernel(polytropic_method)
 
     def update_state(x):
         disch.update(T=disch_T, p=x)
-        new_head = head_calc_func(suc, disch)
-
-        return (new_head - head).magnitude
+        return head_kernel(suc, disch, disch_s) - head
 
-    newton(update_state, disch.p().magnitude, tol=1e-7)
+    newton(update_state, disch._p_si(), tol=1e-7)
 
     return disch
 
@@ -2711,27 +3303,28 @@ def correct_reynolds_2022(suc, speed, original_point):
         Correction factors for eff, psi and phi.
 
     """
-    ra = original_point.surface_roughness
-    reynolds_converted = reynolds(
-        suc=suc, speed=speed, b=original_point.b, D=original_point.D
+    # magnitudes are used so that the original point attributes can also be
+    # arrays (see Point.convert_many)
+    roughness = _si(
+        original_point.surface_roughness / original_point.b, "dimensionless"
+    )
+    reynolds_t = _si(original_point.reynolds, "dimensionless")
+    reynolds_sp = _si(
+        reynolds(suc=suc, speed=speed, b=original_point.b, D=original_point.D),
+        "dimensionless",
     )
 
-    lambda_inf = (
-        1.74 - 2 * np.log10(2 * original_point.surface_roughness / original_point.b)
-    ) ** (-2)
+    lambda_inf = (1.74 - 2 * np.log10(2 * roughness)) ** (-2)
 
     def colebrook(lamda, reynolds):
         return (
             1 / np.sqrt(lamda)
-            + 2
-            * np.log10(
-                1 + (18.7 * original_point.b) / (reynolds * 2 * ra * np.sqrt(lamda))
-            )
+            + 2 * np.log10(1 + 18.7 / (reynolds * 2 * roughness * np.sqrt(lamda)))
             - 1 / np.sqrt(lambda_inf)
         )
 
-    lambda_t = newton(colebrook, x0=lambda_inf, args=(original_point.reynolds,))
-    lambda_sp = newton(colebrook, x0=lambda_inf, args=(reynolds_converted,))
+    lambda_t = newton(colebrook, x0=lambda_inf, args=(reynolds_t,))
+    lambda_sp = newton(colebrook, x0=lambda_inf, args=(reynolds_sp,))
 
     rem_corr_eff = 1 / original_point.eff + (1 - 1 / original_point.eff) * (
         (0.3 + 0.7 * lambda_sp / lambda_inf) / (0.3 + 0.7 * lambda_t / lambda_inf)
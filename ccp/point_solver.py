@@ -21,6 +21,8 @@ means the user gets a valid ``Point`` whenever they provide *any* sufficient set
 of arguments -- including combinations that were never enumerated as a method.
 """
 
+from time import perf_counter
+
 from scipy.optimize import newton
 
 from ccp.config.units import Q_
@@ -81,7 +83,7 @@ class _Context:
         self.b = point.b
         self.head_calc_func = point.head_calc_func
         self.eff_calc_func = point.eff_calc_func
-        self._dummy_state = point._dummy_state
+        self._point = point
         self.polytropic_method = point.polytropic_method
         # casing heat-loss parameters
         self.casing_temperature = point.casing_temperature
@@ -89,6 +91,11 @@ class _Context:
         self.casing_area = point.casing_area
         self.convection_constant = point.convection_constant
 
+    @property
+    def _dummy_state(self):
+        # only created (by the point) when a relation needs it
+        return self._point._dummy_state
+
 
 # ---------------------------------------------------------------------------
 # Relations
@@ -339,6 +346,93 @@ def _is_complete(v):
     return all(k in v for k in REQUIRED)
 
 
+# ---------------------------------------------------------------------------
+# Execution plans and profiling
+# ---------------------------------------------------------------------------
+#
+# For a given set of provided variables the fixpoint always fires the same
+# relations in the same order, since the relation guards only look at which
+# variables are known.  The first solve for a set of provided variables records
+# that order as a plan, and subsequent points replay it directly.
+
+# Marker step for the ``power_losses = 0`` default of the loss loop.
+_DEFAULT_LOSSES = "default_power_losses"
+
+# plans keyed by (frozenset of provided variables, casing data given)
+_plans = {}
+plan_stats = {"hits": 0, "misses": 0, "fallbacks": 0}
+relation_stats = {rule.__name__: dict(calls=0, fired=0, time=0.0) for rule in RELATIONS}
+
+
+def clear_plans():
+    """Remove the cached execution plans and reset the profiling counters."""
+    _plans.clear()
+    for key in plan_stats:
+        plan_stats[key] = 0
+    for stats in relation_stats.values():
+        stats.update(calls=0, fired=0, time=0.0)
+
+
+def _fire(rule, v, ctx, extra):
+    """Apply a relation, committing its new values. Returns True if it fired."""
+    stats = relation_stats[rule.__name__]
+    t0 = perf_counter()
+    out = rule(v, ctx)
+    stats["time"] += perf_counter() - t0
+    stats["calls"] += 1
+    if not out:
+        return False
+    stats["fired"] += 1
+    for key, val in out.items():
+        if key in VAR_NAMES:
+            if key not in v:
+                v[key] = val
+        else:
+            extra[key] = val
+    return True
+
+
+def _can_default_losses(v, provided):
+    # default the loss loop only when the user pinned neither end of it
+    return (
+        "power_losses" not in v
+        and "torque" not in provided
+        and "power_losses" not in provided
+    )
+
+
+def _fixpoint(v, ctx, provided, extra, plan):
+    """Fire relations until the point is complete or no progress is made.
+
+    The relations that fired are appended to ``plan``.
+    """
+    progressed = True
+    while not _is_complete(v) and progressed:
+        progressed = False
+        for rule in RELATIONS:
+            if _fire(rule, v, ctx, extra):
+                plan.append(rule)
+                progressed = True
+
+        if not progressed and not _is_complete(v):
+            if _can_default_losses(v, provided):
+                v["power_losses"] = Q_(0, "watt")
+                plan.append(_DEFAULT_LOSSES)
+                progressed = True
+
+
+def _replay(plan, v, ctx, provided, extra):
+    """Replay a cached plan. Returns False as soon as a step does not apply."""
+    for step in plan:
+        if step == _DEFAULT_LOSSES:
+            if not _can_default_losses(v, provided):
+                return False
+            v["power_losses"] = Q_(0, "watt")
+        elif not _fire(step, v, ctx, extra):
+            return False
+    return _is_complete(v)
+
+
 def solve(point):
     """Fill in a :class:`Point`'s attributes from its provided inputs.
 
@@ -347,6 +441,12 @@ def solve(point):
     ``power_losses`` was provided), ``power_losses`` defaults to zero, matching
     the historical behaviour, and propagation resumes.
 
+    The relations fired for each set of provided variables are cached as a plan
+    and replayed for the next points with the same inputs, falling back to the
+    fixpoint if the replay does not resolve the point.  Plan hits/misses are
+    counted in :data:`plan_stats` and the calls, firings and time spent in each
+    relation in :data:`relation_stats`.
+
     Returns
     -------
     list of str
@@ -360,30 +460,20 @@ def solve(point):
 
     extra = {}  # non-variable outputs such as casing_heat_loss
 
-    progressed = True
-    while not _is_complete(v) and progressed:
-        progressed = False
-        for rule in RELATIONS:
-            out = rule(v, ctx)
-            if not out:
-                continue
-            for key, val in out.items():
-                if key in VAR_NAMES:
-                    if key not in v:
-                        v[key] = val
-                        progressed = True
-                else:
-                    extra[key] = val
-
-        if not progressed and not _is_complete(v):
-            # default the loss loop only when the user pinned neither end of it
-            if (
-                "power_losses" not in v
-                and "torque" not in provided
-                and "power_losses" not in provided
-            ):
-                v["power_losses"] = Q_(0, "watt")
-                progressed = True
+    key = (frozenset(provided), ctx.casing_temperature is not None)
+    plan = _plans.get(key)
+    if plan is not None:
+        plan_stats["hits"] += 1
+        if not _replay(plan, v, ctx, provided, extra):
+            # continue from whatever the replay resolved
+            plan_stats["fallbacks"] += 1
+            _fixpoint(v, ctx, provided, extra, [])
+    else:
+        plan_stats["misses"] += 1
+        plan = []
+        _fixpoint(v, ctx, provided, extra, plan)
+        if _is_complete(v):
+            _plans[key] = plan
 
     # commit whatever was resolved, even on a partial solve, so the caller can
     # inspect the point if it wishes
@@ -1,18 +1,51 @@
+import hashlib
+import json
 from copy import copy
+from itertools import combinations
+from pathlib import Path
 from warnings import warn
 
 import CoolProp.CoolProp as CP
 import numpy as np
-import ccp.config
-from scipy.optimize import newton
 from plotly import graph_objects as go
-from itertools import combinations
-from . import _RP
 
-from . import Q_
+import ccp.config
+
+from . import _RP, Q_
+from .cache import LRUCache
 from .config.fluids import get_name, normalize_mix
 from .config.units import check_units
 
+# CoolProp input pair and argument order for each pair of update arguments
+_INPUT_PAIRS = {
+    frozenset(("p", "T")): (CP.PT_INPUTS, "p", "T"),
+    frozenset(("p", "rho")): (CP.DmassP_INPUTS, "rho", "p"),
+    frozenset(("p", "h")): (CP.HmassP_INPUTS, "h", "p"),
+    frozenset(("p", "s")): (CP.PSmass_INPUTS, "p", "s"),
+    frozenset(("rho", "s")): (CP.DmassSmass_INPUTS, "rho", "s"),
+    frozenset(("rho", "T")): (CP.DmassT_INPUTS, "rho", "T"),
+    frozenset(("h", "s")): (CP.HmassSmass_INPUTS, "h", "s"),
+    frozenset(("T", "s")): (CP.SmassT_INPUTS, "s", "T"),
+    frozenset(("T", "h")): (CP.HmassT_INPUTS, "h", "T"),
+}
+
+# units of the arrays returned by State.flash_batch
+_BATCH_UNITS = {
+    "p": "pascal",
+    "T": "kelvin",
+    "h": "joule/kilogram",
+    "s": "joule/(kelvin kilogram)",
+    "rho": "kilogram/m**3",
+    "z": "dimensionless",
+    "cp": "joule/(kilogram kelvin)",
+    "speed_sound": "m/s",
+    "viscosity": "pascal second",
+}
+
+# State._solve_T_at_p and State._solve_p_at_hs accept a collapsed bracket only
+# if the Newton step at the last state is within this factor of the tolerance
+_RESIDUAL_FACTOR = 1e3
+
 
 class State(CP.AbstractState):
     """A thermodynamic state.
@@ -57,6 +90,29 @@ class State(CP.AbstractState):
     -------
     state : ccp.State
 
+    Notes
+    -----
+    With ``ccp.config.FLASH_CACHE = True`` each update is first looked up in
+    ``State.flash_cache``, a process-local LRU cache keyed by backend,
+    composition, phase and the input values rounded to
+    ``ccp.config.FLASH_CACHE_RTOL``. Cached states are restored with a direct
+    (rho, T) update instead of a new flash. Use ``State.flash_cache.info()``
+    for the hit/miss/eviction counters and ``State.flash_cache.clear()`` to
+    empty it.
+
+    With ``ccp.config.PHASE_HINTS = True`` (default is False) and no phase
+    given, PT flashes of mixtures are done with an imposed gas phase when the
+    point is at least ``ccp.config.PHASE_HINT_MARGIN`` above the dew
+    temperature of the phase envelope, skipping CoolProp's phase
+    determination. Building the envelope is costly, so it only pays off when
+    many flashes are done with the same composition. Envelopes are built once
+    per composition and kept in ``State.envelope_cache`` (up to 256
+    compositions).
+
+    Resolved fluid names and normalized mole fractions are cached per
+    composition in ``State.mixture_cache`` (statistics available with
+    ``State.mixture_cache.info()``).
+
     Examples
     --------
     >>> import ccp
@@ -71,6 +127,12 @@ class State(CP.AbstractState):
     <Quantity(273291.7, 'joule / kilogram')>
     """
 
+    flash_cache = LRUCache(maxsize=ccp.config.FLASH_CACHE_SIZE)
+    mixture_cache = LRUCache(maxsize=256)
+    envelope_cache = LRUCache(maxsize=256)
+    # p-h/p-s Newton iterations (one PT flash each) for non-REFPROP backends
+    solver_stats = {"calls": 0, "iterations": 0}
+
     def __new__(cls, *args, **kwargs):
         fluid = kwargs.get("fluid")
         if fluid is None:
@@ -81,13 +143,13 @@ class State(CP.AbstractState):
 
         # Check if all fluid names are valid before proceeding
         try:
-            _fluid = "&".join([get_name(name) for name in fluid.keys()])
+            template = cls._mixture_template(fluid)
         except ValueError as e:
             # Re-raise with the original error message from get_name
             raise e
 
         try:
-            state = super().__new__(cls, EOS, _fluid)
+            state = super().__new__(cls, EOS, template["_fluid"])
         except ValueError:
             error_msg = ""
             constituents = list(fluid.keys())
@@ -98,8 +160,34 @@ class State(CP.AbstractState):
                 except ValueError:
                     error_msg += f"\nCould not create state with {fluid1} + {fluid2}"
             raise ValueError(error_msg)
+        state._mixture = template
         return state
 
+    @classmethod
+    def _mixture_template(cls, fluid):
+        """Resolved names and normalized fractions for a fluid dictionary.
+
+        Templates are kept in State.mixture_cache, so the name resolution and
+        normalization run once per composition in each process.
+        """
+        try:
+            key = tuple(fluid.items())
+            template = cls.mixture_cache.get(key)
+        except TypeError:
+            key = template = None
+        if template is None:
+            constituents = [get_name(name) for name in fluid.keys()]
+            molar_fractions = list(fluid.values())
+            normalize_mix(molar_fractions)
+            template = {
+                "_fluid": "&".join(constituents),
+                "constituents": constituents,
+                "molar_fractions": molar_fractions,
+            }
+            if key is not None:
+                cls.mixture_cache.put(key, template)
+        return template
+
     @check_units
     def __init__(
         self,
@@ -114,6 +202,13 @@ class State(CP.AbstractState):
     ):
         # no call to super(). see :
         # http://stackoverflow.com/questions/18260095/
+        self._setup(fluid, EOS=EOS, phase=phase)
+        self.init_args = dict(p=p, T=T, h=h, s=s, rho=rho)
+        self.setup_args = copy(self.init_args)
+        self.update(**self.setup_args)
+
+    def _setup(self, fluid, EOS=None, phase=None):
+        """Set composition and phase without calculating a thermodynamic point."""
         self.EOS = EOS
         self.phase = phase
         self._phase_dict = {
@@ -125,26 +220,12 @@ class State(CP.AbstractState):
             "supercritical": CP.iphase_supercritical,
         }
 
-        constituents = []
-        molar_fractions = []
-
-        for k, v in fluid.items():
-            try:
-                k = get_name(k)
-            except ValueError as e:
-                # Re-raise with the original error message from get_name
-                raise e
-            constituents.append(k)
-            molar_fractions.append(v)
-            # create an adequate fluid string to cp.AbstractState
-        _fluid = "&".join(constituents)
-        self._fluid = _fluid
-
-        normalize_mix(molar_fractions)
+        template = getattr(self, "_mixture", None) or self._mixture_template(fluid)
+        constituents = template["constituents"]
+        molar_fractions = template["molar_fractions"]
+        self._fluid = template["_fluid"]
         self.set_mole_fractions(molar_fractions)
         self.fluid = dict(zip(constituents, molar_fractions))
-        self.init_args = dict(p=p, T=T, h=h, s=s, rho=rho)
-        self.setup_args = copy(self.init_args)
         if isinstance(fluid, str) and len(self.fluid) == 1:
             self.fluid[get_name(fluid)] = 1.0
 
@@ -163,7 +244,6 @@ class State(CP.AbstractState):
 
         if phase:
             self.specify_phase(self._phase_dict[phase])
-        self.update(**self.setup_args)
 
     def __repr__(self):
         try:
@@ -711,14 +791,74 @@ class State(CP.AbstractState):
             conductivity = conductivity.to(units)
         return conductivity
 
+    # Float accessors in SI units, used by the solver internals to avoid the
+    # pint overhead of the public getters.
+    def _p_si(self):
+        return super().p()
+
+    def _T_si(self):
+        return super().T()
+
+    def _h_si(self):
+        return self.hmass()
+
+    def _s_si(self):
+        return self.smass()
+
+    def _rho_si(self):
+        return self.rhomass()
+
+    def _v_si(self):
+        return 1 / self.rhomass()
+
+    def _cp_si(self):
+        cp = self.cpmass()
+        if cp < 0:
+            return self.cp().m
+        return cp
+
+    def _z_si(self):
+        return (
+            super().p()
+            * super().molar_mass()
+            / (self.rhomass() * super().gas_constant() * super().T())
+        )
+
     def __reduce__(self):
-        kwargs = dict(
-            p=self.p(), T=self.T(), fluid=self.fluid, EOS=self.EOS, phase=self.phase
+        snapshot = dict(
+            fluid=self.fluid,
+            EOS=self.EOS,
+            phase=self.phase,
+            init_args=[k for k, v in self.init_args.items() if v is not None],
+            rho=self.rhomass(),
+            T=super().T(),
         )
-        return self._rebuild, (self.__class__, kwargs)
+        return self._restore, (self.__class__, snapshot)
+
+    @staticmethod
+    def _restore(cls, snapshot):
+        """Restore a pickled state from its (rho, T) snapshot.
+
+        The (rho, T) update is a direct evaluation of the equation of state, so
+        no iterative flash (or REFPROP retry) runs when a state is unpickled or
+        copied.
+        """
+        state = cls.__new__(cls, fluid=snapshot["fluid"], EOS=snapshot["EOS"])
+        state._setup(snapshot["fluid"], EOS=snapshot["EOS"], phase=snapshot["phase"])
+        if np.isfinite(snapshot["rho"]) and np.isfinite(snapshot["T"]):
+            CP.AbstractState.update(
+                state, CP.DmassT_INPUTS, snapshot["rho"], snapshot["T"]
+            )
+        state.init_args = {
+            k: (getattr(state, k)() if k in snapshot["init_args"] else None)
+            for k in ["p", "T", "h", "s", "rho"]
+        }
+        state.setup_args = copy(state.init_args)
+        return state
 
     @staticmethod
     def _rebuild(cls, kwargs):
+        # states pickled before snapshots were introduced
         return cls(**kwargs)
 
     @classmethod
@@ -781,6 +921,132 @@ class State(CP.AbstractState):
         )
         return cls(p=p, T=T, h=h, s=s, rho=rho, fluid=fluid, EOS=EOS, **kwargs)
 
+    @classmethod
+    @check_units
+    def flash_batch(
+        cls,
+        p=None,
+        T=None,
+        h=None,
+        s=None,
+        rho=None,
+        fluid=None,
+        EOS=None,
+        phase=None,
+        properties=None,
+    ):
+        """Calculate properties for arrays of states with the same composition.
+
+        One underlying state is updated row by row, avoiding the creation of a
+        ccp.State object for each row. Rows that fail with the direct CoolProp
+        call are retried with State.update (REFPROP retries, p-s workaround);
+        rows that still fail are returned as NaN.
+
+        Parameters
+        ----------
+        p, T, h, s, rho : array_like, pint.Quantity
+            Two input properties (arrays or scalars, broadcast together).
+        fluid : dict
+            Dictionary with constituent and composition (mole fraction).
+        EOS : str, optional
+            String with REFPROP, HEOS, PR or SRK.
+            Default is set in ccp.config.EOS
+        phase : str, optional
+            Phase imposed to all the flash calculations (see ccp.State).
+        properties : list, optional
+            Properties to return besides p and T. Options are "h", "s", "rho",
+            "z", "cp", "speed_sound" and "viscosity". Default is all of them.
+
+        Returns
+        -------
+        results : dict
+            Dictionary with arrays (pint.Quantity) for p, T and the requested
+            properties. If ccp.config.RAW_SI is True the arrays are plain numpy
+            arrays in SI units.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> fluid = {'Oxygen': 0.2096, 'Nitrogen': 0.7812, 'Argon': 0.0092}
+        >>> r = ccp.State.flash_batch(p=[101008, 201008], T=273, fluid=fluid)
+        >>> r["rho"].m.round(2)
+        array([1.29, 2.57])
+        """
+        inputs = dict(p=p, T=T, h=h, s=s, rho=rho)
+        inputs = {k: v for k, v in inputs.items() if v is not None}
+        try:
+            input_pair, name_0, name_1 = _INPUT_PAIRS[frozenset(inputs)]
+        except KeyError:
+            raise KeyError(f"Update key {list(inputs)} not implemented")
+        if properties is None:
+            properties = list(_BATCH_UNITS)
+
+        value_0, value_1 = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(inputs[name_0].m, dtype=float)),
+            np.atleast_1d(np.asarray(inputs[name_1].m, dtype=float)),
+        )
+        results = {k: np.full(value_0.shape[0], np.nan) for k in _BATCH_UNITS}
+
+        state = cls.__new__(cls, fluid=fluid, EOS=EOS)
+        state._setup(fluid, EOS=EOS, phase=phase)
+        state.init_args = dict(p=None, T=None, h=None, s=None, rho=None)
+        state.setup_args = copy(state.init_args)
+
+        # p-h and p-s are solved on T as in State.update, the direct CoolProp
+        # flash is much slower for mixtures
+        solve_on_T = not state._is_refprop()
+
+        for i in range(value_0.shape[0]):
+            try:
+                if input_pair == CP.PT_INPUTS:
+                    state._update_PT(value_0[i], value_1[i])
+                elif input_pair == CP.HmassP_INPUTS and solve_on_T:
+                    state._solve_T_at_p(value_1[i], h=value_0[i], hint=not phase)
+                elif input_pair == CP.PSmass_INPUTS and solve_on_T:
+                    state._solve_T_at_p(value_0[i], s=value_1[i], hint=not phase)
+                else:
+                    CP.AbstractState.update(state, input_pair, value_0[i], value_1[i])
+            except ValueError:
+                try:
+                    state.update(**{name_0: value_0[i], name_1: value_1[i]})
+                except ValueError:
+                    continue
+
+            results["p"][i] = CP.AbstractState.p(state)
+            results["T"][i] = CP.AbstractState.T(state)
+            results["h"][i] = state.hmass()
+            results["s"][i] = state.smass()
+            results["rho"][i] = state.rhomass()
+            if "cp" in properties:
+                cp = state.cpmass()
+                results["cp"][i] = cp if cp >= 0 else state.cp().m
+            if "speed_sound" in properties:
+                try:
+                    results["speed_sound"][i] = np.sqrt(
+                        state.first_partial_deriv(CP.iP, CP.iDmass, CP.iSmass)
+                    )
+                except ValueError:
+                    results["speed_sound"][i] = state.speed_sound().m
+            if "viscosity" in properties:
+                try:
+                    results["viscosity"][i] = CP.AbstractState.viscosity(state)
+                except ValueError:
+                    results["viscosity"][i] = state.viscosity().m
+
+        results["z"] = (
+            results["p"]
+            * state.molar_mass().m
+            / (results["rho"] * state.gas_constant().m * results["T"])
+        )
+
+        results = {
+            k: v for k, v in results.items() if k in ("p", "T") or k in properties
+        }
+        if ccp.config.RAW_SI:
+            return results
+
+        return {k: Q_(v, _BATCH_UNITS[k]) for k, v in results.items()}
+
     @check_units
     def update(
         self,
@@ -827,10 +1093,21 @@ class State(CP.AbstractState):
         for item in ["kwargs", "self", "__class__"]:
             args.pop(item)
         args = [k for k, v in args.items() if v is not None]
+
+        cache_key = None
+        if ccp.config.FLASH_CACHE:
+            cache_key = self._flash_cache_key(phase, p=p, T=T, rho=rho, h=h, s=s)
+            cached = self.flash_cache.get(cache_key)
+            if cached is not None:
+                super().update(CP.DmassT_INPUTS, *cached)
+                if self.phase:
+                    self.specify_phase(self._phase_dict[self.phase])
+                return
+
         try:
             if p is not None and T is not None:
                 try:
-                    super().update(CP.PT_INPUTS, p.magnitude, T.magnitude)
+                    self._update_PT(p.magnitude, T.magnitude, hint=not phase)
                 except ValueError:
                     # handle convergence error by forcing gas state directly with REFPROP
                     # only try REFPROP if we're using REFPROP backend
@@ -863,34 +1140,31 @@ class State(CP.AbstractState):
                         raise
 
             elif p is not None and h is not None:
-                try:
-                    super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
-                except ValueError:
-                    # handle convergence error
-                    # only try REFPROP if we're using REFPROP backend
-                    if self.backend_name() in ["REFPROP", "REFPROPMixtureBackend"]:
+                if self._is_refprop():
+                    try:
+                        super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
+                    except ValueError:
+                        # handle convergence error by forcing gas state directly
+                        # with REFPROP
                         r = self._call_REFPROP(
                             p=p.magnitude,
                             h=h.magnitude,
                             phase="gas",
                         )
                         super().update(CP.PT_INPUTS, r["p"], r["T"])
-                    else:
-                        # HEOS workaround: use Newton method to find T from h,p
-                        def objective(T):
-                            super(State, self).update(CP.PT_INPUTS, p.magnitude, T)
-                            return self.hmass() - h.magnitude
-
-                        T0 = self.T().m
-                        if T0 == float("-inf"):
-                            T0 = 300
-                        newton(objective, x0=T0)
+                else:
+                    try:
+                        self._solve_T_at_p(p.magnitude, h=h.magnitude, hint=not phase)
+                    except ValueError:
+                        # e.g. pure fluids in the two-phase region
+                        super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
             elif p is not None and s is not None:
-                if ccp.config.EOS == "REFPROP":
+                if self._is_refprop():
                     try:
                         super().update(CP.PSmass_INPUTS, p.magnitude, s.magnitude)
                     except ValueError:
-                        # handle convergence error by forcing gas state directly with REFPROP
+                        # handle convergence error by forcing gas state directly
+                        # with REFPROP
                         # calculate with p and T and update with their values
                         r = self._call_REFPROP(
                             p=p.magnitude,
@@ -902,14 +1176,10 @@ class State(CP.AbstractState):
                 else:
                     # ps update not available for some EOS, this is a workaround based on:
                     # https://github.com/CoolProp/CoolProp/issues/2000
-                    def objective(T):
-                        super(State, self).update(CP.PT_INPUTS, p.magnitude, T)
-                        return self.smass() - s.magnitude
-
-                    T0 = self.T().m
-                    if T0 == float("-inf"):
-                        T0 = 300
-                    newton(objective, x0=T0)
+                    try:
+                        self._solve_T_at_p(p.magnitude, s=s.magnitude, hint=not phase)
+                    except ValueError:
+                        super().update(CP.PSmass_INPUTS, p.magnitude, s.magnitude)
             elif rho is not None and s is not None:
                 try:
                     super().update(CP.DmassSmass_INPUTS, rho.magnitude, s.magnitude)
@@ -923,7 +1193,14 @@ class State(CP.AbstractState):
             elif rho is not None and T is not None:
                 super().update(CP.DmassT_INPUTS, rho.magnitude, T.magnitude)
             elif h is not None and s is not None:
-                super().update(CP.HmassSmass_INPUTS, h.magnitude, s.magnitude)
+                if self._is_refprop():
+                    super().update(CP.HmassSmass_INPUTS, h.magnitude, s.magnitude)
+                else:
+                    # the h-s flash of CoolProp is very slow for mixtures
+                    try:
+                        self._solve_p_at_hs(h.magnitude, s.magnitude, hint=not phase)
+                    except ValueError:
+                        super().update(CP.HmassSmass_INPUTS, h.magnitude, s.magnitude)
             elif T is not None and s is not None:
                 super().update(CP.SmassT_INPUTS, s.magnitude, T.magnitude)
             elif T is not None and h is not None:
@@ -946,10 +1223,318 @@ class State(CP.AbstractState):
                 f"Could not define state with ccp.State(**{args_repr})"
             ) from e
 
+        if cache_key is not None:
+            self.flash_cache.maxsize = ccp.config.FLASH_CACHE_SIZE
+            self.flash_cache.put(cache_key, (self.rhomass(), super().T()))
+
         # go back to initialization phase after calculation
         if self.phase:
             self.specify_phase(self._phase_dict[self.phase])
 
+    def __getattr__(self, name):
+        # plot functions of the ccp.Point holding this state, e.g. disch.T_plot
+        # (see Point._add_point_plot)
+        attr, _, suffix = name.rpartition("_")
+        owner = self.__dict__.get("_plot_owner")
+        if (
+            suffix == "plot"
+            and owner is not None
+            and attr in ["p", "T", "h", "s", "rho"]
+        ):
+            from ccp.point import plot_func
+
+            return plot_func(owner[0], f"{owner[1]}.{attr}")
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _is_refprop(self):
+        return self.backend_name() in ["REFPROP", "REFPROPMixtureBackend"]
+
+    def _update_PT(self, p, T, hint=True):
+        """PT update with an imposed gas phase when the point is far from the
+        phase envelope (see State._phase_hint).
+
+        hint=False (or a phase set for the state) keeps CoolProp's own phase
+        determination.
+        """
+        if hint and ccp.config.PHASE_HINTS and not self.phase:
+            hint = self._phase_hint(p, T)
+        else:
+            hint = None
+        if hint is None:
+            super().update(CP.PT_INPUTS, p, T)
+            return
+
+        self.specify_phase(hint)
+        try:
+            super().update(CP.PT_INPUTS, p, T)
+        except ValueError:
+            self.unspecify_phase()
+            super().update(CP.PT_INPUTS, p, T)
+        finally:
+            self.unspecify_phase()
+
+    def _phase_hint(self, p, T):
+        """CoolProp phase for a point safely outside the phase envelope.
+
+        A point is considered gas if its temperature is at least
+        ccp.config.PHASE_HINT_MARGIN above the dew temperature at the same
+        pressure (or above the cricondentherm for pressures higher than the
+        cricondentherm pressure).
+
+        Returns
+        -------
+        phase : int or None
+            CP.iphase_gas below the cricondenbar, CP.iphase_supercritical_gas
+            above it, or None if the point is close to (or inside) the
+            envelope or the envelope is not available.
+        """
+        envelope = self._phase_envelope()
+        if envelope is None:
+            return None
+        if p <= envelope["p_dew"][-1]:
+            T_dew = np.interp(p, envelope["p_dew"], envelope["T_dew"])
+        else:
+            T_dew = envelope["T_dew"][-1]
+        if not T > T_dew + ccp.config.PHASE_HINT_MARGIN:
+            return None
+        if p > envelope["p_max"]:
+            return CP.iphase_supercritical_gas
+        return CP.iphase_gas
+
+    def _phase_envelope(self):
+        """Dew branch (up to the cricondentherm) and cricondenbar of the phase
+        envelope for this composition.
+
+        Envelopes are built once per composition and kept in
+        State.envelope_cache and, if ccp.config.PHASE_ENVELOPE_DIR is set, in
+        json files in that directory. None is returned (and cached) for pure
+        fluids and mixtures for which CoolProp cannot build the envelope.
+        """
+        EOS = self.EOS if self.EOS is not None else ccp.config.EOS
+        key = (EOS, self._fluid, tuple(np.round(self.get_mole_fractions(), 10)))
+        envelope = self.envelope_cache.get(key, False)
+        if envelope is not False:
+            return envelope
+
+        file = None
+        if ccp.config.PHASE_ENVELOPE_DIR is not None:
+            name = hashlib.sha1(repr(key).encode()).hexdigest()
+            file = Path(ccp.config.PHASE_ENVELOPE_DIR) / f"envelope_{name}.json"
+            if file.exists():
+                envelope = json.loads(file.read_text())
+                self.envelope_cache.put(key, envelope)
+                return envelope
+
+        envelope = None
+        if len(self.fluid) > 1:
+            try:
+                state = CP.AbstractState(EOS, self._fluid)
+                state.set_mole_fractions(self.get_mole_fractions())
+                state.build_phase_envelope("dummy")
+                data = state.get_phase_envelope_data()
+                T = np.array(data.T)
+                p = np.array(data.p)
+                i_max = int(np.argmax(T))
+                if i_max > 0 and np.all(np.diff(p[: i_max + 1]) > 0):
+                    envelope = {
+                        "T_dew": T[: i_max + 1].tolist(),
+                        "p_dew": p[: i_max + 1].tolist(),
+                        "p_max": float(p.max()),
+                    }
+            except Exception:
+                # CoolProp raises different errors when the envelope cannot be
+                # built; the flashes are then done without hints
+                pass
+
+        self.envelope_cache.put(key, envelope)
+        if file is not None:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_text(json.dumps(envelope))
+        return envelope
+
+    def _solve_T_at_p(self, p, h=None, s=None, tol=1e-10, maxiter=50, hint=True):
+        """Update the state to the temperature that matches h or s at pressure p.
+
+        Newton iterations on T with PT updates and analytic slopes
+        (dh/dT|p = cp, ds/dT|p = cp/T). Steps leaving the bracket found so far
+        are replaced by bisection. Each iteration is one PT flash, counted in
+        State.solver_stats.
+
+        Parameters
+        ----------
+        p : float
+            Pressure (Pa).
+        h, s : float
+            Target enthalpy (J/kg) or entropy (J/(kg K)).
+        tol : float, optional
+            Relative tolerance on T.
+        maxiter : int, optional
+            Maximum number of iterations.
+        hint : bool, optional
+            Whether PT updates can use phase hints (see State._update_PT).
+
+        Raises
+        ------
+        ValueError
+            If the iterations do not converge, including a bracket that
+            collapses without matching h or s (e.g. on a discontinuity).
+        """
+        T = super().T()
+        if np.isfinite(T) and T > 0:
+            # first order estimate from the current state
+            try:
+                if h is not None:
+                    dT = (h - self.hmass()) / self.cpmass() + self.first_partial_deriv(
+                        CP.iT, CP.iP, CP.iHmass
+                    ) * (p - super().p())
+                else:
+                    dT = (s - self.smass()) * T / self.cpmass() + (
+                        self.first_partial_deriv(CP.iT, CP.iP, CP.iSmass)
+                        * (p - super().p())
+                    )
+                if np.isfinite(dT) and abs(dT) < 0.5 * T:
+                    T += dT
+            except ValueError:
+                pass
+        else:
+            T = 300.0
+        T_low, T_high = 0.0, np.inf
+        T_converged = None
+        State.solver_stats["calls"] += 1
+
+        for _ in range(maxiter):
+            State.solver_stats["iterations"] += 1
+            try:
+                self._update_PT(p, T, hint=hint)
+            except ValueError:
+                if T_converged is None:
+                    raise
+                # step into a region where the flash fails: move back halfway
+                T = 0.5 * (T + T_converged)
+                continue
+            T_converged = T
+
+            cp = self.cpmass()
+            if h is not None:
+                residual = self.hmass() - h
+                slope = cp
+            else:
+                residual = self.smass() - s
+                slope = cp / T
+            if residual > 0:
+                T_high = min(T_high, T)
+            else:
+                T_low = max(T_low, T)
+
+            step = residual / slope if slope > 0 else np.inf
+            if abs(step) <= tol * T:
+                return
+            T_new = T - step
+            if not (T_low < T_new < T_high):
+                if np.isfinite(T_high) and T_low > 0:
+                    T_new = 0.5 * (T_low + T_high)
+                else:
+                    # no bracket yet: limit the step to 50% of T
+                    T_new = min(max(T_new, 0.5 * T), 1.5 * T)
+            if abs(T_new - T) <= tol * T:
+                # the bracket collapsed: only accept T if h or s also match
+                # (the state is at T, where the residual was calculated)
+                if abs(step) <= _RESIDUAL_FACTOR * tol * T:
+                    return
+                break
+            T = T_new
+
+        raise ValueError(
+            f"Could not find T for p={p} and "
+            f"{'h' if h is not None else 's'}={h if h is not None else s}"
+        )
+
+    def _solve_p_at_hs(self, h, s, tol=1e-10, maxiter=50, hint=True):
+        """Update the state to the pressure that matches h along the isentrope s.
+
+        Newton iterations on p with p-s updates (see State._solve_T_at_p) and
+        the analytic slope dh/dp|s = 1/rho. Steps leaving the bracket found so
+        far are replaced by bisection in log(p).
+
+        Parameters
+        ----------
+        h, s : float
+            Target enthalpy (J/kg) and entropy (J/(kg K)).
+        tol : float, optional
+            Relative tolerance on p.
+        maxiter : int, optional
+            Maximum number of iterations.
+        hint : bool, optional
+            Whether PT updates can use phase hints (see State._update_PT).
+
+        Raises
+        ------
+        ValueError
+            If the iterations do not converge, including a bracket that
+            collapses without matching h.
+        """
+        try:
+            p = super().p()
+            self.smass()
+        except ValueError:
+            p = np.nan
+        if not (np.isfinite(p) and p > 0):
+            # ideal gas estimate of the pressure on the isentrope at 300 K
+            p = 101325.0
+            self._update_PT(p, 300.0, hint=hint)
+            R = p / (self.rhomass() * 300.0)
+            p *= np.exp(min(max((self.smass() - s) / R, -5.0), 5.0))
+        p_low, p_high = 0.0, np.inf
+
+        for _ in range(maxiter):
+            try:
+                self._solve_T_at_p(p, s=s, hint=hint)
+            except ValueError:
+                # no T along the isentrope (e.g. two-phase at low pressure)
+                p_low = p
+                p = np.sqrt(p * p_high) if np.isfinite(p_high) else 5 * p
+                self._update_PT(p, 300.0, hint=hint)
+                continue
+            residual = self.hmass() - h
+            if residual > 0:
+                p_high = min(p_high, p)
+            else:
+                p_low = max(p_low, p)
+
+            step = residual * self.rhomass()
+            p_new = p - step
+            if not (p_low < p_new < p_high):
+                if np.isfinite(p_high) and p_low > 0:
+                    p_new = np.sqrt(p_low * p_high)
+                else:
+                    # no bracket yet: limit the step to a factor of 5
+                    p_new = min(max(p_new, 0.2 * p), 5 * p)
+            if abs(p_new - p) <= tol * p:
+                # the bracket collapsed: only accept p if h also matches
+                if abs(step) <= _RESIDUAL_FACTOR * tol * p:
+                    return
+                break
+            p = p_new
+
+        raise ValueError(f"Could not find p for h={h} and s={s}")
+
+    def _flash_cache_key(self, phase=None, **inputs):
+        """Key for State.flash_cache with inputs rounded to FLASH_CACHE_RTOL."""
+        digits = max(int(round(-np.log10(ccp.config.FLASH_CACHE_RTOL))), 1)
+        rounded = tuple(
+            (k, float(f"{v.magnitude:.{digits}e}"))
+            for k, v in inputs.items()
+            if v is not None
+        )
+        return (
+            self.backend_name(),
+            tuple(self.fluid.items()),
+            phase or self.phase,
+            rounded,
+        )
+
     def get_coolprop_state(self):
         """Return a CoolProp state object."""
         EOS = self.EOS
@@ -0,0 +1,252 @@
+"""Smooth surface model of an impeller performance map.
+
+The speed lines of an impeller are resampled on a normalized flow coordinate
+``t = (flow_v - surge_flow) / (stonewall_flow - surge_flow)`` with monotone
+(PCHIP) interpolation and then interpolated across speeds, also with PCHIP,
+on a dense regular (t, speed) grid. The surge and stonewall lines are
+interpolated along speed in the same way. A query is then a bilinear lookup on
+the grid, which can be evaluated for many points at once.
+
+Speeds outside the map are extrapolated with the fan laws from the closest
+speed line (flow proportional to speed, head proportional to speed squared and
+same efficiency), as done by ``Impeller.curve``. Flows outside the surge and
+stonewall lines are linearly extrapolated from the grid.
+"""
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+from ccp.config.units import Q_, check_units
+
+# point attributes fitted by the surface, besides the flow
+_SURFACE_KEYS = (
+    "head",
+    "eff",
+    "phi_ratio",
+    "psi_ratio",
+    "reynolds_ratio",
+    "mach_diff",
+    "volume_ratio_ratio",
+)
+
+
+class ImpellerSurface:
+    """Smooth surface model of an impeller performance map.
+
+    The surface is built once from the speed lines of an impeller and answers
+    head, efficiency and similarity ratio queries at any (flow, speed) without
+    interpolating curves or creating points. It can be used as the map
+    backend of an impeller with ``Impeller.fit_surface``.
+
+    Parameters
+    ----------
+    impeller : ccp.Impeller
+        Impeller with the performance map.
+    number_of_points : int, optional
+        Number of grid points along the flow and speed directions.
+        Default is 64.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> imp = ccp.impeller_example()
+    >>> surface = ccp.ImpellerSurface(imp)
+    >>> surface.head(flow_v=[5.0, 5.5], speed=900).round(0)
+    <Quantity([123252. 110135.], 'joule / kilogram')>
+    """
+
+    def __init__(self, impeller, number_of_points=64):
+        curves = sorted(impeller.curves, key=lambda c: c.speed.m)
+        self.speeds = np.array([c.speed.m for c in curves])
+        self.surge_flow_v = np.array([c.flow_v.m.min() for c in curves])
+        self.stonewall_flow_v = np.array([c.flow_v.m.max() for c in curves])
+        self.power_losses = curves[0].power_losses
+        self.speed_ref = curves[0].speed
+
+        self.t_grid = np.linspace(0, 1, number_of_points)
+        lines = np.zeros((len(curves), len(_SURFACE_KEYS), number_of_points))
+        for i, curve in enumerate(curves):
+            flow_v = np.array([p.flow_v.m for p in curve.points])
+            t, idx = np.unique(
+                (flow_v - flow_v.min()) / (flow_v.max() - flow_v.min()),
+                return_index=True,
+            )
+            values = np.array(
+                [
+                    [getattr(curve.points[j], key).m for j in idx]
+                    for key in _SURFACE_KEYS
+                ]
+            )
+            lines[i] = PchipInterpolator(t, values, axis=1)(self.t_grid)
+
+        if len(curves) > 1:
+            self.speed_grid = np.linspace(
+                self.speeds[0], self.speeds[-1], number_of_points
+            )
+            self.grid = PchipInterpolator(self.speeds, lines, axis=0)(self.speed_grid)
+            self.surge_grid = PchipInterpolator(self.speeds, self.surge_flow_v)(
+                self.speed_grid
+            )
+            self.stonewall_grid = PchipInterpolator(self.speeds, self.stonewall_flow_v)(
+                self.speed_grid
+            )
+        else:
+            self.speed_grid = self.speeds
+            self.grid = lines
+            self.surge_grid = self.surge_flow_v
+            self.stonewall_grid = self.stonewall_flow_v
+
+    def _evaluate(self, flow_v, speed):
+        """Surface values at flow_v (m³/s) and speed (rad/s) as float arrays.
+
+        Returns
+        -------
+        values : dict
+            Arrays with the values of _SURFACE_KEYS, the surge and stonewall
+            flows at each speed, and the outside (flow outside the surge and
+            stonewall lines) and extrapolated (outside the map) flags.
+        """
+        flow_v, speed = np.broadcast_arrays(
+            np.asarray(flow_v, dtype=float), np.asarray(speed, dtype=float)
+        )
+        speed_grid = self.speed_grid
+
+        # closest speed inside the map and fan law ratio
+        speed_map = np.clip(speed, speed_grid[0], speed_grid[-1])
+        ratio = speed / speed_map
+        if len(speed_grid) > 1:
+            u = (speed_map - speed_grid[0]) / (speed_grid[1] - speed_grid[0])
+            i = np.clip(np.floor(u).astype(int), 0, len(speed_grid) - 2)
+            w = u - i
+        else:
+            i = np.zeros(speed.shape, dtype=int)
+            w = np.zeros(speed.shape)
+        i_next = np.minimum(i + 1, len(speed_grid) - 1)
+
+        surge = ((1 - w) * self.surge_grid[i] + w * self.surge_grid[i_next]) * ratio
+        stonewall = (
+            (1 - w) * self.stonewall_grid[i] + w * self.stonewall_grid[i_next]
+        ) * ratio
+        v = (flow_v - surge) / (stonewall - surge) * (len(self.t_grid) - 1)
+        j = np.clip(np.floor(v).astype(int), 0, len(self.t_grid) - 2)
+        x = v - j
+
+        grid = self.grid
+        values = {}
+        for k, key in enumerate(_SURFACE_KEYS):
+            values[key] = (1 - w) * (
+                (1 - x) * grid[i, k, j] + x * grid[i, k, j + 1]
+            ) + w * ((1 - x) * grid[i_next, k, j] + x * grid[i_next, k, j + 1])
+        values["head"] = values["head"] * ratio**2
+
+        values["surge_flow_v"] = surge
+        values["stonewall_flow_v"] = stonewall
+        values["outside"] = (flow_v < surge) | (stonewall < flow_v)
+        values["extrapolated"] = values["outside"] | (ratio != 1)
+        return values
+
+    @check_units
+    def head(self, flow_v=None, speed=None):
+        """Head at given flows and speeds.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, float, array
+            Volumetric flow (m³/s).
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+
+        Returns
+        -------
+        head : pint.Quantity
+            Head (J/kg).
+        """
+        return Q_(self._evaluate(flow_v.m, speed.m)["head"], "J/kg")
+
+    @check_units
+    def eff(self, flow_v=None, speed=None):
+        """Efficiency at given flows and speeds.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, float, array
+            Volumetric flow (m³/s).
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+
+        Returns
+        -------
+        eff : pint.Quantity
+            Efficiency (dimensionless).
+        """
+        return Q_(self._evaluate(flow_v.m, speed.m)["eff"], "dimensionless")
+
+    @check_units
+    def surge_flow(self, speed=None):
+        """Volumetric flow at the surge line for a given speed.
+
+        Parameters
+        ----------
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+
+        Returns
+        -------
+        flow_v : pint.Quantity
+            Volumetric flow (m³/s).
+        """
+        return Q_(self._evaluate(0.0, speed.m)["surge_flow_v"], "m³/s")
+
+    @check_units
+    def stonewall_flow(self, speed=None):
+        """Volumetric flow at the stonewall line for a given speed.
+
+        Parameters
+        ----------
+        speed : pint.Quantity, float, array
+            Speed (rad/s).
+
+        Returns
+        -------
+        flow_v : pint.Quantity
+            Volumetric flow (m³/s).
+        """
+        return Q_(self._evaluate(0.0, speed.m)["stonewall_flow_v"], "m³/s")
+
+    def speed_line(self, speed, number_of_points=None):
+        """Values of the surface along a speed line.
+
+        Parameters
+        ----------
+        speed : pint.Quantity
+            Speed (rad/s).
+        number_of_points : int, optional
+            Number of points between the surge and stonewall lines.
+            Default is the number of grid points.
+
+        Returns
+        -------
+        line : dict
+            Dictionary with the same keys as Impeller._speed_line: arrays of
+            flow_v (m³/s), head (J/kg), eff and the similarity ratios, and the
+            speed, power_losses and extrapolated flag of the line.
+        """
+        if number_of_points is None:
+            number_of_points = len(self.t_grid)
+        speed_value = float(np.squeeze(speed.to("rad/s").m))
+        edges = self._evaluate(0.0, speed_value)
+        flow_v = np.linspace(
+            edges["surge_flow_v"], edges["stonewall_flow_v"], number_of_points
+        )
+        line = self._evaluate(flow_v, speed_value)
+        line = {key: line[key] for key in _SURFACE_KEYS}
+        line["flow_v"] = flow_v
+        line["speed"] = Q_(speed_value, "rad/s")
+        line["power_losses"] = (
+            self.power_losses * (line["speed"] / self.speed_ref) ** 2.5
+        )
+        line["extrapolated"] = not (
+            self.speed_grid[0] <= speed_value <= self.speed_grid[-1]
+        )
+        line["surface"] = self
+        return line
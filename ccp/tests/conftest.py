@@ -13,6 +13,26 @@ SLOW_TEST_FILES = (
     "test_impeller.py",
 )
 
+# Global settings restored after each test by restore_global_config.
+CONFIG_NAMES = (
+    "EOS",
+    "POLYTROPIC_METHOD",
+    "PARALLEL",
+    "POOL_SIZE",
+    "FLASH_CACHE",
+    "FLASH_CACHE_SIZE",
+    "FLASH_CACHE_RTOL",
+    "PHASE_HINTS",
+    "PHASE_HINT_MARGIN",
+    "PHASE_ENVELOPE_DIR",
+    "CURVE_CACHE_SIZE",
+    "CURVE_CACHE_RTOL",
+    "CONVERSION_CACHE_SIZE",
+    "CONVERSION_CACHE_RTOL",
+    "CONVERSION_CACHE_DIR",
+    "RAW_SI",
+)
+
 
 def pytest_collection_modifyitems(items):
     for item in items:
@@ -29,12 +49,7 @@ def restore_global_config():
     and shifts their results (e.g. the historical test_impeller failures when
     run in the same process as test_point).
     """
-    eos = ccp.config.EOS
-    polytropic_method = ccp.config.POLYTROPIC_METHOD
-    parallel = ccp.config.PARALLEL
-    pool_size = ccp.config.POOL_SIZE
+    saved = {name: getattr(ccp.config, name) for name in CONFIG_NAMES}
     yield
-    ccp.config.EOS = eos
-    ccp.config.POLYTROPIC_METHOD = polytropic_method
-    ccp.config.PARALLEL = parallel
-    ccp.config.POOL_SIZE = pool_size
+    for name, value in saved.items():
+        setattr(ccp.config, name, value)
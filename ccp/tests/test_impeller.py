@@ -1,13 +1,16 @@
 import pytest
 import numpy as np
 import pickle
+import warnings
 import toml
+from copy import deepcopy
 from pathlib import Path
 from tempfile import tempdir
 from numpy.testing import assert_allclose
 
 import ccp
 from ccp import ureg, Q_, State, Point, Curve, Impeller, impeller_example
+from ccp.impeller import get_interpolated_values
 
 
 @pytest.fixture(scope="module")
@@ -98,7 +101,7 @@ def imp1():
 
 def test_impeller_phase_propagation():
     # a forced suction phase must propagate to every state held by the impeller
-    # (suction and discharge of every point), survive construction (deepcopy)
+    # (suction and discharge of every point), survive construction
     # and survive conversion to a new suction state.
     fluid = {"methane": 0.7, "ethane": 0.2, "propane": 0.1}
     points = []
@@ -277,6 +280,300 @@ def test_impeller_point(imp3):
         assert "Expected point is being extrapolated" in record[0].message.args[0]
 
 
+@pytest.fixture(scope="module")
+def imp4():
+    fluid = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    points = [
+        Point(
+            suc=suc,
+            disch=State(p=Q_(p, "bar"), T=T, fluid=fluid),
+            flow_v=flow_v,
+            speed=speed,
+            b=0.0285,
+            D=0.365,
+        )
+        for speed, flow_v, p, T in [
+            (800, 1.0, 5.902, 405.7),
+            (800, 1.2, 5.7, 405.0),
+            (1000, 1.3, 7.6, 430.0),
+            (1000, 1.5, 7.3, 431.0),
+        ]
+    ]
+    return Impeller(points)
+
+
+def test_impeller_speed_line(imp4):
+    imp = imp4
+    # interpolated from the curve arrays, without flashing the curve points
+    speed = Q_(900, "rad/s")
+    line = imp._speed_line(speed)
+    curve = imp.curve(speed)
+    assert_allclose(line["flow_v"], curve.flow_v.m)
+    assert_allclose(line["head"], curve.head.m)
+    assert_allclose(line["eff"], curve.eff.m)
+    assert_allclose(line["power_losses"].m, curve.power_losses.m)
+    assert line["extrapolated"] == curve._extrapolated
+
+    p0 = imp.point(flow_v=1.25, speed=speed)
+    head = np.interp(1.25, curve.flow_v.m, curve.head.m)
+    assert_allclose(p0.head.m, head)
+    assert_allclose(p0.speed.m, 900)
+
+
+def test_impeller_shared_points():
+    fluid = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    points = [
+        Point(
+            suc=suc,
+            disch=State(p=Q_(p, "bar"), T=T, fluid=fluid),
+            flow_v=flow_v,
+            speed=800,
+            b=0.0285,
+            D=0.365,
+            power_losses=power_losses,
+        )
+        for flow_v, p, T, power_losses in [
+            (1.0, 5.902, 405.7, 1000),
+            (1.2, 5.7, 405.0, 0),
+        ]
+    ]
+    imp = Impeller(points)
+    # points are shared with the caller, not copied
+    assert imp.points[0] is points[0]
+
+    # copy on write: the point without losses is replaced, the original is kept
+    assert imp.points[1] is not points[1]
+    assert imp.points[1].disch is not points[1].disch
+    assert imp.points[1].power_losses.m == 1000
+    assert points[1].power_losses.m == 0
+    del imp
+    assert callable(points[1].disch.T_plot)
+
+
+def test_get_interpolated_values():
+    flow, val = get_interpolated_values(0.25, 0.75, 1.0, 10.0, 2.0, 6.0)
+    assert_allclose([flow, val], [1.25, 9.0])
+
+    # all points of two curves at once
+    flow, val = get_interpolated_values(
+        0.25, 0.75, np.array([1.0, 2.0]), np.array([10.0, 8.0]), 2.0, 6.0
+    )
+    assert_allclose(flow, [1.25, 2.0])
+    assert_allclose(val, [9.0, 7.5])
+
+
+def test_impeller_curve_cache(imp4):
+    imp4.clear_cache()
+    c0 = imp4.curve(Q_(900, "rad/s"))
+    assert imp4.curve(Q_(900 * (1 + 1e-12), "rad/s")) is c0
+    assert imp4.curve(Q_(950, "rad/s")) is not c0
+    assert imp4.curve_cache.info() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "size": 2,
+        "maxsize": ccp.config.CURVE_CACHE_SIZE,
+    }
+
+    imp_pickled = pickle.loads(pickle.dumps(imp4))
+    assert len(imp_pickled.curve_cache) == 0
+    assert_allclose(imp_pickled.curve(Q_(900, "rad/s")).head.m, c0.head.m)
+
+    imp4.clear_cache()
+    assert len(imp4.curve_cache) == 0
+    assert imp4.curve(Q_(900, "rad/s")) is not c0
+
+
+def test_impeller_point_batch(imp4):
+    flow_v = [1.1, 1.25, 1.6, 1.25]
+    speed = Q_([800, 900, 1000, 900], "rad/s")
+    with pytest.warns(UserWarning, match="1 of 4 expected points"):
+        df = imp4.point_batch(flow_v=flow_v, speed=speed)
+    assert list(df.index) == [0, 1, 2, 3]
+
+    for row, flow, speed_value in zip(df.itertuples(), flow_v, speed):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = imp4.point(flow_v=flow, speed=speed_value)
+        assert_allclose(row.head, expected.head.m)
+        assert_allclose(row.eff, expected.eff.m)
+        assert_allclose(row.power, expected.power.m)
+        assert_allclose(row.power_shaft, expected.power_shaft.m)
+        assert_allclose(row.disch_p, expected.disch.p().m, rtol=1e-6)
+        assert_allclose(row.disch_T, expected.disch.T().m, rtol=1e-6)
+        assert row.extrapolated == expected._extrapolated
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        df_m = imp4.point_batch(flow_m=df.flow_m.values, speed=900)
+    assert_allclose(df_m.flow_v, df.flow_v)
+
+
+def test_impeller_point_batch_failed_disch(imp4, monkeypatch):
+    disch_from_suc_head_eff = ccp.impeller.disch_from_suc_head_eff
+
+    def fail_second_row(suc, head, eff):
+        if np.isclose(head, failed_head):
+            raise ValueError("no convergence")
+        return disch_from_suc_head_eff(suc, head, eff)
+
+    df = imp4.point_batch(flow_v=[1.2, 1.3], speed=900)
+    failed_head = df["head"][1]
+    monkeypatch.setattr(ccp.impeller, "disch_from_suc_head_eff", fail_second_row)
+    df_failed = imp4.point_batch(flow_v=[1.2, 1.3], speed=900)
+
+    # failed discharge states are reported as nan, the other values are kept
+    assert np.isnan(df_failed.disch_p[1]) and np.isnan(df_failed.disch_T[1])
+    assert_allclose(df_failed.disch_p[0], df.disch_p[0])
+    assert_allclose(df_failed["head"], df["head"])
+    assert_allclose(df_failed.power, df.power)
+
+
+def test_impeller_envelope(imp4):
+    speed = Q_([700, 800, 900, 1000, 1100], "rad/s")
+    surge = imp4.surge_flow(speed=speed)
+    stonewall = imp4.stonewall_flow(speed=speed)
+    for speed_value, surge_value, stonewall_value in zip(speed, surge, stonewall):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            curve = imp4.curve(speed=speed_value)
+        assert_allclose(surge_value.m, curve.flow_v.m.min())
+        assert_allclose(stonewall_value.m, curve.flow_v.m.max())
+
+    flow_v = [1.0, 1.2, 1.3, 1.5]
+    speed = Q_(900, "rad/s")
+    surge_value = imp4.surge_flow(speed=speed).m
+    assert_allclose(
+        imp4.surge_margin(flow_v=flow_v, speed=speed).m,
+        (np.array(flow_v) - surge_value) / flow_v,
+    )
+    assert list(imp4.classify(flow_v=flow_v, speed=speed)) == [
+        "surge",
+        "surge_margin",
+        "inside",
+        "choke",
+    ]
+    assert list(imp4.classify(flow_v=flow_v, speed=speed, surge_margin=0.0)) == [
+        "surge",
+        "inside",
+        "inside",
+        "choke",
+    ]
+
+    flow_m = np.array(flow_v) / imp4.points[0].suc.v().m
+    assert list(imp4.classify(flow_m=flow_m, speed=speed)) == list(
+        imp4.classify(flow_v=flow_v, speed=speed)
+    )
+
+
+def test_impeller_operating_points(imp4):
+    flow_v = np.linspace(0, 2, 41)
+    system_head = [
+        60000 + 20000 * flow_v**2,
+        50000 + 25000 * flow_v**2,
+        1e6 + 0 * flow_v,
+    ]
+    speed = Q_([900, 1000, 900], "rad/s")
+    df = imp4.operating_points(
+        speed=speed, system_flow_v=flow_v, system_head=system_head
+    )
+    assert list(df.system_curve) == [0, 1, 2]
+    assert list(df.found) == [True, True, False]
+    assert np.isnan(df.flow_v[2])
+    for row in df[df.found].itertuples():
+        assert_allclose(
+            row.head, np.interp(row.flow_v, flow_v, system_head[row.system_curve])
+        )
+        expected = imp4.point(flow_v=row.flow_v, speed=row.speed)
+        assert_allclose(row.head, expected.head.m)
+        assert_allclose(row.disch_p, expected.disch.p().m, rtol=1e-6)
+
+    # discharge pressure system curve through a known point
+    p_disch = imp4.point(flow_v=1.25, speed=900).disch.p()
+    df = imp4.operating_points(
+        speed=900, system_flow_v=[1.0, 1.5], system_p_disch=[p_disch, p_disch]
+    )
+    assert_allclose(df.flow_v[0], 1.25, rtol=1e-3)
+
+
+def test_conversion_single_pool(imp4):
+    new_suc = ccp.State(
+        p=Q_(2.0, "bar"),
+        T=Q_(300, "K"),
+        fluid=dict(CarbonDioxide=0.8, Nitrogen=0.2),
+    )
+    new_imp4 = Impeller.convert_from(imp4, suc=new_suc)
+
+    expected_points = []
+    for curve in imp4.curves:
+        converted = [Point.convert_from(p, suc=new_suc, find="speed") for p in curve]
+        speed_mean = np.mean([p.speed.m for p in converted])
+        expected_points += [
+            Point.convert_from(p, suc=new_suc, find="volume_ratio", speed=speed_mean)
+            for p in converted
+        ]
+    expected = Impeller(expected_points)
+    assert_allclose(
+        [c.speed.m for c in new_imp4.curves],
+        [c.speed.m for c in expected.curves],
+        rtol=1e-4,
+    )
+
+    # discharge solves start from the neighbouring point (Point.convert_many),
+    # so the results agree within the solver tolerance
+    for point, expected_point in zip(new_imp4.points, expected.points):
+        for attr in ["speed", "flow_v", "flow_m", "head", "eff", "power", "torque"]:
+            assert_allclose(
+                getattr(point, attr), getattr(expected_point, attr), rtol=1e-4
+            )
+        for attr in ["phi_ratio", "psi_ratio", "reynolds_ratio"]:
+            assert_allclose(
+                getattr(point, attr), getattr(expected_point, attr), rtol=1e-4
+            )
+        assert_allclose(point.mach_diff, expected_point.mach_diff, atol=1e-5)
+        assert_allclose(point.disch.p(), expected_point.disch.p(), rtol=1e-4)
+        assert_allclose(point.disch.T(), expected_point.disch.T(), rtol=1e-4)
+
+
+def test_conversion_cache(imp4, tmp_path):
+    new_suc = ccp.State(
+        p=Q_(2.0, "bar"),
+        T=Q_(300, "K"),
+        fluid=dict(CarbonDioxide=0.8, Nitrogen=0.2),
+    )
+    Impeller.conversion_cache.clear()
+    # disabled by default
+    assert Impeller.convert_from(imp4, suc=new_suc) is not Impeller.convert_from(
+        imp4, suc=new_suc
+    )
+    assert len(Impeller.conversion_cache) == 0
+
+    ccp.config.CONVERSION_CACHE_SIZE = 16
+    new_imp4 = Impeller.convert_from(imp4, suc=new_suc)
+    assert Impeller.convert_from(imp4, suc=deepcopy(new_suc)) is new_imp4
+    assert Impeller.conversion_cache.info()["hits"] == 1
+    assert Impeller.convert_from(imp4, suc=new_suc, speed=900) is not new_imp4
+    gas_suc = ccp.State(p=new_suc.p(), T=new_suc.T(), fluid=new_suc.fluid, phase="gas")
+    assert Impeller.convert_from(imp4, suc=gas_suc) is not new_imp4
+
+    ccp.config.CONVERSION_CACHE_DIR = tmp_path
+    Impeller.conversion_cache.clear()
+    Impeller.convert_from(imp4, suc=new_suc)
+    assert len(list(tmp_path.glob("conversion_*.toml"))) == 1
+    Impeller.conversion_cache.clear()
+    loaded = Impeller.convert_from(imp4, suc=new_suc)
+    assert "_lazy" in loaded.__dict__
+    assert_allclose(
+        [p.head.m for p in loaded.points], [p.head.m for p in new_imp4.points]
+    )
+
+    ccp.config.CONVERSION_CACHE_DIR = None
+    ccp.config.CONVERSION_CACHE_SIZE = 0
+    assert Impeller.convert_from(imp4, suc=new_suc) is not new_imp4
+
+
 def test_conversion(imp3):
     new_suc = ccp.State(p=Q_(2000, "kPa"), T=300, fluid={"co2": 1})
     new_imp3 = ccp.Impeller.convert_from(imp3, suc=new_suc)
@@ -473,6 +770,38 @@ def test_impeller_from_head_power(imp3):
     assert_allclose(imp.eff.m, imp3.eff.m)
 
 
+def test_load_from_dict_shared_pool(monkeypatch):
+    fluid = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    head_curves = {
+        "7640": {"x1": [1.0, 1.1, 1.2], "x2": [95000, 94000, 92000], "x3": 0},
+        "9550": {"x1": [1.3, 1.4, 1.5], "x2": [105000, 104000, 102000], "x3": 0},
+    }
+    eff_curves = {
+        "7640": {"x1": [1.0, 1.1, 1.2], "x2": [0.80, 0.81, 0.79], "x3": 0},
+        "9550": {"x1": [1.3, 1.4, 1.5], "x2": [0.79, 0.80, 0.78], "x3": 0},
+    }
+    kwargs = dict(suc=suc, b=0.0285, D=0.365, number_of_points=4)
+    imp = Impeller.load_from_dict(
+        head_curves=deepcopy(head_curves), eff_curves=deepcopy(eff_curves), **kwargs
+    )
+    assert len(imp.points) == 8
+
+    # a caller-provided pool is used for the points of all speed lines
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a new pool was created")
+
+    monkeypatch.setattr(ccp.impeller, "create_pool", no_pool)
+    with ccp.parallel.create_pool(parallel=False) as pool:
+        imp_pool = Impeller.load_from_dict(
+            head_curves=deepcopy(head_curves),
+            eff_curves=deepcopy(eff_curves),
+            pool=pool,
+            **kwargs,
+        )
+    assert imp_pool == imp
+
+
 @pytest.fixture(scope="module")
 def imp_example():
     return impeller_example()
@@ -588,6 +917,44 @@ def test_save_load(imp3, file_format):
     assert hash(imp_fd) == hash(imp_fd_loaded)
 
 
+def test_from_dict_lazy(imp4):
+    dict_parameters = imp4.to_dict()
+    # points without losses get losses scaled from the point with max losses
+    dict_parameters["points"]["point0"]["power_losses"] = "1000 watt"
+    imp = Impeller.from_dict(dict_parameters)
+    imp_lazy = Impeller.from_dict(dict_parameters, lazy=True)
+
+    for arrays_lazy, arrays in zip(imp_lazy._curve_arrays(), imp._curve_arrays()):
+        assert arrays_lazy.keys() == arrays.keys()
+        for key in arrays:
+            assert_allclose(arrays_lazy[key], arrays[key])
+
+    speed = Q_(900, "rad/s")
+    point_lazy = imp_lazy.point(flow_v=1.25, speed=speed)
+    point = imp.point(flow_v=1.25, speed=speed)
+    assert_allclose(point_lazy.head, point.head)
+    assert_allclose(point_lazy.power_shaft, point.power_shaft)
+    assert_allclose(imp_lazy.surge_margin(flow_v=1.25, speed=speed), 0.08)
+    assert "points" not in imp_lazy.__dict__
+
+    # points and curves are created when accessed
+    assert imp_lazy.points[0].suc == imp.points[0].suc
+    assert len(imp_lazy.curves) == 2
+    assert imp_lazy == imp
+
+
+def test_to_dict_full(imp4):
+    dict_parameters = imp4.to_dict(full=True)
+    assert dict_parameters["versions"] == ccp.data_io.serializers.versions()
+    assert all("versions" not in p for p in dict_parameters["points"].values())
+
+    imp = Impeller.from_dict(dict_parameters)
+    assert imp == imp4
+    for point, point_expected in zip(imp.points, imp4.points):
+        assert_allclose(point.power, point_expected.power)
+        assert_allclose(point.disch.T(), point_expected.disch.T())
+
+
 def test_load_legacy_flat_file(imp3):
     # files saved before the "points"/"version" structure store the point
     # dicts at the top level of the file
@@ -2,9 +2,11 @@ import pytest
 import ccp
 from numpy.testing import assert_allclose
 from ccp.point import *
+from ccp.point import _eff_kernel, _head_kernel, _head_pol_si, _n_exp_si
 from pathlib import Path
 from tempfile import tempdir
 import pickle
+import gc
 
 skip = False  # skip slow tests
 
@@ -399,6 +401,119 @@ def test_eff_isentropic(suc_0, disch_0):
     assert_allclose(eff_isentropic(suc_0, disch_0).m, 0.76996, rtol=1e-5)
 
 
+def test_si_kernels(suc_0, disch_0):
+    for method in [
+        "schultz",
+        "mallen_saville",
+        "sandberg_colby",
+        "sandberg_colby_f",
+        "huntington",
+    ]:
+        head = globals()[f"head_pol_{method}"](suc_0, disch_0)
+        eff = globals()[f"eff_pol_{method}"](suc_0, disch_0)
+        assert_allclose(_head_kernel(method)(suc_0, disch_0), head.to("J/kg").m)
+        assert_allclose(_eff_kernel(method)(suc_0, disch_0), eff.m)
+    assert_allclose(_n_exp_si(suc_0, disch_0), n_exp(suc_0, disch_0).m)
+    assert_allclose(_head_pol_si(suc_0, disch_0), head_pol(suc_0, disch_0).m)
+
+
+def test_disch_from_suc_head_eff_floats(suc_0, disch_0):
+    head = head_pol_sandberg_colby(suc_0, disch_0)
+    eff = eff_pol_sandberg_colby(suc_0, disch_0)
+    disch = disch_from_suc_head_eff(suc_0, head.m, eff.m)
+    assert_allclose(disch.p().m, disch_0.p().m, rtol=1e-4)
+    assert_allclose(disch.T().m, disch_0.T().m, rtol=1e-4)
+
+
+@pytest.mark.parametrize(
+    "method",
+    ["schultz", "mallen_saville", "sandberg_colby", "sandberg_colby_f", "huntington"],
+)
+def test_performance_arrays(suc_0, disch_0, method):
+    fluid = suc_0.fluid
+    suc = State.flash_batch(p=[suc_0.p().m] * 2, T=suc_0.T().m, fluid=fluid)
+    disch = State.flash_batch(
+        p=[disch_0.p().m, float("nan")], T=disch_0.T().m, fluid=fluid
+    )
+    results = performance_arrays(
+        suc, disch, fluid=fluid, flow_m=Q_(2, "kg/s"), polytropic_method=method
+    )
+
+    head = globals()[f"head_pol_{method}"](suc_0, disch_0)
+    eff = globals()[f"eff_pol_{method}"](suc_0, disch_0)
+    assert_allclose(results["head"][0].to("J/kg").m, head.to("J/kg").m, rtol=1e-6)
+    assert_allclose(results["eff"][0].m, eff.m, rtol=1e-6)
+    assert_allclose(results["n_exp"][0].m, n_exp(suc_0, disch_0).m, rtol=1e-6)
+    assert_allclose(
+        results["head_isentropic"][0].m, head_isentropic(suc_0, disch_0).m, rtol=1e-6
+    )
+    assert_allclose(results["power"][0].m, power_calc(2, head, eff).m, rtol=1e-6)
+    # failed rows propagate as nan
+    assert np.isnan(results["head"][1].m)
+
+
+def test_performance_arrays_zero_head(suc_0):
+    suc = State.flash_batch(p=suc_0.p().m, T=suc_0.T().m, fluid=suc_0.fluid)
+    results = performance_arrays(
+        suc, suc, flow_m=Q_(2, "kg/s"), polytropic_method="sandberg_colby"
+    )
+    assert_allclose(results["power"].m, 0.0)
+
+
+def test_point_solver_plans(suc_0, disch_0):
+    from ccp import point_solver
+
+    point_solver.clear_plans()
+    p0 = Point(suc=suc_0, disch=disch_0, flow_v=1, speed=1, b=1, D=1)
+    assert point_solver.plan_stats == {"hits": 0, "misses": 1, "fallbacks": 0}
+    p1 = Point(suc=suc_0, disch=disch_0, flow_v=1, speed=1, b=1, D=1)
+    assert point_solver.plan_stats == {"hits": 1, "misses": 1, "fallbacks": 0}
+    assert p0 == p1
+    assert_allclose(p1.power.m, p0.power.m)
+
+    stats = point_solver.relation_stats
+    assert stats["_head_from_states"]["fired"] == 2
+    assert stats["_disch_from_head_eff"]["fired"] == 0
+
+    # the replay calls each relation of the plan once and skips the others
+    calls = {k: v["calls"] for k, v in stats.items()}
+    Point(suc=suc_0, disch=disch_0, flow_v=1, speed=1, b=1, D=1)
+    assert stats["_head_from_states"]["calls"] == calls["_head_from_states"] + 1
+    assert stats["_disch_from_head_eff"]["calls"] == calls["_disch_from_head_eff"]
+
+
+def test_point_lazy_attributes(point_disch_flow_v_speed_suc):
+    point = point_disch_flow_v_speed_suc
+    # derived similarity values are calculated on first access
+    assert point._reynolds is None
+    assert point._mach is None
+    assert_allclose(
+        point.reynolds.m, reynolds(point.suc, point.speed, point.b, point.D).m
+    )
+    assert_allclose(point.mach.m, mach(point.suc, point.speed, point.D).m)
+    point.mach = Q_(0.5, "dimensionless")
+    assert point.mach.m == 0.5
+
+    # plot functions are created on access
+    assert callable(point.head_plot)
+    assert callable(point.disch.T_plot)
+    with pytest.raises(AttributeError):
+        point.speed_sound_plot
+
+    # state plots keep working after the point itself is released
+    disch = Point(
+        suc=point.suc,
+        speed=point.speed,
+        flow_v=point.flow_v,
+        head=point.head,
+        eff=point.eff,
+        b=point.b,
+        D=point.D,
+    ).disch
+    gc.collect()
+    assert callable(disch.T_plot)
+
+
 def test_reynolds(suc_0):
     re = reynolds(suc_0, speed=1, b=1, D=1)
     assert str(re.units) == "dimensionless"
@@ -692,6 +807,43 @@ def test_converted_from_find_volume_ratio_with_reynolds_correction_2022(
     )
 
 
+def test_convert_many(suc_1, point_eff_flow_v_head_speed_suc_1):
+    points = [
+        point_eff_flow_v_head_speed_suc_1,
+        Point(
+            suc=suc_1,
+            flow_v=Q_(7000, "m**3/h"),
+            speed=Q_(11145, "RPM"),
+            head=Q_(170, "kJ/kg"),
+            eff=0.82,
+            b=Q_(28.5, "mm"),
+            D=Q_(365, "mm"),
+        ),
+    ]
+    suc_2 = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15})
+
+    for kwargs in [
+        dict(find="speed"),
+        dict(find="volume_ratio", speed=Q_(11000, "RPM")),
+        dict(find="volume_ratio", reynolds_correction="ptc2022"),
+    ]:
+        converted_points = Point.convert_many(points, suc=suc_2, **kwargs)
+        for point, converted_point in zip(points, converted_points):
+            expected = Point.convert_from(point, suc=suc_2, **kwargs)
+            for attr in ["speed", "flow_v", "head", "eff", "power", "volume_ratio"]:
+                assert_allclose(
+                    getattr(converted_point, attr).m,
+                    getattr(expected, attr).m,
+                    rtol=1e-4,
+                )
+            for attr in ["reynolds", "mach", "phi_ratio", "reynolds_ratio"]:
+                assert_allclose(
+                    getattr(converted_point, attr).m,
+                    getattr(expected, attr).m,
+                    rtol=1e-4,
+                )
+
+
 def test_converted_from_find_volume_ratio_mach_plot(point_eff_flow_v_head_speed_suc_1):
     suc_2 = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15})
     point_converted_from_find_volume_ratio = Point.convert_from(
@@ -726,6 +878,29 @@ def test_save_load(point_disch_flow_v_speed_suc, file_format):
     assert point_disch_flow_v_speed_suc == point_0_loaded
 
 
+@pytest.mark.parametrize("file_format", ["toml", "json"])
+def test_save_load_full(point_disch_flow_v_speed_suc, file_format):
+    point = point_disch_flow_v_speed_suc
+    file = Path(tempdir) / f"suc_0_full.{file_format}"
+    point.save(file, full=True)
+
+    ccp.point_solver.clear_plans()
+    point_loaded = Point.load(file)
+    # the point is recreated from the stored values, without solving it
+    relation_stats = ccp.point_solver.relation_stats.values()
+    assert sum(stats["fired"] for stats in relation_stats) == 0
+    assert point_loaded == point
+    for attr in ["power", "torque", "phi", "psi", "volume_ratio", "reynolds", "mach"]:
+        assert_allclose(getattr(point_loaded, attr), getattr(point, attr))
+    assert_allclose(point_loaded.disch.h(), point.disch.h())
+
+    # stored values from other library versions are recalculated
+    point_dict = point.to_dict(full=True)
+    point_dict["versions"]["ccp"] = "0.0.0"
+    point_dict["derived"]["power"] = "0 W"
+    assert_allclose(Point.from_dict(point_dict).power, point.power)
+
+
 def test_save_load_unsupported_format(point_disch_flow_v_speed_suc):
     with pytest.raises(ValueError, match="Unsupported file format"):
         point_disch_flow_v_speed_suc.save(Path(tempdir) / "suc_0.yaml")
@@ -252,6 +252,168 @@ def test_T_s_inputs():
     assert_allclose(state.rho().magnitude, 0.9280595769591103, rtol=1e-5)
 
 
+def test_flash_batch():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    p = Q_([1, 2, float("nan"), 5], "bar")
+    T = Q_([300, 310, 320, 330], "degK")
+    results = State.flash_batch(p=p, T=T, fluid=fluid)
+
+    assert set(results) == {
+        "p",
+        "T",
+        "h",
+        "s",
+        "rho",
+        "z",
+        "cp",
+        "speed_sound",
+        "viscosity",
+    }
+    assert results["rho"].units == "kilogram / meter ** 3"
+    # failed rows are returned as nan instead of raising
+    assert np.isnan(results["rho"][2].m)
+    for i in [0, 1, 3]:
+        state = State(p=p[i], T=T[i], fluid=fluid)
+        assert_allclose(results["h"][i].m, state.h().m)
+        assert_allclose(results["s"][i].m, state.s().m)
+        assert_allclose(results["rho"][i].m, state.rho().m)
+        assert_allclose(results["z"][i].m, state.z().m)
+        assert_allclose(results["cp"][i].m, state.cp().m)
+        assert_allclose(results["speed_sound"][i].m, state.speed_sound().m)
+        assert_allclose(results["viscosity"][i].m, state.viscosity().m)
+
+    # p-s inputs, broadcast scalar and subset of properties
+    results_ps = State.flash_batch(
+        p=p[[0, 1, 3]], s=results["s"][0], fluid=fluid, properties=["rho"]
+    )
+    assert set(results_ps) == {"p", "T", "rho"}
+    state = State(p=p[3], s=results["s"][0], fluid=fluid)
+    assert_allclose(results_ps["T"][0].m, 300, rtol=1e-6)
+    assert_allclose(results_ps["rho"][2].m, state.rho().m, rtol=1e-6)
+
+    with pytest.raises(KeyError):
+        State.flash_batch(p=p, fluid=fluid)
+
+
+def test_flash_batch_raw_si():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    ccp.config.RAW_SI = True
+    results = State.flash_batch(
+        p=Q_([1, 2], "bar"), T=[300, 310], fluid=fluid, properties=["h"]
+    )
+    assert isinstance(results["h"], np.ndarray)
+    assert_allclose(results["p"], [1e5, 2e5])
+    state = State(p=Q_(2, "bar"), T=310, fluid=fluid)
+    assert_allclose(results["h"][1], state.h().m)
+
+
+def test_flash_cache():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    ccp.config.FLASH_CACHE = True
+    State.flash_cache.clear()
+
+    state = State(p=100000, T=300, fluid=fluid)
+    assert State.flash_cache.info()["misses"] == 1
+    # same inputs within the rounding tolerance hit the cache
+    state1 = State(p=100000 * (1 + 1e-12), T=300, fluid=fluid)
+    assert State.flash_cache.info()["hits"] == 1
+    assert_allclose(state1.rho().m, state.rho().m, rtol=1e-12)
+    assert_allclose(state1.h().m, state.h().m, rtol=1e-12)
+    # different composition, inputs or phase are different entries
+    State(p=100000, T=300, fluid={"Methane": 0.4, "Ethane": 0.6})
+    State(p=100000, T=310, fluid=fluid)
+    State(p=100000, T=300, fluid=fluid, phase="gas")
+    assert State.flash_cache.info()["misses"] == 4
+
+    ccp.config.FLASH_CACHE_SIZE = 2
+    State(p=200000, T=300, fluid=fluid)
+    info = State.flash_cache.info()
+    assert info["size"] == 2
+    assert info["evictions"] == 3
+
+    ccp.config.FLASH_CACHE = False
+    State(p=200000, T=300, fluid=fluid)
+    assert State.flash_cache.info()["hits"] == 1
+    State.flash_cache.clear()
+
+
+def test_mixture_cache():
+    State.mixture_cache.clear()
+    fluid = {"methane": 0.8, "ethane": 0.1, "propane": 0.09}
+    state = State(p=100000, T=300, fluid=fluid)
+    state1 = State(p=200000, T=300, fluid=fluid)
+    assert State.mixture_cache.info()["misses"] == 1
+    assert State.mixture_cache.info()["hits"] == 1
+    assert state.fluid == state1.fluid
+    assert_allclose(sum(state.fluid.values()), 1)
+    # the cached template is not shared with the state
+    state.fluid["METHANE"] = 0
+    assert State(p=100000, T=300, fluid=fluid).fluid["METHANE"] > 0
+
+
+def test_ph_ps_newton():
+    fluid = {"Methane": 0.5, "Ethane": 0.5}
+    target = State(p=300000, T=400, fluid=fluid)
+    State.solver_stats.update(calls=0, iterations=0)
+
+    state = State(p=100000, T=300, fluid=fluid)
+    state.update(p=target.p(), s=target.s())
+    assert_allclose(state.T().m, 400, rtol=1e-9)
+    state.update(p=100000, T=300)
+    state.update(p=target.p(), h=target.h())
+    assert_allclose(state.T().m, 400, rtol=1e-9)
+
+    assert State.solver_stats["calls"] == 2
+    assert State.solver_stats["iterations"] <= 10
+
+
+def test_ph_newton_collapsed_bracket(monkeypatch):
+    # enthalpy with a jump at 350 K: the bisection collapses on the jump
+    # without matching h, which must not be accepted as converged
+    state = State(p=100000, T=300, fluid={"Methane": 1})
+    monkeypatch.setattr(State, "cpmass", lambda self: 1000.0)
+    monkeypatch.setattr(
+        State,
+        "hmass",
+        lambda self: 1000.0 * CP.AbstractState.T(self)
+        + (1e5 if CP.AbstractState.T(self) > 350 else 0.0),
+    )
+    with pytest.raises(ValueError, match="Could not find T"):
+        state._solve_T_at_p(100000, h=1000.0 * 350 + 5e4)
+
+
+def test_phase_hints(tmp_path):
+    fluid = {"methane": 0.58976, "co2": 0.36605, "ethane": 0.03099}
+    ccp.config.PHASE_ENVELOPE_DIR = tmp_path
+    State.envelope_cache.clear()
+
+    # off by default: no envelope is built
+    assert ccp.config.PHASE_HINTS is False
+    state = State(p=1e6, T=300, fluid=fluid)
+    assert len(State.envelope_cache) == 0
+
+    ccp.config.PHASE_HINTS = True
+    state_hint = State(p=1e6, T=300, fluid=fluid)
+    assert_allclose(state_hint.rho().m, state.rho().m, rtol=1e-10)
+    assert_allclose(state_hint.h().m, state.h().m, rtol=1e-10)
+
+    assert state_hint._phase_hint(1e6, 300) == CP.iphase_gas
+    assert state_hint._phase_hint(2e7, 400) == CP.iphase_supercritical_gas
+    # close to or inside the envelope: no hint
+    assert state_hint._phase_hint(1e6, 150) is None
+    # the imposed phase is removed after the update
+    assert state_hint.phase is None
+    assert len(list(tmp_path.glob("envelope_*.json"))) == 1
+
+    # envelope read from disk when the memory cache is empty
+    State.envelope_cache.clear()
+    assert state_hint._phase_envelope() is not None
+    assert State.envelope_cache.info()["misses"] == 1
+
+    # pure fluids have no envelope
+    assert State(p=1e5, T=300, fluid={"methane": 1})._phase_envelope() is None
+
+
 def test_equality():
     state = State(p=100000, T=300, fluid={"Methane": 1 - 1e-15, "Ethane": 1e-15})
     state1 = State(p=state.p(), T=state.T(), fluid=state.fluid)
@@ -318,6 +480,25 @@ def test_pickle():
     assert pickle.loads(pickle.dumps(state)) == state
 
 
+def test_pickle_without_flash(monkeypatch):
+    state = State(p=100000, h=755784.0, fluid={"Methane": 0.5, "Ethane": 0.5})
+    data = pickle.dumps(state)
+
+    def no_flash(*args, **kwargs):
+        raise AssertionError("flash called while unpickling")
+
+    monkeypatch.setattr(State, "update", no_flash)
+    monkeypatch.setattr(State, "_call_REFPROP", no_flash)
+    state1 = pickle.loads(data)
+
+    assert state1 == state
+    assert state1.init_args["h"] is not None
+    assert state1.init_args["T"] is None
+    assert_allclose(state1.h().m, state.h().m)
+    assert_allclose(state1.s().m, state.s().m)
+    assert_allclose(state1.rho().m, state.rho().m)
+
+
 def test_copy_preserves_phase_and_eos():
     # forced phase (and EOS) must survive copy/deepcopy/pickle so that it
     # propagates through Point and Impeller (which deepcopy/pickle their states).
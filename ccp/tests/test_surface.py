@@ -0,0 +1,69 @@
+"""Tests for the smooth map surface (``ccp.ImpellerSurface``)."""
+
+import pytest
+from numpy.testing import assert_allclose
+
+from ccp import Q_, Impeller, ImpellerSurface, Point, State
+
+
+@pytest.fixture(scope="module")
+def imp():
+    # two straight speed lines, for which the surface is exact
+    fluid = dict(CarbonDioxide=0.76064, Nitrogen=0.23581, Oxygen=0.00284)
+    suc = State(p=Q_(1.839, "bar"), T=291.5, fluid=fluid)
+    points = [
+        Point(
+            suc=suc,
+            disch=State(p=Q_(p, "bar"), T=T, fluid=fluid),
+            flow_v=flow_v,
+            speed=speed,
+            b=0.0285,
+            D=0.365,
+        )
+        for speed, flow_v, p, T in [
+            (800, 1.0, 5.902, 405.7),
+            (800, 1.2, 5.7, 405.0),
+            (1000, 1.3, 7.6, 430.0),
+            (1000, 1.5, 7.3, 431.0),
+        ]
+    ]
+    return Impeller(points)
+
+
+def test_surface_speed_lines(imp):
+    surface = ImpellerSurface(imp)
+    for curve in imp.curves:
+        assert_allclose(surface.head(curve.flow_v, curve.speed).m, curve.head.m)
+        assert_allclose(surface.eff(curve.flow_v, curve.speed).m, curve.eff.m)
+
+    curve = imp.curve(Q_(900, "rad/s"))
+    assert_allclose(surface.head(curve.flow_v, 900).m, curve.head.m)
+    assert_allclose(surface.eff(curve.flow_v, 900).m, curve.eff.m)
+    assert_allclose(surface.surge_flow(900).m, curve.flow_v.m[0])
+    assert_allclose(surface.stonewall_flow(900).m, curve.flow_v.m[-1])
+
+
+def test_surface_fan_law(imp):
+    surface = ImpellerSurface(imp)
+    assert_allclose(
+        surface.head(Q_(1.2 * 1.5, "m³/s"), 1200).m,
+        surface.head(Q_(1.5, "m³/s"), 1000).m * 1.2**2,
+    )
+    assert_allclose(
+        surface.eff(Q_(1.2 * 1.5, "m³/s"), 1200).m,
+        surface.eff(Q_(1.5, "m³/s"), 1000).m,
+    )
+    assert_allclose(surface.surge_flow(400).m, 0.5 * surface.surge_flow(800).m)
+
+
+def test_surface_backend(imp):
+    surface = imp.fit_surface()
+    try:
+        p0 = imp.point(flow_v=1.25, speed=900)
+        assert_allclose(p0.head.m, surface.head(1.25, 900).m)
+        assert_allclose(imp.curve(900).head.m, surface.head([1.15, 1.35], 900).m)
+        df = imp.point_batch(flow_v=[1.25], speed=900)
+        assert_allclose(df["head"], p0.head.m)
+    finally:
+        imp.surface = None
+    assert len(imp.curve_cache) == 0
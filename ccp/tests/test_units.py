@@ -263,6 +263,26 @@ def test_unit_Q_conversion(auxiliary_function):
         assert_allclose(actual, arguments[arg].expected_converted_value)
 
 
+def test_check_units_plan():
+    @check_units
+    def func(p, flow_v, p_units=None):
+        return p, flow_v, p_units
+
+    p = Q_(1, "pascal")
+    flow_v = Q_([1, 2], "m³/h")
+    p_result, flow_v_result, p_units = func(p, flow_v, p_units="bar")
+    # quantities already in the default unit are passed through
+    assert p_result is p
+    assert p_units == "bar"
+    assert_allclose(flow_v_result.m, [1 / 3600, 2 / 3600])
+    assert str(flow_v_result.units) == "meter ** 3 / second"
+
+    # lists of quantities are converted to a single array quantity
+    p_result, _, _ = func([Q_(1, "bar"), Q_(200, "kPa")], None)
+    assert_allclose(p_result.m, [1e5, 2e5])
+    assert str(p_result.units) == "pascal"
+
+
 # Water column pressure unit tests (for pint compatibility)
 # These tests ensure backward compatibility across pint versions (< 0.24 and >= 0.24)
 # See: https://github.com/hgrecco/pint/issues/2186